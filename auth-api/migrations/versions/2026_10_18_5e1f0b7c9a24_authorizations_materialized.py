@@ -0,0 +1,226 @@
+"""Incrementally maintained authorizations table replacing the authorizations_view join.
+
+Revision ID: 5e1f0b7c9a24
+Revises: bff7f0c3bac4
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from auth_api.utils.custom_sql import CustomSql
+
+# revision identifiers, used by Alembic.
+revision = '5e1f0b7c9a24'
+down_revision = 'bff7f0c3bac4'
+branch_labels = None
+depends_on = None
+
+# Same joins as authorizations_view, plus the ids of the source rows so changes can be applied row by row.
+# p_org_id NULL rebuilds everything; a membership, affiliation or product subscription id narrows the refresh
+# to the rows derived from it (and the NULL placeholder rows the LEFT JOINs produce when an org has none).
+authorizations_refresh = CustomSql(
+    'authorizations_refresh',
+    """
+    CREATE OR REPLACE FUNCTION authorizations_refresh(
+        p_org_id integer,
+        p_membership_id integer DEFAULT NULL,
+        p_affiliation_id integer DEFAULT NULL,
+        p_product_subscription_id integer DEFAULT NULL
+    ) RETURNS void AS $$
+    BEGIN
+        IF p_membership_id IS NOT NULL THEN
+            DELETE FROM authorizations_materialized WHERE membership_id = p_membership_id;
+        ELSIF p_affiliation_id IS NOT NULL THEN
+            DELETE FROM authorizations_materialized
+             WHERE org_id = p_org_id AND (affiliation_id = p_affiliation_id OR affiliation_id IS NULL);
+        ELSIF p_product_subscription_id IS NOT NULL THEN
+            DELETE FROM authorizations_materialized
+             WHERE org_id = p_org_id
+               AND (product_subscription_id = p_product_subscription_id OR product_subscription_id IS NULL);
+        ELSIF p_org_id IS NOT NULL THEN
+            DELETE FROM authorizations_materialized WHERE org_id = p_org_id;
+        ELSE
+            DELETE FROM authorizations_materialized;
+        END IF;
+
+        INSERT INTO authorizations_materialized (
+            business_identifier, entity_name, folio_number, corp_type_code, org_membership, keycloak_guid,
+            user_id, org_id, org_name, status_code, org_type, product_code, bcol_user_id, bcol_account_id,
+            membership_id, affiliation_id, entity_id, product_subscription_id
+        )
+        SELECT e.business_identifier, e.name, e.folio_number, e.corp_type_code, m.membership_type_code,
+               u.keycloak_guid, u.id, o.id, o.name, o.status_code, o.type_code, ps.product_code, o.bcol_user_id,
+               o.bcol_account_id, m.id, a.id, e.id, ps.id
+          FROM memberships m
+          LEFT JOIN orgs o ON m.org_id = o.id
+          LEFT JOIN users u ON u.id = m.user_id
+          LEFT JOIN affiliations a ON o.id = a.org_id
+          LEFT JOIN entities e ON e.id = a.entity_id
+          LEFT JOIN product_subscriptions ps ON ps.org_id = o.id AND ps.status_code = 'ACTIVE'
+         WHERE m.status = 1
+           AND (p_org_id IS NULL OR m.org_id = p_org_id)
+           AND (p_membership_id IS NULL OR m.id = p_membership_id)
+           AND (p_affiliation_id IS NULL OR a.id = p_affiliation_id OR a.id IS NULL)
+           AND (p_product_subscription_id IS NULL OR ps.id = p_product_subscription_id OR ps.id IS NULL);
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+)
+
+# Each trigger has a function of the same name that keeps authorizations_materialized in step with its table.
+trigger_functions = [
+    CustomSql(
+        'authorizations_memberships_changed',
+        """
+        CREATE OR REPLACE FUNCTION authorizations_memberships_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM authorizations_refresh(NULL, OLD.id);
+            ELSE
+                PERFORM authorizations_refresh(NULL, NEW.id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'authorizations_affiliations_changed',
+        """
+        CREATE OR REPLACE FUNCTION authorizations_affiliations_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM authorizations_refresh(OLD.org_id, NULL, OLD.id);
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.org_id IS DISTINCT FROM OLD.org_id) THEN
+                PERFORM authorizations_refresh(NEW.org_id, NULL, NEW.id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'authorizations_product_subscriptions_changed',
+        """
+        CREATE OR REPLACE FUNCTION authorizations_product_subscriptions_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM authorizations_refresh(OLD.org_id, NULL, NULL, OLD.id);
+            END IF;
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.org_id IS DISTINCT FROM OLD.org_id) THEN
+                PERFORM authorizations_refresh(NEW.org_id, NULL, NULL, NEW.id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'authorizations_orgs_changed',
+        """
+        CREATE OR REPLACE FUNCTION authorizations_orgs_changed() RETURNS trigger AS $$
+        BEGIN
+            UPDATE authorizations_materialized
+               SET org_name = NEW.name, status_code = NEW.status_code, org_type = NEW.type_code,
+                   bcol_user_id = NEW.bcol_user_id, bcol_account_id = NEW.bcol_account_id
+             WHERE org_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'authorizations_entities_changed',
+        """
+        CREATE OR REPLACE FUNCTION authorizations_entities_changed() RETURNS trigger AS $$
+        BEGIN
+            UPDATE authorizations_materialized
+               SET business_identifier = NEW.business_identifier, entity_name = NEW.name,
+                   folio_number = NEW.folio_number, corp_type_code = NEW.corp_type_code
+             WHERE entity_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'authorizations_users_changed',
+        """
+        CREATE OR REPLACE FUNCTION authorizations_users_changed() RETURNS trigger AS $$
+        BEGIN
+            UPDATE authorizations_materialized SET keycloak_guid = NEW.keycloak_guid WHERE user_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+]
+
+TRIGGERS = {
+    'authorizations_memberships_changed': (
+        'memberships', 'INSERT OR DELETE OR UPDATE OF org_id, user_id, membership_type_code, status'
+    ),
+    'authorizations_affiliations_changed': ('affiliations', 'INSERT OR DELETE OR UPDATE OF org_id, entity_id'),
+    'authorizations_product_subscriptions_changed': (
+        'product_subscriptions', 'INSERT OR DELETE OR UPDATE OF org_id, product_code, status_code'
+    ),
+    'authorizations_orgs_changed': ('orgs', 'UPDATE OF name, status_code, type_code, bcol_user_id, bcol_account_id'),
+    'authorizations_entities_changed': ('entities', 'UPDATE OF business_identifier, name, folio_number, corp_type_code'),
+    'authorizations_users_changed': ('users', 'UPDATE OF keycloak_guid'),
+}
+
+
+def upgrade():
+    op.create_table('authorizations_materialized',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('business_identifier', sa.String(length=75), nullable=True),
+    sa.Column('entity_name', sa.String(length=250), nullable=True),
+    sa.Column('folio_number', sa.String(length=50), nullable=True),
+    sa.Column('corp_type_code', sa.String(length=15), nullable=True),
+    sa.Column('org_membership', sa.String(length=25), nullable=True),
+    sa.Column('keycloak_guid', postgresql.UUID(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('org_id', sa.Integer(), nullable=True),
+    sa.Column('org_name', sa.String(length=250), nullable=True),
+    sa.Column('status_code', sa.String(length=25), nullable=True),
+    sa.Column('org_type', sa.String(length=25), nullable=True),
+    sa.Column('product_code', sa.String(length=75), nullable=True),
+    sa.Column('bcol_user_id', sa.String(length=20), nullable=True),
+    sa.Column('bcol_account_id', sa.String(length=20), nullable=True),
+    sa.Column('membership_id', sa.Integer(), nullable=True),
+    sa.Column('affiliation_id', sa.Integer(), nullable=True),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('product_subscription_id', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('authorizations_materialized', schema=None) as batch_op:
+        # One index per Authorization.find_* lookup.
+        batch_op.create_index('ix_authorizations_guid_business_org', ['keycloak_guid', 'business_identifier', 'org_id'])
+        batch_op.create_index('ix_authorizations_business_org', ['business_identifier', 'org_id'])
+        batch_op.create_index('ix_authorizations_product_business', ['product_code', 'business_identifier'])
+        batch_op.create_index('ix_authorizations_guid_org_product', ['keycloak_guid', 'org_id', 'product_code'])
+        batch_op.create_index('ix_authorizations_org_membership_product', ['org_id', 'org_membership', 'product_code'])
+        # Used by the maintenance triggers.
+        batch_op.create_index('ix_authorizations_membership_id', ['membership_id'])
+        batch_op.create_index('ix_authorizations_affiliation_id', ['affiliation_id'])
+        batch_op.create_index('ix_authorizations_entity_id', ['entity_id'])
+        batch_op.create_index('ix_authorizations_product_subscription_id', ['product_subscription_id'])
+        batch_op.create_index('ix_authorizations_user_id', ['user_id'])
+
+    op.execute(authorizations_refresh.sql)
+    for function in trigger_functions:
+        op.execute(function.sql)
+    for trigger, (table, events) in TRIGGERS.items():
+        op.execute(f'CREATE TRIGGER {trigger} AFTER {events} ON {table} FOR EACH ROW EXECUTE FUNCTION {trigger}()')
+    op.execute('SELECT authorizations_refresh(NULL)')
+
+
+def downgrade():
+    for trigger, (table, _) in TRIGGERS.items():
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger} ON {table}')
+        op.execute(f'DROP FUNCTION IF EXISTS {trigger}()')
+    op.execute('DROP FUNCTION IF EXISTS authorizations_refresh(integer, integer, integer, integer)')
+    op.drop_table('authorizations_materialized')
@@ -0,0 +1,251 @@
+"""Per org affiliation rollup replacing the entity_mapping CTE on every affiliations page.
+
+Revision ID: 7c3d9e5a1b42
+Revises: 5e1f0b7c9a24
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from auth_api.utils.custom_sql import CustomSql
+
+# revision identifiers, used by Alembic.
+revision = '7c3d9e5a1b42'
+down_revision = '5e1f0b7c9a24'
+branch_labels = None
+depends_on = None
+
+# The dashboard rows of one org, as EntityMappingService.paginate_from_affiliations used to compute them per request:
+# a business shows over its TEMP and NR, TEMP + NR in the same org are one row, and each row is dated by its most
+# recent affiliation. p_org_id NULL rebuilds every org. The advisory lock keeps concurrent refreshes of one org from
+# inserting the rows twice.
+org_affiliation_rollup_refresh = CustomSql(
+    'org_affiliation_rollup_refresh',
+    """
+    CREATE OR REPLACE FUNCTION org_affiliation_rollup_refresh(p_org_id integer) RETURNS void AS $$
+    DECLARE
+        r record;
+    BEGIN
+        IF p_org_id IS NULL THEN
+            DELETE FROM org_affiliation_rollups;
+            FOR r IN SELECT DISTINCT org_id FROM affiliations WHERE org_id IS NOT NULL LOOP
+                PERFORM org_affiliation_rollup_refresh(r.org_id);
+            END LOOP;
+            RETURN;
+        END IF;
+
+        PERFORM pg_advisory_xact_lock(hashtext('org_affiliation_rollups'), p_org_id);
+        DELETE FROM org_affiliation_rollups WHERE org_id = p_org_id;
+
+        INSERT INTO org_affiliation_rollups (org_id, identifiers, created_on)
+        WITH affiliated AS (
+            SELECT e.business_identifier
+              FROM affiliations a
+              JOIN entities e ON e.id = a.entity_id
+             WHERE a.org_id = p_org_id
+        ),
+        filtered_mappings AS (
+            SELECT em.*,
+                   em.business_identifier IN (SELECT business_identifier FROM affiliated) AS business_in_org,
+                   em.bootstrap_identifier IN (SELECT business_identifier FROM affiliated) AS bootstrap_in_org,
+                   em.nr_identifier IN (SELECT business_identifier FROM affiliated) AS nr_in_org
+              FROM entity_mapping em
+             WHERE (em.business_identifier IN (SELECT business_identifier FROM affiliated)
+                    OR em.bootstrap_identifier IN (SELECT business_identifier FROM affiliated)
+                    OR em.nr_identifier IN (SELECT business_identifier FROM affiliated))
+               AND (em.business_identifier IS NULL
+                    OR em.business_identifier IN (SELECT business_identifier FROM affiliated))
+        ),
+        paired_nrs AS (
+            SELECT nr_identifier FROM filtered_mappings WHERE bootstrap_in_org AND nr_in_org
+        ),
+        complete_mappings AS (
+            SELECT fm.nr_identifier
+              FROM filtered_mappings fm
+              JOIN entities e ON e.business_identifier = fm.business_identifier
+              JOIN affiliations a ON a.entity_id = e.id
+             WHERE fm.bootstrap_identifier IS NOT NULL
+               AND fm.nr_identifier IS NOT NULL
+               AND a.org_id = p_org_id
+        ),
+        mapped AS (
+            SELECT CASE
+                       WHEN fm.business_in_org THEN ARRAY[fm.business_identifier]
+                       WHEN fm.bootstrap_in_org AND fm.nr_in_org THEN ARRAY[fm.bootstrap_identifier, fm.nr_identifier]
+                       WHEN fm.bootstrap_in_org THEN ARRAY[fm.bootstrap_identifier]
+                       WHEN fm.nr_in_org
+                            AND (fm.bootstrap_identifier IS NULL OR NOT fm.bootstrap_in_org)
+                            AND fm.nr_identifier NOT IN (SELECT nr_identifier FROM paired_nrs)
+                           THEN ARRAY[fm.nr_identifier]
+                       ELSE ARRAY[]::varchar[]
+                   END AS identifiers,
+                   a.created
+              FROM filtered_mappings fm
+              JOIN entities e ON e.business_identifier IN (fm.business_identifier, fm.bootstrap_identifier,
+                                                           fm.nr_identifier)
+              JOIN affiliations a ON a.entity_id = e.id
+             WHERE a.org_id = p_org_id
+               AND (fm.business_identifier IS NOT NULL
+                    OR fm.nr_identifier IS NULL
+                    OR fm.nr_identifier NOT IN (SELECT nr_identifier FROM complete_mappings))
+        )
+        SELECT p_org_id, identifiers, max(created)
+          FROM mapped
+         WHERE identifiers <> ARRAY[]::varchar[]
+         GROUP BY identifiers;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+)
+
+# The triggers run once per statement, so a statement touching many rows refreshes each of its orgs once. Their
+# functions read the statement's rows from the new_rows and old_rows transition tables. For updates, only rows whose
+# relevant columns changed are kept: the rows in new_rows but not in old_rows, and the other way round. Postgres
+# only allows transition tables on single-event triggers without column lists, so there is a trigger per event.
+trigger_functions = [
+    CustomSql(
+        'org_affiliation_rollups_affiliations_changed',
+        """
+        CREATE OR REPLACE FUNCTION org_affiliation_rollups_affiliations_changed() RETURNS trigger AS $$
+        DECLARE
+            org_ids integer[];
+            v_org_id integer;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                org_ids := ARRAY(SELECT DISTINCT org_id FROM new_rows WHERE org_id IS NOT NULL ORDER BY org_id);
+            ELSIF TG_OP = 'DELETE' THEN
+                org_ids := ARRAY(SELECT DISTINCT org_id FROM old_rows WHERE org_id IS NOT NULL ORDER BY org_id);
+            ELSE
+                org_ids := ARRAY(
+                    SELECT DISTINCT org_id
+                      FROM ((SELECT org_id, entity_id, created FROM new_rows
+                             EXCEPT ALL SELECT org_id, entity_id, created FROM old_rows)
+                            UNION ALL
+                            (SELECT org_id, entity_id, created FROM old_rows
+                             EXCEPT ALL SELECT org_id, entity_id, created FROM new_rows)) AS changed
+                     WHERE org_id IS NOT NULL
+                     ORDER BY org_id
+                );
+            END IF;
+            FOREACH v_org_id IN ARRAY org_ids LOOP
+                PERFORM org_affiliation_rollup_refresh(v_org_id);
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'org_affiliation_rollups_entity_mapping_changed',
+        """
+        CREATE OR REPLACE FUNCTION org_affiliation_rollups_entity_mapping_changed() RETURNS trigger AS $$
+        DECLARE
+            identifiers varchar[];
+            org_ids integer[];
+            v_org_id integer;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                identifiers := ARRAY(
+                    SELECT unnest(ARRAY[business_identifier, bootstrap_identifier, nr_identifier]) FROM new_rows
+                );
+            ELSIF TG_OP = 'DELETE' THEN
+                identifiers := ARRAY(
+                    SELECT unnest(ARRAY[business_identifier, bootstrap_identifier, nr_identifier]) FROM old_rows
+                );
+            ELSE
+                identifiers := ARRAY(
+                    SELECT unnest(ARRAY[business_identifier, bootstrap_identifier, nr_identifier])
+                      FROM ((SELECT business_identifier, bootstrap_identifier, nr_identifier FROM new_rows
+                             EXCEPT ALL SELECT business_identifier, bootstrap_identifier, nr_identifier FROM old_rows)
+                            UNION ALL
+                            (SELECT business_identifier, bootstrap_identifier, nr_identifier FROM old_rows
+                             EXCEPT ALL SELECT business_identifier, bootstrap_identifier, nr_identifier FROM new_rows))
+                           AS changed
+                );
+            END IF;
+            org_ids := ARRAY(
+                SELECT DISTINCT a.org_id
+                  FROM entities e
+                  JOIN affiliations a ON a.entity_id = e.id
+                 WHERE e.business_identifier = ANY(identifiers) AND a.org_id IS NOT NULL
+                 ORDER BY a.org_id
+            );
+            FOREACH v_org_id IN ARRAY org_ids LOOP
+                PERFORM org_affiliation_rollup_refresh(v_org_id);
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+    CustomSql(
+        'org_affiliation_rollups_entities_changed',
+        """
+        CREATE OR REPLACE FUNCTION org_affiliation_rollups_entities_changed() RETURNS trigger AS $$
+        DECLARE
+            org_ids integer[];
+            v_org_id integer;
+        BEGIN
+            org_ids := ARRAY(
+                SELECT DISTINCT a.org_id
+                  FROM affiliations a
+                 WHERE a.org_id IS NOT NULL
+                   AND a.entity_id IN (SELECT id FROM (SELECT id, business_identifier FROM new_rows
+                                                       EXCEPT SELECT id, business_identifier FROM old_rows) AS changed)
+                 ORDER BY a.org_id
+            );
+            FOREACH v_org_id IN ARRAY org_ids LOOP
+                PERFORM org_affiliation_rollup_refresh(v_org_id);
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+    ),
+]
+
+TRANSITION_TABLES = {
+    'INSERT': 'NEW TABLE AS new_rows',
+    'UPDATE': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'DELETE': 'OLD TABLE AS old_rows',
+}
+# Function name to the table and events its triggers, named <function>_<event>, fire on.
+TRIGGERS = {
+    'org_affiliation_rollups_affiliations_changed': ('affiliations', ['INSERT', 'UPDATE', 'DELETE']),
+    'org_affiliation_rollups_entity_mapping_changed': ('entity_mapping', ['INSERT', 'UPDATE', 'DELETE']),
+    'org_affiliation_rollups_entities_changed': ('entities', ['UPDATE']),
+}
+
+
+def upgrade():
+    op.create_table('org_affiliation_rollups',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('org_id', sa.Integer(), nullable=False),
+    sa.Column('identifiers', sa.ARRAY(sa.String(length=75)), nullable=False),
+    sa.Column('created_on', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('org_affiliation_rollups', schema=None) as batch_op:
+        # Keyset order of the affiliations page, newest first.
+        batch_op.create_index('ix_org_affiliation_rollups_org_created', ['org_id', 'created_on', 'identifiers'])
+
+    op.execute(org_affiliation_rollup_refresh.sql)
+    for function in trigger_functions:
+        op.execute(function.sql)
+    for function, (table, events) in TRIGGERS.items():
+        for event in events:
+            op.execute(
+                f'CREATE TRIGGER {function}_{event.lower()} AFTER {event} ON {table} '
+                f'REFERENCING {TRANSITION_TABLES[event]} FOR EACH STATEMENT EXECUTE FUNCTION {function}()'
+            )
+    op.execute('SELECT org_affiliation_rollup_refresh(NULL)')
+
+
+def downgrade():
+    for function, (table, events) in TRIGGERS.items():
+        for event in events:
+            op.execute(f'DROP TRIGGER IF EXISTS {function}_{event.lower()} ON {table}')
+        op.execute(f'DROP FUNCTION IF EXISTS {function}()')
+    op.execute('DROP FUNCTION IF EXISTS org_affiliation_rollup_refresh(integer)')
+    op.drop_table('org_affiliation_rollups')
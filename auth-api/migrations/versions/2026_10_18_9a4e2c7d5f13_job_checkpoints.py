@@ -0,0 +1,28 @@
+"""Resume points for long running jobs.
+
+Revision ID: 9a4e2c7d5f13
+Revises: 7c3d9e5a1b42
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '9a4e2c7d5f13'
+down_revision = '7c3d9e5a1b42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('job_checkpoints',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('position', sa.String(length=250), nullable=True),
+    sa.Column('updated_on', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('job_checkpoints')
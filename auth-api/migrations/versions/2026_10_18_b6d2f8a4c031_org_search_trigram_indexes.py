@@ -0,0 +1,41 @@
+"""Trigram indexes for the staff org searches.
+
+Revision ID: b6d2f8a4c031
+Revises: 9a4e2c7d5f13
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b6d2f8a4c031'
+down_revision = '9a4e2c7d5f13'
+branch_labels = None
+depends_on = None
+
+# Org.search_org and SimpleOrg.search match anywhere in these with ILIKE '%...%', which a B-tree can't serve. The id
+# index is on the same CAST(id AS VARCHAR) expression the searches use.
+TRIGRAM_INDEXES = {
+    'ix_orgs_name_trgm': 'name',
+    'ix_orgs_branch_name_trgm': 'branch_name',
+    'ix_orgs_decision_made_by_trgm': 'decision_made_by',
+    'ix_orgs_bcol_account_id_trgm': 'bcol_account_id',
+    'ix_orgs_id_trgm': 'CAST(id AS VARCHAR)',
+}
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, expression in TRIGRAM_INDEXES.items():
+        op.create_index(
+            index_name,
+            'orgs',
+            [sa.text(f'({expression}) gin_trgm_ops')],
+            postgresql_using='gin',
+        )
+
+
+def downgrade():
+    for index_name in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name='orgs')
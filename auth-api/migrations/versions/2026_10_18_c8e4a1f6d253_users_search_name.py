@@ -0,0 +1,37 @@
+"""Generated, trigram indexed search column for user names.
+
+Revision ID: c8e4a1f6d253
+Revises: b6d2f8a4c031
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c8e4a1f6d253'
+down_revision = 'b6d2f8a4c031'
+branch_labels = None
+depends_on = None
+
+# "first last first username" holds both the "first last" order the task search matches and the
+# "last first username" order the org member search matches. CONCAT isn't immutable, so coalesce and || are used.
+SEARCH_NAME_EXPRESSION = (
+    "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+    "coalesce(first_name, '') || ' ' || coalesce(username, ''))"
+)
+
+
+def upgrade():
+    op.add_column('users', sa.Column('search_name', sa.String(), sa.Computed(SEARCH_NAME_EXPRESSION, persisted=True)))
+    op.create_index(
+        'ix_users_search_name_trgm',
+        'users',
+        [sa.text('search_name gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_users_search_name_trgm', table_name='users')
+    op.drop_column('users', 'search_name')
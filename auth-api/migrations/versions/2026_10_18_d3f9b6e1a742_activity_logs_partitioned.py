@@ -0,0 +1,171 @@
+"""Partition activity_logs by month of created, with functions to add and archive partitions.
+
+Revision ID: d3f9b6e1a742
+Revises: c8e4a1f6d253
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from auth_api.utils.custom_sql import CustomSql
+
+# revision identifiers, used by Alembic.
+revision = 'd3f9b6e1a742'
+down_revision = 'c8e4a1f6d253'
+branch_labels = None
+depends_on = None
+
+# Partitions are activity_logs_yYYYYmMM, one per month. They are added after the highest existing bound, so the
+# legacy partition (everything before the month of the migration) is never overlapped. Rows that landed in
+# activity_logs_default because a month was missing are moved into the new partition, as Postgres won't create a
+# partition whose rows are still in the default one.
+activity_logs_create_partitions = CustomSql(
+    'activity_logs_create_partitions',
+    """
+    CREATE OR REPLACE FUNCTION activity_logs_create_partitions(p_through timestamp) RETURNS integer AS $$
+    DECLARE
+        v_month timestamp;
+        v_next timestamp;
+        v_name text;
+        v_created integer := 0;
+    BEGIN
+        SELECT greatest(date_trunc('month', now()::timestamp), max(upper_bound))
+          INTO v_month
+          FROM (
+            SELECT substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \\(''([^'']+)''\\)')::timestamp AS upper_bound
+              FROM pg_inherits i
+              JOIN pg_class c ON c.oid = i.inhrelid
+             WHERE i.inhparent = 'activity_logs'::regclass
+          ) AS bounds;
+
+        WHILE v_month <= p_through LOOP
+            v_next := v_month + interval '1 month';
+            v_name := 'activity_logs_' || to_char(v_month, '"y"YYYY"m"MM');
+            IF EXISTS (SELECT 1 FROM activity_logs_default WHERE created >= v_month AND created < v_next) THEN
+                ALTER TABLE activity_logs DETACH PARTITION activity_logs_default;
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF activity_logs FOR VALUES FROM (%L) TO (%L)', v_name, v_month, v_next
+                );
+                INSERT INTO activity_logs
+                SELECT * FROM activity_logs_default WHERE created >= v_month AND created < v_next;
+                DELETE FROM activity_logs_default WHERE created >= v_month AND created < v_next;
+                ALTER TABLE activity_logs ATTACH PARTITION activity_logs_default DEFAULT;
+            ELSE
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF activity_logs FOR VALUES FROM (%L) TO (%L)', v_name, v_month, v_next
+                );
+            END IF;
+            v_created := v_created + 1;
+            v_month := v_next;
+        END LOOP;
+        RETURN v_created;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+)
+
+# Detaches the partitions that end on or before p_before and moves them to p_schema, where they can still be
+# queried, dumped or dropped. Returns the names of the archived partitions.
+activity_logs_archive_partitions = CustomSql(
+    'activity_logs_archive_partitions',
+    """
+    CREATE OR REPLACE FUNCTION activity_logs_archive_partitions(p_before timestamp, p_schema text)
+    RETURNS SETOF text AS $$
+    DECLARE
+        v_partition record;
+    BEGIN
+        EXECUTE format('CREATE SCHEMA IF NOT EXISTS %I', p_schema);
+        FOR v_partition IN
+            SELECT c.relname
+              FROM pg_inherits i
+              JOIN pg_class c ON c.oid = i.inhrelid
+             WHERE i.inhparent = 'activity_logs'::regclass
+               AND substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \\(''([^'']+)''\\)')::timestamp <= p_before
+             ORDER BY c.relname
+        LOOP
+            EXECUTE format('ALTER TABLE activity_logs DETACH PARTITION %I', v_partition.relname);
+            EXECUTE format('ALTER TABLE %I SET SCHEMA %I', v_partition.relname, p_schema);
+            RETURN NEXT v_partition.relname;
+        END LOOP;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+)
+
+# ix_activity_logs_org_id is replaced by ix_activity_logs_org_id_created, which also serves the created desc order.
+INDEXES = {
+    'ix_activity_logs_action': 'action',
+    'ix_activity_logs_actor_id': 'actor_id',
+    'ix_activity_logs_item_name': 'item_name',
+    'ix_activity_logs_item_type': 'item_type',
+}
+FOREIGN_KEYS = {
+    'activity_logs_created_by_id_fkey': 'created_by_id',
+    'activity_logs_modified_by_id_fkey': 'modified_by_id',
+}
+PARTITIONS_AHEAD = '3 months'
+
+
+def upgrade():
+    # The existing table becomes the partition for everything before the current month, so only this month's rows
+    # (and any dated later) are copied, into the monthly partitions created below.
+    op.execute('UPDATE activity_logs SET created = coalesce(modified, now()) WHERE created IS NULL')
+    cutover = op.get_bind().execute(sa.text("SELECT date_trunc('month', now()::timestamp)")).scalar()
+    op.execute(f"CREATE TEMPORARY TABLE activity_logs_recent AS SELECT * FROM activity_logs WHERE created >= '{cutover}'")
+    op.execute(f"DELETE FROM activity_logs WHERE created >= '{cutover}'")
+
+    op.execute('ALTER TABLE activity_logs RENAME TO activity_logs_legacy')
+    op.execute('ALTER INDEX activity_logs_pkey RENAME TO activity_logs_legacy_pkey')
+    for index_name in [*INDEXES, 'ix_activity_logs_org_id']:
+        op.execute(f'ALTER INDEX {index_name} RENAME TO {index_name.replace("activity_logs", "activity_logs_legacy")}')
+
+    op.execute('CREATE TABLE activity_logs (LIKE activity_logs_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (created)')
+    op.execute('ALTER TABLE activity_logs ALTER COLUMN created SET NOT NULL')
+    op.execute('ALTER TABLE activity_logs ADD CONSTRAINT activity_logs_pkey PRIMARY KEY (id, created)')
+    op.execute('ALTER SEQUENCE activity_logs_id_seq OWNED BY activity_logs.id')
+    for constraint_name, column in FOREIGN_KEYS.items():
+        op.execute(
+            f'ALTER TABLE activity_logs ADD CONSTRAINT {constraint_name} FOREIGN KEY ({column}) REFERENCES users (id)'
+        )
+
+    # A partition's primary key has to match the parent's. The check constraint lets the attach skip scanning the
+    # table for rows outside the partition bound.
+    op.execute('ALTER TABLE activity_logs_legacy ALTER COLUMN created SET NOT NULL')
+    op.execute('ALTER TABLE activity_logs_legacy DROP CONSTRAINT activity_logs_legacy_pkey')
+    op.execute('ALTER TABLE activity_logs_legacy ADD CONSTRAINT activity_logs_legacy_pkey PRIMARY KEY (id, created)')
+    op.execute(f"ALTER TABLE activity_logs_legacy ADD CONSTRAINT activity_logs_legacy_bound CHECK (created < '{cutover}')")
+    op.execute(f"ALTER TABLE activity_logs ATTACH PARTITION activity_logs_legacy FOR VALUES FROM (MINVALUE) TO ('{cutover}')")
+    op.execute('ALTER TABLE activity_logs_legacy DROP CONSTRAINT activity_logs_legacy_bound')
+    op.execute('CREATE TABLE activity_logs_default PARTITION OF activity_logs DEFAULT')
+
+    # Created on the parent, they cascade to every partition, reusing the legacy table's matching indexes.
+    for index_name, column in INDEXES.items():
+        op.execute(f'CREATE INDEX {index_name} ON activity_logs ({column})')
+    op.execute('CREATE INDEX ix_activity_logs_org_id_created ON activity_logs (org_id, created DESC)')
+    op.execute('DROP INDEX ix_activity_logs_legacy_org_id')
+
+    op.execute(activity_logs_create_partitions.sql)
+    op.execute(activity_logs_archive_partitions.sql)
+    op.execute(f"SELECT activity_logs_create_partitions(now()::timestamp + interval '{PARTITIONS_AHEAD}')")
+    op.execute('INSERT INTO activity_logs SELECT * FROM activity_logs_recent')
+    op.execute('DROP TABLE activity_logs_recent')
+
+
+def downgrade():
+    # Archived partitions stay where they were moved to, restore them by hand if they are needed.
+    op.execute('DROP FUNCTION IF EXISTS activity_logs_archive_partitions(timestamp, text)')
+    op.execute('DROP FUNCTION IF EXISTS activity_logs_create_partitions(timestamp)')
+    op.execute('CREATE TABLE activity_logs_unpartitioned (LIKE activity_logs INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO activity_logs_unpartitioned SELECT * FROM activity_logs')
+    op.execute('ALTER SEQUENCE activity_logs_id_seq OWNED BY activity_logs_unpartitioned.id')
+    op.execute('DROP TABLE activity_logs')
+    op.execute('ALTER TABLE activity_logs_unpartitioned RENAME TO activity_logs')
+    op.execute('ALTER TABLE activity_logs ALTER COLUMN created DROP NOT NULL')
+    op.execute('ALTER TABLE activity_logs ADD CONSTRAINT activity_logs_pkey PRIMARY KEY (id)')
+    for constraint_name, column in FOREIGN_KEYS.items():
+        op.execute(
+            f'ALTER TABLE activity_logs ADD CONSTRAINT {constraint_name} FOREIGN KEY ({column}) REFERENCES users (id)'
+        )
+    for index_name, column in {**INDEXES, 'ix_activity_logs_org_id': 'org_id'}.items():
+        op.execute(f'CREATE INDEX {index_name} ON activity_logs ({column})')
@@ -36,6 +36,7 @@ from auth_api.resources import endpoints
 from auth_api.services.flags import flags
 from auth_api.services.gcp_queue import queue
 from auth_api.utils.auth import jwt
+from auth_api.utils.authorization_cache import authorization_cache
 from auth_api.utils.cache import cache
 from auth_api.utils.logging import setup_logging
 from auth_api.utils.user_context import _get_context
@@ -160,6 +161,7 @@ def register_shellcontext(app):
 def build_cache(app):
     """Build cache in a background thread so gunicorn can start accepting requests immediately."""
     cache.init_app(app)
+    authorization_cache.init_app(app)
 
     if app.config.get("TESTING", False):
         return
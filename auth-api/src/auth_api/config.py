@@ -105,17 +105,58 @@ class _Config:  # pylint: disable=too-few-public-methods
     KEYCLOAK_REALMNAME = os.getenv("KEYCLOAK_REALMNAME")
     KEYCLOAK_ADMIN_USERNAME = os.getenv("SBC_AUTH_ADMIN_CLIENT_ID")
     KEYCLOAK_ADMIN_SECRET = os.getenv("SBC_AUTH_ADMIN_CLIENT_SECRET")
+    # Seconds a keycloak group name -> group id lookup is reused, stale ids are also refreshed on a 404.
+    KEYCLOAK_GROUP_ID_CACHE_TIMEOUT = int(os.getenv("KEYCLOAK_GROUP_ID_CACHE_TIMEOUT", "3600"))
 
     # keycloak service account token lifepan
     try:
         CACHE_DEFAULT_TIMEOUT = int(os.getenv("ACCESS_TOKEN_LIFESPAN"))
     except:  # pylint:disable=bare-except # noqa: B901, E722
         CACHE_DEFAULT_TIMEOUT = 300
+    # Seconds before expiry that service account and admin tokens are refreshed in the background.
+    SERVICE_ACCOUNT_TOKEN_REFRESH_AHEAD = int(os.getenv("SERVICE_ACCOUNT_TOKEN_REFRESH_AHEAD", "60"))
+
+    # Pooled outbound HTTP client, timeouts in seconds.
+    HTTP_CONNECT_TIMEOUT = int(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+    HTTP_READ_TIMEOUT = int(os.getenv("HTTP_READ_TIMEOUT", "60"))
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+    # Shared aiohttp session on the background event loop (LEAR / Names fan-out).
+    ASYNC_HTTP_POOL_LIMIT = int(os.getenv("ASYNC_HTTP_POOL_LIMIT", "100"))
+    ASYNC_HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("ASYNC_HTTP_POOL_LIMIT_PER_HOST", "20"))
+    ASYNC_HTTP_KEEPALIVE_TIMEOUT = int(os.getenv("ASYNC_HTTP_KEEPALIVE_TIMEOUT", "30"))
+    ASYNC_HTTP_MAX_CONCURRENCY = int(os.getenv("ASYNC_HTTP_MAX_CONCURRENCY", "20"))
 
     CACHE_MEMCACHED_SERVERS = os.getenv("CACHE_MEMCACHED_SERVERS")
     CACHE_REDIS_HOST = os.getenv("CACHE_REDIS_HOST")
     CACHE_REDIS_PORT = os.getenv("CACHE_REDIS_PORT")
 
+    # Authorization decision cache, needs a shared (redis/memcached) cache when running more than one worker.
+    AUTHORIZATION_CACHE_ENABLED = os.getenv("AUTHORIZATION_CACHE_ENABLED", "False").lower() == "true"
+    AUTHORIZATION_CACHE_TIMEOUT = int(os.getenv("AUTHORIZATION_CACHE_TIMEOUT", "300"))
+    AUTHORIZATION_CACHE_LOCAL_SIZE = int(os.getenv("AUTHORIZATION_CACHE_LOCAL_SIZE", "10000"))
+
+    # LEAR / Names affiliation details cache, seconds fresh and then served stale while being refreshed.
+    AFFILIATION_DETAILS_CACHE_ENABLED = os.getenv("AFFILIATION_DETAILS_CACHE_ENABLED", "False").lower() == "true"
+    AFFILIATION_DETAILS_CACHE_TTL = int(os.getenv("AFFILIATION_DETAILS_CACHE_TTL", "300"))
+    AFFILIATION_DETAILS_CACHE_STALE_TTL = int(os.getenv("AFFILIATION_DETAILS_CACHE_STALE_TTL", "3600"))
+    # Identifiers per LEAR / Names details call, calls in flight per load and seconds before a call is given up.
+    AFFILIATION_DETAILS_CHUNK_SIZE = int(os.getenv("AFFILIATION_DETAILS_CHUNK_SIZE", "250"))
+    AFFILIATION_DETAILS_MAX_PARALLEL = int(os.getenv("AFFILIATION_DETAILS_MAX_PARALLEL", "4"))
+    AFFILIATION_DETAILS_CHUNK_TIMEOUT = int(os.getenv("AFFILIATION_DETAILS_CHUNK_TIMEOUT", "20"))
+    # Seconds a request waits on the background loop, just above three rounds of chunks (3000 identifiers with the
+    # defaults above) each taking up to AFFILIATION_DETAILS_CHUNK_TIMEOUT.
+    BACKGROUND_LOOP_TIMEOUT = int(os.getenv("BACKGROUND_LOOP_TIMEOUT", str(AFFILIATION_DETAILS_CHUNK_TIMEOUT * 3 + 5)))
+    # Businesses per transaction of the bulk affiliation endpoints.
+    BULK_AFFILIATION_CHUNK_SIZE = int(os.getenv("BULK_AFFILIATION_CHUNK_SIZE", "500"))
+    # How paged searches count their total when a request doesn't ask (exact, estimate or cached), and seconds a
+    # cached count is reused for the same filters.
+    SEARCH_COUNT_STRATEGY = os.getenv("SEARCH_COUNT_STRATEGY", "exact")
+    SEARCH_COUNT_CACHE_TTL = int(os.getenv("SEARCH_COUNT_CACHE_TTL", "60"))
+
+    # Seconds between checks of the published permission matrix version.
+    PERMISSIONS_VERSION_CHECK_INTERVAL = int(os.getenv("PERMISSIONS_VERSION_CHECK_INTERVAL", "30"))
+
     # Service account details
     KEYCLOAK_SERVICE_ACCOUNT_ID = os.getenv("SBC_AUTH_ADMIN_CLIENT_ID")
     KEYCLOAK_SERVICE_ACCOUNT_SECRET = os.getenv("SBC_AUTH_ADMIN_CLIENT_SECRET")
@@ -158,6 +199,9 @@ class _Config:  # pylint: disable=too-few-public-methods
     AFFILIATION_TOKEN_EXPIRY_PERIOD_MINS = os.getenv("AFFILIATION_TOKEN_EXPIRY_PERIOD_MINS", "720")
     UNAFFILIATED_EMAIL_TOKEN_EXPIRY_PERIOD_MINS = os.getenv("UNAFFILIATED_EMAIL_TOKEN_EXPIRY_PERIOD_MINS", "10080")
     LINKING_KEY_EXPIRY_DAYS = int(os.getenv("LINKING_KEY_EXPIRY_DAYS", "365"))
+    # Seconds between batched writes of linking key last_used (0 writes on every use), and the most keys buffered.
+    LINKING_KEY_LAST_USED_FLUSH_INTERVAL = int(os.getenv("LINKING_KEY_LAST_USED_FLUSH_INTERVAL", "30"))
+    LINKING_KEY_LAST_USED_BUFFER_SIZE = int(os.getenv("LINKING_KEY_LAST_USED_BUFFER_SIZE", "10000"))
     STAFF_ADMIN_EMAIL = os.getenv("STAFF_ADMIN_EMAIL")
 
     # front end serves this image in this name.can be moved to openshift config as well..
@@ -313,6 +357,8 @@ NrQw+2OdQACBJiEHsdZzAkBcsTk7frTH4yGx0VfHxXDPjfTj4wmD6gZIlcIr9lZg
     MAX_NUMBER_OF_ORGS = 3
 
     BCOL_ACCOUNT_LINK_CHECK = True
+    AUTHORIZATION_CACHE_ENABLED = False
+    LINKING_KEY_LAST_USED_FLUSH_INTERVAL = 0
 
     STAFF_ADMIN_EMAIL = "test@test.com"
     ACCOUNT_MAILER_TOPIC = os.getenv("ACCOUNT_MAILER_TOPIC", "account-mailer-dev")
@@ -38,10 +38,12 @@ from .invitation import Invitation
 from .invitation_membership import InvitationMembership
 from .invitation_type import InvitationType
 from .invite_status import InvitationStatus
+from .job_checkpoint import JobCheckpoint
 from .membership import Membership
 from .membership_status_code import MembershipStatusCode
 from .membership_type import MembershipType
 from .org import Org
+from .org_affiliation_rollup import OrgAffiliationRollup
 from .org_redirect_url import OrgRedirectUrl
 from .org_settings import OrgSettings
 from .org_status import OrgStatus
@@ -59,3 +61,6 @@ from .task import Task
 from .user import User
 from .user_settings import UserSettings
 from .user_status_code import UserStatusCode
+
+# Registers the session listeners that invalidate cached authorization decisions.
+from auth_api.utils.authorization_cache import authorization_cache  # noqa: E402
@@ -11,11 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Model for all activity stream related changes."""
+"""Model for all activity stream related changes.
 
-from sqlalchemy import Column, Integer, String, desc
+activity_logs is partitioned by month of created (see the activity_logs_partitioned migration), so filtering on
+created lets Postgres skip the partitions outside the window.
+"""
+
+import datetime
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, desc, text
 
 from .base_model import BaseModel
+from .custom_query import KeysetPagination
 from .db import db
 
 
@@ -23,6 +30,7 @@ class ActivityLog(BaseModel):  # pylint: disable=too-few-public-methods,too-many
     """Model for ActivityLog Org record."""
 
     __tablename__ = "activity_logs"
+    __table_args__ = (Index("ix_activity_logs_org_id_created", "org_id", desc("created")),)
 
     id = Column(Integer, primary_key=True)
     actor_id = Column(Integer, nullable=True, index=True)  # who did the activity, refers to user id in the user table.
@@ -32,7 +40,9 @@ class ActivityLog(BaseModel):  # pylint: disable=too-few-public-methods,too-many
     item_id = Column(String(250), index=False)  # id of the entity (if possible, may duplicate org_id)
     item_value = Column(String(900), nullable=True)  # Value being set (Payment Method / Role Name etc)
     remote_addr = Column(String(250), index=False)
-    org_id = Column(Integer, nullable=True, index=True)
+    org_id = Column(Integer, nullable=True)
+    # The partition key, part of the primary key in the database.
+    created = Column(DateTime, default=datetime.datetime.now, nullable=False)
 
     @classmethod
     def fetch_activity_logs_for_account(  # pylint: disable=too-many-positional-arguments,too-many-arguments
@@ -43,15 +53,50 @@ class ActivityLog(BaseModel):  # pylint: disable=too-few-public-methods,too-many
         action: str,
         page: int,
         limit: int,
+        count: str | None = None,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+    ):
+        """Fetch all activity logs, the total is counted the way count says (see CustomQuery.count_total)."""
+        query = cls._activity_logs_query(org_id, item_name, item_type, action, start_date, end_date)
+
+        # Add pagination
+        pagination = query.order_by(desc(ActivityLog.created)).paginate(per_page=limit, page=page, count=False)
+        return pagination.items, query.count_total(count)
+
+    @classmethod
+    def fetch_activity_logs_for_account_by_cursor(  # pylint: disable=too-many-positional-arguments,too-many-arguments
+        cls,
+        org_id: int,
+        item_name: str,
+        item_type: str,
+        action: str,
+        limit: int,
+        cursor: str,
+        count: str | None = None,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
+    ) -> KeysetPagination:
+        """Fetch the page of activity logs after the cursor, newest first, without OFFSET."""
+        query = cls._activity_logs_query(org_id, item_name, item_type, action, start_date, end_date)
+        return query.keyset_paginate([(ActivityLog.created, True), (ActivityLog.id, True)], limit, cursor, count)
+
+    @classmethod
+    def _activity_logs_query(  # pylint: disable=too-many-positional-arguments,too-many-arguments
+        cls,
+        org_id: int,
+        item_name: str,
+        item_type: str,
+        action: str,
+        start_date: datetime.datetime | None = None,
+        end_date: datetime.datetime | None = None,
     ):
-        """Fetch all activity logs."""
         from . import User  # pylint:disable=cyclic-import, import-outside-toplevel
 
         query = (
             db.session.query(ActivityLog, User)
             .outerjoin(User, User.id == ActivityLog.actor_id)
             .filter(ActivityLog.org_id == int(org_id or -1))
-            .order_by(desc(ActivityLog.created))
         )
 
         if item_name:
@@ -60,7 +105,29 @@ class ActivityLog(BaseModel):  # pylint: disable=too-few-public-methods,too-many
             query = query.filter(ActivityLog.item_type == item_type)
         if action:
             query = query.filter(ActivityLog.action == action)
+        if start_date or end_date:
+            query = query.filter_conditional_date_range(start_date, end_date, ActivityLog.created, cast_to_date=False)
+        return query
 
-        # Add pagination
-        pagination = query.paginate(per_page=limit, page=page)
-        return pagination.items, pagination.total
+    @classmethod
+    def create_partitions(cls, through: datetime.datetime) -> int:
+        """Add the monthly partitions missing up to and including the month of through, returns how many."""
+        created = db.session.execute(
+            text("SELECT activity_logs_create_partitions(:through)"), {"through": through}
+        ).scalar()
+        db.session.commit()
+        return created
+
+    @classmethod
+    def archive_partitions(cls, before: datetime.datetime, schema: str) -> list[str]:
+        """Detach the partitions that end on or before the given time and move them to schema, returns their names."""
+        archived = (
+            db.session.execute(
+                text("SELECT * FROM activity_logs_archive_partitions(:before, :schema)"),
+                {"before": before, "schema": schema},
+            )
+            .scalars()
+            .all()
+        )
+        db.session.commit()
+        return archived
@@ -46,6 +46,13 @@ class Affiliation(Versioned, BaseModel):  # pylint: disable=too-few-public-metho
         query = cls.query.filter_by(org_id=int(org_id or -1), entity_id=int(entity_id or -1))
         return query.one_or_none()
 
+    @classmethod
+    def find_affiliations_by_org_and_entity_ids(cls, org_id: int, entity_ids: list[int]) -> list[Affiliation]:
+        """Return the affiliations of the org to any of the provided entity ids."""
+        if not entity_ids:
+            return []
+        return cls.query.filter(cls.org_id == int(org_id or -1), cls.entity_id.in_(entity_ids)).all()
+
     @classmethod
     def find_affiliations_by_entity_id(cls, entity_id: int) -> list[Affiliation]:
         """Return affiliations for the provided entity id."""
@@ -215,6 +215,13 @@ class AffiliationInvitation(BaseModel):  # pylint: disable=too-many-instance-att
         """Find all affiliation invitations associated to an affiliation."""
         return cls.query.filter_by(affiliation_id=int(affiliation_id or -1)).all()
 
+    @classmethod
+    def find_invitations_by_affiliations(cls, affiliation_ids: list[int]):
+        """Find all affiliation invitations associated to any of the affiliations."""
+        if not affiliation_ids:
+            return []
+        return cls.query.filter(cls.affiliation_id.in_(affiliation_ids)).all()
+
     @staticmethod
     def find_invitations_by_org_entity_ids(from_org_id: int, entity_id: int):
         """Find all affiliation invitation for org and entity ids."""
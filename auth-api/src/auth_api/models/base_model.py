@@ -61,10 +61,7 @@ class BaseModel(db.Model):
         try:
             from .user import User as UserModel  # pylint:disable=cyclic-import, import-outside-toplevel
 
-            user = UserModel.find_by_jwt_token()
-            if not user:
-                return None
-            return user.id
+            return UserModel.find_current_user_id()
         except:  # pylint:disable=bare-except # noqa: B901, E722
             return None
 
@@ -14,10 +14,42 @@
 # pylint: disable=W0223
 """Custom Query class to extend BaseQuery class functionality."""
 
+import base64
+import hashlib
+from dataclasses import dataclass
 from datetime import date, datetime
 
+import orjson
+from flask import current_app
 from flask_sqlalchemy.query import Query
-from sqlalchemy import and_, func
+from sqlalchemy import DateTime, and_, asc, desc, false, func, or_
+
+from auth_api.exceptions import BusinessException
+from auth_api.exceptions.errors import Error
+from auth_api.utils.cache import cache
+from auth_api.utils.enums import CountStrategy
+
+COUNT_CACHE_KEY_PREFIX = "search_count:"
+
+
+@dataclass
+class KeysetPagination:
+    """A page of keyset paginated results, the next page continues from next_cursor."""
+
+    items: list
+    limit: int
+    has_more: bool
+    next_cursor: str | None = None
+    total: int | None = None
+
+    def as_dict(self) -> dict:
+        """Return the paging details for a search response."""
+        page_details = {"limit": self.limit, "hasMore": self.has_more}
+        if self.next_cursor:
+            page_details["nextCursor"] = self.next_cursor
+        if self.total is not None:
+            page_details["total"] = self.total
+        return page_details
 
 
 class CustomQuery(Query):  # pylint: disable=too-many-ancestors
@@ -72,3 +104,124 @@ class CustomQuery(Query):  # pylint: disable=too-many-ancestors
     def scalars(self) -> list:
         """Flatten query result tuples to a list of values."""
         return [row[0] for row in self.all()]
+
+    def count_total(self, strategy: CountStrategy | str | None = None) -> int:
+        """Return the number of rows the query matches, counted the way the strategy says.
+
+        Without a strategy the SEARCH_COUNT_STRATEGY config is used, exact unless it's set otherwise.
+        """
+        try:
+            strategy = CountStrategy(strategy or current_app.config.get("SEARCH_COUNT_STRATEGY", "exact"))
+        except ValueError as e:
+            raise BusinessException(Error.INVALID_INPUT, e) from e
+
+        query = self.order_by(None)
+        if strategy == CountStrategy.ESTIMATE:
+            return query._estimate_count()
+        if strategy == CountStrategy.CACHED:
+            return query._cached_count()
+        return query.count()
+
+    def _compiled(self):
+        """Return the query compiled for the session's database, IN lists expanded, with its parameters."""
+        compiled = self.statement.compile(
+            dialect=self.session.get_bind().dialect, compile_kwargs={"render_postcompile": True}
+        )
+        parameters = compiled.params
+        if compiled.positional:
+            parameters = tuple(parameters[name] for name in compiled.positiontup)
+        return compiled.string, parameters
+
+    def _estimate_count(self) -> int:
+        """Return the planner's estimate of the rows the query returns, it doesn't run the query."""
+        sql, parameters = self._compiled()
+        plan = self.session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", parameters).scalar()
+        if isinstance(plan, str):
+            plan = orjson.loads(plan)  # pylint: disable=maybe-no-member
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _cached_count(self) -> int:
+        """Return the exact count, reusing one counted for the same SQL and parameters within the cache TTL."""
+        sql, parameters = self._compiled()
+        fingerprint = hashlib.sha256(
+            orjson.dumps([sql, parameters], default=str)  # pylint: disable=maybe-no-member
+        ).hexdigest()
+        key = f"{COUNT_CACHE_KEY_PREFIX}{fingerprint}"
+        try:
+            if (total := cache.get(key)) is not None:
+                return total
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Search count cache read failed: {e}")
+            return self.count()
+
+        total = self.count()
+        try:
+            cache.set(key, total, timeout=current_app.config.get("SEARCH_COUNT_CACHE_TTL", 60))
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Search count cache write failed: {e}")
+        return total
+
+    def keyset_paginate(
+        self, keys: list[tuple], limit: int, cursor: str | None = None, count: CountStrategy | str | None = None
+    ) -> KeysetPagination:
+        """Return the page after the cursor, seeking on the sort keys instead of using OFFSET.
+
+        keys are (expression, descending) pairs, the last one unique (e.g. the id) so every row has its own position.
+        The cursor is the next_cursor of the previous page, none or an empty one starts at the first page. The total
+        is only counted when a count strategy is asked for.
+        """
+        entity_count = len(self.column_descriptions)
+        query = self.order_by(None).order_by(*(desc(key) if descending else asc(key) for key, descending in keys))
+        if cursor:
+            query = query.filter(_after_keys(keys, _decode_cursor(cursor, keys)))
+        # Select the key values along with the rows so the cursor can be built from the last one.
+        rows = (
+            query.add_columns(*(key.label(f"keyset_{index}") for index, (key, _) in enumerate(keys)))
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return KeysetPagination(
+            items=[row[0] if entity_count == 1 else tuple(row[:entity_count]) for row in rows],
+            limit=limit,
+            has_more=has_more,
+            next_cursor=_encode_cursor(rows[-1][entity_count:]) if has_more and rows else None,
+            total=self.count_total(count) if count else None,
+        )
+
+
+def _encode_cursor(values) -> str:
+    """Return the opaque cursor for the sort key values of the last row of a page."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode("utf-8")  # pylint: disable=maybe-no-member
+
+
+def _decode_cursor(cursor: str, keys: list[tuple]) -> list:
+    """Return the sort key values a cursor points after."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))  # pylint: disable=maybe-no-member
+        if not isinstance(values, list):
+            raise ValueError("Cursor is not a list of sort key values.")
+        return [
+            datetime.fromisoformat(value) if value is not None and isinstance(key.type, DateTime) else value
+            for (key, _), value in zip(keys, values, strict=True)
+        ]
+    except (ValueError, TypeError) as e:
+        raise BusinessException(Error.INVALID_INPUT, e) from e
+
+
+def _after_keys(keys: list[tuple], values: list):
+    """Return the filter for the rows that sort after the given key values."""
+    conditions = []
+    equal_so_far = []
+    for (key, descending), value in zip(keys, values, strict=True):
+        if value is None:
+            # Postgres sorts NULLs first when descending and last when ascending.
+            after = key.is_not(None) if descending else false()
+            same = key.is_(None)
+        else:
+            after = key < value if descending else or_(key > value, key.is_(None))
+            same = key == value
+        conditions.append(and_(*equal_so_far, after))
+        equal_so_far.append(same)
+    return or_(*conditions)
@@ -61,6 +61,7 @@ class AffiliationSearchDetails:  # pylint: disable=too-many-instance-attributes
     status: str | None = None
     name: str | None = None
     type: str | None = None
+    cursor: str | None = None
 
     @classmethod
     def from_request_args(cls, req: Request) -> Self:
@@ -72,6 +73,7 @@ class AffiliationSearchDetails:  # pylint: disable=too-many-instance-attributes
             type=req.args.getlist("type") or [],
             page=int(req.args.get("page", 1)),
             limit=int(req.args.get("limit", 100000)),
+            cursor=req.args.get("cursor"),
         )
 
 
@@ -153,6 +155,8 @@ class OrgSearch:  # pylint: disable=too-many-instance-attributes
     suspension_reason_code: str
     page: int
     limit: int
+    cursor: str | None = None
+    count: str | None = None
 
 
 @dataclass
@@ -167,6 +171,7 @@ class SimpleOrgSearch:  # pylint: disable=too-many-instance-attributes
     exclude_statuses: bool
     page: int
     limit: int
+    cursor: str | None = None
 
 
 @dataclass
@@ -184,6 +189,8 @@ class TaskSearch:  # pylint: disable=too-many-instance-attributes
     page: int = 1
     limit: int = 10
     action: str = ""
+    cursor: str | None = None
+    count: str | None = None
 
 
 @dataclass
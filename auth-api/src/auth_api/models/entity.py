@@ -19,8 +19,9 @@ The class and schema are both present in this module.
 from typing import Self
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import joinedload, lazyload, relationship, selectinload
 
+from auth_api.utils.enums import EntityLoad
 from auth_api.utils.passcode import passcode_hash
 from auth_api.utils.util import camelback2snake
 
@@ -47,16 +48,40 @@ class Entity(BaseModel):  # pylint: disable=too-few-public-methods, too-many-ins
     is_loaded_lear = Column(Boolean(), default=True, nullable=False)
 
     contacts = relationship("ContactLink", back_populates="entity")
-    corp_type = relationship("CorpType", foreign_keys=[corp_type_code], lazy="joined", innerjoin=True)
+    corp_type = relationship("CorpType", foreign_keys=[corp_type_code], lazy="select")
     corp_sub_type = relationship("CorpType", foreign_keys=[corp_sub_type_code])
     affiliations = relationship(
-        "Affiliation", cascade="all,delete,delete-orphan", lazy="joined", back_populates="entity"
+        "Affiliation", cascade="all,delete,delete-orphan", lazy="select", back_populates="entity"
     )
 
     @classmethod
-    def find_by_business_identifier(cls, business_identifier):
+    def load_options(cls, load: EntityLoad = EntityLoad.MINIMAL) -> list:
+        """Return the loader options of the load profile."""
+        match load:
+            case EntityLoad.AFFILIATIONS:
+                return [joinedload(cls.corp_type, innerjoin=True), selectinload(cls.affiliations)]
+            case EntityLoad.AUTHORIZATION:
+                return [joinedload(cls.corp_type, innerjoin=True), lazyload(cls.affiliations)]
+            case _:
+                return [lazyload(cls.corp_type), lazyload(cls.affiliations)]
+
+    @classmethod
+    def find_by_business_identifier(cls, business_identifier, load: EntityLoad = EntityLoad.MINIMAL):
         """Return the first entity with the provided business identifier."""
-        return cls.query.filter_by(business_identifier=business_identifier).one_or_none()
+        return (
+            cls.query.filter_by(business_identifier=business_identifier).options(*cls.load_options(load)).one_or_none()
+        )
+
+    @classmethod
+    def find_by_business_identifiers(
+        cls, business_identifiers: list[str], load: EntityLoad = EntityLoad.MINIMAL
+    ) -> list[Self]:
+        """Return the entities with the provided business identifiers."""
+        if not business_identifiers:
+            return []
+        return (
+            cls.query.filter(cls.business_identifier.in_(business_identifiers)).options(*cls.load_options(load)).all()
+        )
 
     @classmethod
     def create_from_dict(cls, entity_info: dict):
@@ -69,9 +94,9 @@ class Entity(BaseModel):  # pylint: disable=too-few-public-methods, too-many-ins
         return None
 
     @classmethod
-    def find_by_entity_id(cls, entity_id: int) -> Self:
+    def find_by_entity_id(cls, entity_id: int, load: EntityLoad = EntityLoad.MINIMAL) -> Self:
         """Find an Entity instance that matches the provided id."""
-        return cls.query.filter_by(id=int(entity_id or -1)).first()
+        return cls.query.filter_by(id=int(entity_id or -1)).options(*cls.load_options(load)).first()
 
     def reset(self):
         """Reset an Entity back to init state."""
@@ -0,0 +1,45 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Resume point of a long running job, so the next run continues where the last one stopped."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, String
+
+from .db import db
+
+
+class JobCheckpoint(db.Model):  # pylint: disable=too-few-public-methods
+    """This is the model for job_checkpoints."""
+
+    __tablename__ = "job_checkpoints"
+
+    name = Column(String(100), primary_key=True)
+    position = Column(String(250), nullable=True)
+    updated_on = Column(DateTime, nullable=True)
+
+    @classmethod
+    def find_position(cls, name: str) -> str | None:
+        """Return the saved position of the job, None when it has not run or finished its last pass."""
+        checkpoint = db.session.get(cls, name)
+        return checkpoint.position if checkpoint else None
+
+    @classmethod
+    def save_position(cls, name: str, position: str | None):
+        """Save and commit the position of the job, None starts the next run from the beginning."""
+        checkpoint = db.session.get(cls, name) or cls(name=name)
+        checkpoint.position = position
+        checkpoint.updated_on = datetime.now(UTC)
+        db.session.add(checkpoint)
+        db.session.commit()
@@ -20,7 +20,22 @@ from typing import Self
 
 from flask import current_app
 from sql_versioning import Versioned
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, and_, cast, desc, event, func, text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Double,
+    ForeignKey,
+    Integer,
+    String,
+    and_,
+    cast,
+    desc,
+    event,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import contains_eager, relationship
 
@@ -29,13 +44,14 @@ from auth_api.exceptions.errors import Error
 from auth_api.models.affiliation import Affiliation
 from auth_api.models.dataclass import OrgSearch
 from auth_api.utils.date import str_to_utc_dt
-from auth_api.utils.enums import AccessType, InvitationStatus, InvitationType
+from auth_api.utils.enums import AccessType, InvitationStatus, InvitationType, Status
 from auth_api.utils.enums import OrgStatus as OrgStatusEnum
 from auth_api.utils.roles import EXCLUDED_FIELDS, INVALID_ORG_CREATE_TYPE_CODES, VALID_STATUSES
 
 from .base_model import BaseModel
 from .contact import Contact
 from .contact_link import ContactLink
+from .custom_query import KeysetPagination
 from .db import db
 from .invitation import Invitation, InvitationMembership
 from .org_status import OrgStatus
@@ -153,6 +169,20 @@ class Org(Versioned, BaseModel):  # pylint: disable=too-few-public-methods,too-m
     @classmethod
     def search_org(cls, search: OrgSearch):
         """Find all orgs with the given type."""
+        query = cls._search_org_query(search)
+        pagination = cls.get_order_by(search, query).paginate(per_page=search.limit, page=search.page, count=False)
+
+        return pagination.items, query.count_total(search.count)
+
+    @classmethod
+    def search_org_by_cursor(cls, search: OrgSearch) -> KeysetPagination:
+        """Find the page of orgs after search.cursor, in the same order as search_org but without OFFSET."""
+        return cls._search_org_query(search).keyset_paginate(
+            cls.get_sort_keys(search) + [(Org.id, True)], search.limit, search.cursor, search.count
+        )
+
+    @classmethod
+    def _search_org_query(cls, search: OrgSearch):
         query = (
             db.session.query(Org)
             .outerjoin(ContactLink)
@@ -175,21 +205,15 @@ class Org(Versioned, BaseModel):  # pylint: disable=too-few-public-methods,too-m
         if search.name:
             query = query.filter(Org.name.ilike(f"%{search.name}%"))
         if search.member_search_text:
-            member_exists_subquery = text(
-                """
-                EXISTS (
-                    SELECT 1
-                    FROM memberships
-                    JOIN users ON users.id = memberships.user_id
-                    WHERE memberships.org_id = orgs.id
-                    AND memberships.status = 1
-                    AND users.status = 1
-                    AND CONCAT(users.last_name, ' ', users.first_name, ' ', users.username) ILIKE :member_search_text
-                )
-                """
-            ).params(member_search_text=f"%{search.member_search_text}%")
+            from .membership import Membership  # local import to avoid circular dependency
+            from .user import User  # local import to avoid circular dependency
 
-            query = query.filter(member_exists_subquery)
+            # Find the matching users through the search_name index first, then semi-join their orgs.
+            member_org_ids = select(Membership.org_id).where(
+                Membership.user_id.in_(User.search_name_matches(search.member_search_text, active_only=True)),
+                Membership.status == Status.ACTIVE.value,
+            )
+            query = query.filter(Org.id.in_(member_org_ids))
 
         query = cls._search_by_business_identifier(query, search.business_identifier)
         query = cls._search_for_statuses(query, search.statuses)
@@ -204,25 +228,31 @@ class Org(Versioned, BaseModel):  # pylint: disable=too-few-public-methods,too-m
             query = query.filter_conditional_date_range(start_date, end_date, Org.suspended_on, cast_to_date=False)
         if search.suspension_reason_code:
             query = query.filter(Org.suspension_reason_code == search.suspension_reason_code)
-
-        query = cls.get_order_by(search, query)
-        pagination = query.paginate(per_page=search.limit, page=search.page)
-
-        return pagination.items, pagination.total
+        return query
 
     @classmethod
     def get_order_by(cls, search, query):
         """Handle search query order by."""
+        return query.order_by(*(desc(key) if descending else key for key, descending in cls.get_sort_keys(search)))
+
+    @classmethod
+    def get_sort_keys(cls, search) -> list[tuple]:
+        """Return the (expression, descending) pairs searches are ordered by."""
         # If searching by id, surface the perfect matches to the top
         if search.id:
-            return query.order_by(desc(Org.id == int(search.id or -1)), Org.created.desc())
+            return [(Org.id == int(search.id or -1), True), (Org.created, True)]
 
         if search.statuses and (
             OrgStatusEnum.SUSPENDED.value in search.statuses or OrgStatusEnum.NSF_SUSPENDED.value in search.statuses
         ):
-            return query.order_by(desc(Org.suspended_on), Org.created.desc())
+            return [(Org.suspended_on, True), (Org.created, True)]
+
+        # Closest names first, pg_trgm similarity of the same trigrams the name index matches on. similarity is a
+        # real, cast to double precision so the value a cursor carries compares equal to the row it came from.
+        if search.name:
+            return [(cast(func.similarity(Org.name, search.name), Double), True), (Org.created, True)]
 
-        return query.order_by(Org.created.desc())
+        return [(Org.created, True)]
 
     @classmethod
     def search_orgs_by_business_identifier(cls, business_identifier, excluded_org_types: list[str] = None):
@@ -0,0 +1,73 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per org rollup of the affiliations dashboard rows.
+
+One row per business, TEMP + NR pair, TEMP or NR an org shows, with the identifiers to look up and the date of its
+most recent affiliation. Rows are recomputed per org by database triggers on affiliations, entity_mapping and
+entities (see org_affiliation_rollup_refresh), so a page is a single index range scan.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import ARRAY, BigInteger, Column, DateTime, Index, Integer, String, literal, or_, text, tuple_
+
+from .db import db
+
+
+class OrgAffiliationRollup(db.Model):  # pylint: disable=too-few-public-methods
+    """This is the model for org_affiliation_rollups."""
+
+    __tablename__ = "org_affiliation_rollups"
+    __table_args__ = (Index("ix_org_affiliation_rollups_org_created", "org_id", "created_on", "identifiers"),)
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    org_id = Column(Integer, nullable=False)
+    identifiers = Column(ARRAY(String(75)), nullable=False)
+    created_on = Column(DateTime)
+
+    @classmethod
+    def find_by_org_id(
+        cls, org_id: int, limit: int | None = None, offset: int = 0, after: tuple[datetime, list[str]] | None = None
+    ) -> list[tuple[list[str], datetime]]:
+        """Return (identifiers, created_on) for the org newest first, starting after the (created_on, identifiers)."""
+        query = db.session.query(cls.identifiers, cls.created_on).filter(cls.org_id == int(org_id or -1))
+        if after is not None:
+            created_on, identifiers = after
+            if created_on is None:
+                # Undated rows sort first newest first, every dated row comes after them.
+                query = query.filter(
+                    or_(
+                        cls.created_on.isnot(None),
+                        cls.identifiers < literal(identifiers, cls.identifiers.type),
+                    )
+                )
+            else:
+                query = query.filter(
+                    tuple_(cls.created_on, cls.identifiers)
+                    < tuple_(literal(created_on, cls.created_on.type), literal(identifiers, cls.identifiers.type))
+                )
+        query = query.order_by(cls.created_on.desc(), cls.identifiers.desc())
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @classmethod
+    def rebuild(cls, org_id: int = None):
+        """Recompute the rows for one org, or for every org when org_id is not provided."""
+        db.session.execute(
+            text("SELECT org_affiliation_rollup_refresh(:org_id)"), {"org_id": int(org_id) if org_id else None}
+        )
+        db.session.commit()
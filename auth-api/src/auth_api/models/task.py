@@ -15,7 +15,7 @@
 
 from typing import Self
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, desc
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
@@ -24,7 +24,9 @@ from auth_api.utils.date import str_to_utc_dt
 from auth_api.utils.enums import TaskRelationshipStatus, TaskRelationshipType, TaskStatus
 
 from .base_model import BaseModel
+from .custom_query import KeysetPagination
 from .db import db
+from .user import User
 
 
 class Task(BaseModel):
@@ -58,6 +60,23 @@ class Task(BaseModel):
     @classmethod
     def fetch_tasks(cls, task_search: TaskSearch):
         """Fetch all tasks."""
+        query = cls._fetch_tasks_query(task_search)
+
+        # Add pagination
+        pagination = query.order_by(
+            *(desc(key) if descending else key for key, descending in cls._sort_keys(task_search))
+        ).paginate(per_page=task_search.limit, page=task_search.page, count=False)
+        return pagination.items, query.count_total(task_search.count)
+
+    @classmethod
+    def fetch_tasks_by_cursor(cls, task_search: TaskSearch) -> KeysetPagination:
+        """Fetch the page of tasks after task_search.cursor, in the same order as fetch_tasks but without OFFSET."""
+        return cls._fetch_tasks_query(task_search).keyset_paginate(
+            cls._sort_keys(task_search) + [(Task.id, False)], task_search.limit, task_search.cursor, task_search.count
+        )
+
+    @classmethod
+    def _fetch_tasks_query(cls, task_search: TaskSearch):
         query = db.session.query(Task)
 
         if task_search.name:
@@ -79,21 +98,20 @@ class Task(BaseModel):
         if task_search.relationship_status:
             query = query.filter(Task.relationship_status == task_search.relationship_status)
         if task_search.modified_by:
-            query = (
-                query.join(Task.modified_by)
-                .filter(text("lower(users.first_name || ' ' || users.last_name) like lower(:search_text)"))
-                .params(search_text=f"%{task_search.modified_by}%")
-            )
+            query = query.filter(Task.modified_by_id.in_(User.search_name_matches(task_search.modified_by)))
+        return query
+
+    @staticmethod
+    def _sort_keys(task_search: TaskSearch) -> list[tuple]:
+        """Return the (expression, descending) pairs tasks are ordered by."""
+        sort_keys = []
         if task_search.relationship_status == TaskRelationshipStatus.PENDING_STAFF_REVIEW.value:
-            query = query.order_by(Task.date_submitted.asc())
+            sort_keys.append((Task.date_submitted, False))
         if task_search.submitted_sort_order == "asc":
-            query = query.order_by(Task.date_submitted.asc())
+            sort_keys.append((Task.date_submitted, False))
         if task_search.submitted_sort_order == "desc":
-            query = query.order_by(Task.date_submitted.desc())
-
-        # Add pagination
-        pagination = query.paginate(per_page=task_search.limit, page=task_search.page)
-        return pagination.items, pagination.total
+            sort_keys.append((Task.date_submitted, True))
+        return sort_keys
 
     @classmethod
     def find_by_task_id(cls, task_id: int) -> Self:
@@ -19,11 +19,11 @@ A User stores basic information from a KeyCloak user (including the KeyCloak GUI
 import datetime
 import uuid
 
-from flask import current_app
+from flask import current_app, g, has_app_context
 from sql_versioning import Versioned
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, and_, or_
+from sqlalchemy import Boolean, Column, Computed, DateTime, ForeignKey, Integer, String, and_, event, or_, select
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import joinedload, relationship
+from sqlalchemy.orm import Session, joinedload, relationship
 
 from auth_api.utils.enums import LoginSource, Status, UserStatus
 from auth_api.utils.roles import Role
@@ -41,7 +41,7 @@ class User(Versioned, BaseModel):
 
     __tablename__ = "users"
 
-    __versioned__ = {"exclude": ["modified", "modified_by_id", "modified_by", "created", "login_time"]}
+    __versioned__ = {"exclude": ["modified", "modified_by_id", "modified_by", "created", "login_time", "search_name"]}
 
     id = Column(Integer, primary_key=True)
     username = Column("username", String(100), index=True)
@@ -65,6 +65,16 @@ class User(Versioned, BaseModel):
     login_source = Column("login_source", String(200), nullable=True)
     login_time = Column(DateTime, default=None, nullable=True)
     verified = Column(Boolean())
+    # Maintained by the database and trigram indexed, see search_name_matches.
+    search_name = Column(
+        "search_name",
+        String,
+        Computed(
+            "lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+            "coalesce(first_name, '') || ' ' || coalesce(username, ''))",
+            persisted=True,
+        ),
+    )
 
     contacts = relationship(
         "ContactLink", primaryjoin="User.id == ContactLink.user_id", lazy="select", back_populates="user"
@@ -93,8 +103,35 @@ class User(Versioned, BaseModel):
     @classmethod
     @user_context
     def find_by_jwt_token(cls, **kwargs):
-        """Find an existing user by the keycloak GUID and (idpUserId is null or from token) in the provided token."""
+        """Find an existing user by the keycloak GUID and (idpUserId is null or from token) in the provided token.
+
+        The match, or the lack of one, is remembered for the rest of the request.
+        """
+        user_from_context: UserContext = kwargs["user_context"]
+        key = _token_user_key(user_from_context)
+        resolved_users = _get_resolved_users()
+        if resolved_users is not None and key in resolved_users:
+            user_id = resolved_users[key]
+            return db.session.get(User, user_id) if user_id else None
+
+        user = cls._query_by_jwt_token(user_from_context)
+        if resolved_users is not None:
+            resolved_users[key] = user.id if user else None
+        return user
+
+    @classmethod
+    @user_context
+    def find_current_user_id(cls, **kwargs) -> int | None:
+        """Return the id of the user in the token, loading the user at most once per request."""
         user_from_context: UserContext = kwargs["user_context"]
+        resolved_users = _get_resolved_users()
+        if resolved_users is not None and (key := _token_user_key(user_from_context)) in resolved_users:
+            return resolved_users[key]
+        user = cls.find_by_jwt_token()
+        return user.id if user else None
+
+    @classmethod
+    def _query_by_jwt_token(cls, user_from_context: UserContext):
         return (
             db.session.query(User)
             .filter(
@@ -228,6 +265,18 @@ class User(Versioned, BaseModel):
             return cls.query.all()
         return cls.query.filter(or_(cls.firstname == first_name, cls.lastname == last_name, cls.email == email)).all()
 
+    @classmethod
+    def search_name_matches(cls, search_text: str, active_only: bool = False):
+        """Return a select of the ids of the users whose "first last" or "last first username" contains the text.
+
+        Runs against the trigram indexed search_name column, so callers can semi-join on the ids instead of matching
+        names row by row.
+        """
+        query = select(cls.id).where(cls.search_name.like(f"%{search_text.lower()}%"))
+        if active_only:
+            query = query.where(cls.status == UserStatus.ACTIVE.value)
+        return query
+
     @classmethod
     @user_context
     def update_terms_of_use(cls, is_terms_accepted, terms_of_use_version, **kwargs):
@@ -301,3 +350,36 @@ class User(Versioned, BaseModel):
         for field, value in kwargs.items():
             if hasattr(self, field) and getattr(self, field) != value:
                 setattr(self, field, value)
+
+
+def _token_user_key(user_from_context: UserContext) -> tuple:
+    return str(user_from_context.sub), user_from_context.token_info.get("idp_userid", None)
+
+
+def _get_resolved_users() -> dict | None:
+    """Return the users resolved from the token in this request (or app context), keyed by guid and idp user id."""
+    if not has_app_context():
+        return None
+    if "resolved_users" not in g:
+        g.resolved_users = {}
+    return g.resolved_users
+
+
+def clear_resolved_users():
+    """Forget the users resolved for this request, the next lookup goes back to the database."""
+    if has_app_context():
+        g.pop("resolved_users", None)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _user_changed(mapper, connection, target):  # pylint: disable=unused-argument # noqa: ARG001
+    """A user created, renamed or removed in this request may change who the token resolves to."""
+    clear_resolved_users()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _session_rolled_back(session, previous_transaction):  # pylint: disable=unused-argument # noqa: ARG001
+    """Users resolved inside a rolled back transaction may no longer exist."""
+    clear_resolved_users()
@@ -11,40 +11,77 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""This manages Authorization view.
+"""This manages the Authorization lookups.
 
-Authorization view wraps details on the entities and membership through orgs and delegations.
+Authorizations wrap details on the entities and membership through orgs and delegations. The rows of
+authorizations_view are kept denormalized in authorizations_materialized by database triggers on memberships,
+affiliations, product subscriptions, orgs, entities and users, so each lookup is a single index scan.
 """
 
 import uuid
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import BigInteger, Column, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import expression
 
 from auth_api.models.db import db
 from auth_api.utils.roles import ADMIN, COORDINATOR, USER
 
+# Columns shared with authorizations_view, used to compare the two.
+VIEW_COLUMNS = (
+    "business_identifier",
+    "entity_name",
+    "folio_number",
+    "corp_type_code",
+    "org_membership",
+    "keycloak_guid",
+    "user_id",
+    "org_id",
+    "org_name",
+    "status_code",
+    "org_type",
+    "product_code",
+    "bcol_user_id",
+    "bcol_account_id",
+)
 
-class Authorization(db.Model):
-    """This is the model the authorizations_view."""
-
-    __tablename__ = "authorizations_view"
 
-    business_identifier = Column(String)
-    entity_name = Column(String)
-    org_membership = Column(String)
+class Authorization(db.Model):
+    """This is the model for authorizations_materialized, the denormalized authorizations_view."""
+
+    __tablename__ = "authorizations_materialized"
+    __table_args__ = (
+        Index("ix_authorizations_guid_business_org", "keycloak_guid", "business_identifier", "org_id"),
+        Index("ix_authorizations_business_org", "business_identifier", "org_id"),
+        Index("ix_authorizations_product_business", "product_code", "business_identifier"),
+        Index("ix_authorizations_guid_org_product", "keycloak_guid", "org_id", "product_code"),
+        Index("ix_authorizations_org_membership_product", "org_id", "org_membership", "product_code"),
+        Index("ix_authorizations_membership_id", "membership_id"),
+        Index("ix_authorizations_affiliation_id", "affiliation_id"),
+        Index("ix_authorizations_entity_id", "entity_id"),
+        Index("ix_authorizations_product_subscription_id", "product_subscription_id"),
+        Index("ix_authorizations_user_id", "user_id"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    business_identifier = Column(String(75))
+    entity_name = Column(String(250))
+    org_membership = Column(String(25))
     keycloak_guid = Column(UUID)
-    org_id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, primary_key=True)
-    org_type = Column(String)
-    corp_type_code = Column(String)
-    product_code = Column(String)
-    org_name = Column(String)
-    bcol_user_id = Column(String)
-    bcol_account_id = Column(String)
-    folio_number = Column(String)
-    status_code = Column(String)
+    org_id = Column(Integer)
+    user_id = Column(Integer)
+    org_type = Column(String(25))
+    corp_type_code = Column(String(15))
+    product_code = Column(String(75))
+    org_name = Column(String(250))
+    bcol_user_id = Column(String(20))
+    bcol_account_id = Column(String(20))
+    folio_number = Column(String(50))
+    status_code = Column(String(25))
+    membership_id = Column(Integer)
+    affiliation_id = Column(Integer)
+    entity_id = Column(Integer)
+    product_subscription_id = Column(Integer)
 
     @classmethod
     def find_user_authorization_by_business_number(
@@ -53,9 +90,13 @@ class Authorization(db.Model):
         """Return authorization view object."""
         auth = None
         if keycloak_guid and business_identifier and org_id:
-            auth = cls.query.filter_by(
-                keycloak_guid=keycloak_guid, business_identifier=business_identifier, org_id=int(org_id or -1)
-            ).one_or_none()
+            auth = (
+                cls.query.filter_by(
+                    keycloak_guid=keycloak_guid, business_identifier=business_identifier, org_id=int(org_id or -1)
+                )
+                .order_by(cls.id)
+                .first()
+            )
         elif business_identifier and org_id:
             auth = cls.query.filter_by(business_identifier=business_identifier, org_id=int(org_id or -1)).first()
         elif keycloak_guid and business_identifier:
@@ -83,10 +124,53 @@ class Authorization(db.Model):
             .first()
         )
 
+    @classmethod
+    def find_user_authorizations_by_business_numbers(
+        cls, business_identifiers: list[str], keycloak_guid: uuid = None, org_id: int = None, is_staff=None
+    ) -> dict:
+        """Return the authorization view object for each business identifier, resolved with one query.
+
+        Mirrors find_user_authorization_by_business_number, identifiers without an authorization are omitted.
+        """
+        if not business_identifiers or not (keycloak_guid or org_id or is_staff):
+            return {}
+        query = cls.query.filter(cls.business_identifier.in_(set(business_identifiers)))
+        if keycloak_guid:
+            query = query.filter_by(keycloak_guid=keycloak_guid)
+        if org_id:
+            query = query.filter_by(org_id=int(org_id))
+        return cls._first_by_business_identifier(query.order_by(cls.id))
+
+    @classmethod
+    def find_user_authorizations_by_business_numbers_and_product(
+        cls, business_identifiers: list[str], product_code: str
+    ) -> dict:
+        """Return the highest membership authorization for each business identifier and product, in one query."""
+        if not business_identifiers:
+            return {}
+        query = cls.query.filter(
+            cls.business_identifier.in_(set(business_identifiers)), cls.product_code == product_code
+        ).order_by(
+            expression.case(
+                (Authorization.org_membership == ADMIN, 1),
+                (Authorization.org_membership == COORDINATOR, 2),
+                (Authorization.org_membership == USER, 3),
+            ),
+            cls.id,
+        )
+        return cls._first_by_business_identifier(query)
+
+    @staticmethod
+    def _first_by_business_identifier(query) -> dict:
+        authorizations = {}
+        for auth in query.all():
+            authorizations.setdefault(auth.business_identifier, auth)
+        return authorizations
+
     @classmethod
     def find_user_authorization_by_org_id(cls, keycloak_guid: uuid, org_id: int):
         """Return authorization view object."""
-        return cls.query.filter_by(keycloak_guid=keycloak_guid, org_id=int(org_id or -1)).one_or_none()
+        return cls.query.filter_by(keycloak_guid=keycloak_guid, org_id=int(org_id or -1)).order_by(cls.id).first()
 
     @classmethod
     def find_authorization_for_admin_by_org_id(cls, org_id: int):
@@ -97,9 +181,11 @@ class Authorization(db.Model):
     @classmethod
     def find_account_authorization_by_org_id_and_product_for_user(cls, keycloak_guid: uuid, org_id: int, product: str):
         """Return authorization view object."""
-        return cls.query.filter_by(
-            keycloak_guid=keycloak_guid, org_id=int(org_id or -1), product_code=product
-        ).one_or_none()
+        return (
+            cls.query.filter_by(keycloak_guid=keycloak_guid, org_id=int(org_id or -1), product_code=product)
+            .order_by(cls.id)
+            .first()
+        )
 
     @classmethod
     def find_account_authorization_by_org_id_and_product(cls, org_id: int, product: str):
@@ -108,5 +194,35 @@ class Authorization(db.Model):
 
     @classmethod
     def find_all_authorizations_for_user(cls, keycloak_guid):
-        """Return list of authorizations for the user."""
-        return cls.query.filter_by(keycloak_guid=keycloak_guid).all()
+        """Return list of authorizations for the user, one per org."""
+        # There is a row per affiliation and active product of the org, only the first one is returned for each org.
+        return (
+            cls.query.filter_by(keycloak_guid=keycloak_guid)
+            .distinct(cls.org_id, cls.user_id)
+            .order_by(cls.org_id, cls.user_id, cls.id)
+            .all()
+        )
+
+    @classmethod
+    def check_consistency(cls, org_id: int = None) -> dict:
+        """Compare the materialized rows against authorizations_view.
+
+        Returns the number of view rows missing from the table and table rows missing from the view.
+        """
+        columns = ", ".join(VIEW_COLUMNS)
+        where = "WHERE org_id = :org_id" if org_id else ""
+        params = {"org_id": int(org_id)} if org_id else {}
+        # Only constant column and table names are interpolated, the org id is bound.
+        view_rows = f"SELECT {columns} FROM authorizations_view {where}"  # noqa: S608
+        table_rows = f"SELECT {columns} FROM {cls.__tablename__} {where}"  # noqa: S608
+        missing_sql = f"SELECT count(*) FROM ({view_rows} EXCEPT ALL {table_rows}) AS missing"  # noqa: S608
+        unexpected_sql = f"SELECT count(*) FROM ({table_rows} EXCEPT ALL {view_rows}) AS unexpected"  # noqa: S608
+        missing = db.session.execute(text(missing_sql), params).scalar()
+        unexpected = db.session.execute(text(unexpected_sql), params).scalar()
+        return {"missing": missing, "unexpected": unexpected}
+
+    @classmethod
+    def rebuild(cls, org_id: int = None):
+        """Recompute the materialized rows for one org, or for every org when org_id is not provided."""
+        db.session.execute(text("SELECT authorizations_refresh(:org_id)"), {"org_id": int(org_id) if org_id else None})
+        db.session.commit()
@@ -17,6 +17,7 @@ from flask import Blueprint
 from sqlalchemy import exc, text
 
 from auth_api.models import db
+from auth_api.utils.authorization_cache import authorization_cache
 
 bp = Blueprint("OPS", __name__, url_prefix="/ops")
 
@@ -40,3 +41,9 @@ def get_ops_readyz():
     """Return a JSON object that identifies if the service is setupAnd ready to work."""
     # TODO: add a poll to the DB when called
     return {"message": "api is ready"}, 200
+
+
+@bp.route("cachez", methods=["GET"])
+def get_ops_cachez():
+    """Return the authorization decision cache hit ratio and invalidation counters for this worker."""
+    return {"authorization_cache": authorization_cache.stats()}, 200
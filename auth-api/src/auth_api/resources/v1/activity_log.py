@@ -39,10 +39,23 @@ def get_activities(org_id):
         action = request.args.get("action", None)
         page = request.args.get("page", 1)
         limit = request.args.get("limit", 10)
+        cursor = request.args.get("cursor", None)
+        count = request.args.get("count", None)
+        start_date = request.args.get("startDate", None)
+        end_date = request.args.get("endDate", None)
 
         response, status = (
             ActivityLogService.fetch_activity_logs(
-                org_id, item_name=item_name, item_type=item_type, action=action, page=page, limit=limit
+                org_id,
+                item_name=item_name,
+                item_type=item_type,
+                action=action,
+                page=page,
+                limit=limit,
+                cursor=cursor,
+                count=count,
+                start_date=start_date,
+                end_date=end_date,
             ),
             HTTPStatus.OK,
         )
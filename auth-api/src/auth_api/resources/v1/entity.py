@@ -28,6 +28,7 @@ from auth_api.services.contact import Contact as ContactService
 from auth_api.services.entity import Entity as EntityService
 from auth_api.utils.auth import jwt as _jwt
 from auth_api.utils.endpoints_enums import EndpointEnum
+from auth_api.utils.enums import EntityLoad
 from auth_api.utils.roles import ALL_ALLOWED_ROLES, CLIENT_AUTH_ROLES, Role
 from auth_api.utils.util import mask_email
 
@@ -43,7 +44,7 @@ def post_entity():
 
     # If the record exists, just return existing record.
     entity = EntityService.find_by_business_identifier(
-        request_json.get("businessIdentifier"), allowed_roles=ALL_ALLOWED_ROLES
+        request_json.get("businessIdentifier"), allowed_roles=ALL_ALLOWED_ROLES, load=EntityLoad.AFFILIATIONS
     )
     if entity:
         return entity.as_dict(), HTTPStatus.ACCEPTED
@@ -60,6 +61,23 @@ def post_entity():
     return response, status
 
 
+@bp.route("/authorizations", methods=["POST", "OPTIONS"])
+@cross_origin(origins="*", methods=["POST"])
+@_jwt.requires_auth
+def post_entities_authorizations():
+    """Return authorizations for the user for each of the passed business identifiers."""
+    request_json = request.get_json()
+    valid_format, errors = schema_utils.validate(request_json, "entity_authorizations")
+    if not valid_format:
+        return {"message": schema_utils.serialize(errors)}, HTTPStatus.BAD_REQUEST
+
+    expanded: bool = request.args.get("expanded", False)
+    authorizations = AuthorizationService.get_user_authorizations_for_entities(
+        request_json.get("businessIdentifiers"), expanded
+    )
+    return {"authorizations": authorizations}, HTTPStatus.OK
+
+
 @bp.route("/<string:business_identifier>", methods=["GET", "OPTIONS"])
 @cross_origin(origins="*", methods=["GET", "PATCH", "DELETE"])
 @_jwt.requires_auth
@@ -70,6 +88,7 @@ def get_entity(business_identifier):
             business_identifier,
             allowed_roles=ALL_ALLOWED_ROLES,
             skip_auth=is_competent_authority_or_external_staff(),
+            load=EntityLoad.AFFILIATIONS,
         )
         if entity is not None:
             response, status = entity.as_dict(), HTTPStatus.OK
@@ -122,7 +141,9 @@ def patch_entity(business_identifier):
 def delete_entity(business_identifier):
     """Delete an existing entity by it's business number."""
     try:
-        entity = EntityService.find_by_business_identifier(business_identifier, allowed_roles=ALL_ALLOWED_ROLES)
+        entity = EntityService.find_by_business_identifier(
+            business_identifier, allowed_roles=ALL_ALLOWED_ROLES, load=EntityLoad.AFFILIATIONS
+        )
 
         if entity:
             entity.delete()
@@ -13,11 +13,10 @@
 # limitations under the License.
 """API endpoints for managing an Org resource."""
 
-import asyncio
 from http import HTTPStatus
 
 import orjson
-from flask import Blueprint, current_app, g, jsonify, request
+from flask import Blueprint, current_app, g, jsonify, request, stream_with_context
 from flask_cors import cross_origin
 
 from auth_api.exceptions import BusinessException, ServiceUnavailableException
@@ -43,7 +42,7 @@ from auth_api.services.entity_mapping import EntityMappingService
 from auth_api.services.flags import flags
 from auth_api.utils.auth import jwt as _jwt
 from auth_api.utils.endpoints_enums import EndpointEnum
-from auth_api.utils.enums import NotificationType, OrgStatus, OrgType, PatchActions, Status
+from auth_api.utils.enums import ContentType, NotificationType, OrgStatus, OrgType, PatchActions, Status
 from auth_api.utils.role_validator import validate_roles
 from auth_api.utils.roles import (  # noqa: I001
     AFFILIATION_ALLOWED_ROLES,
@@ -85,6 +84,8 @@ def search_organizations():
             request.args.get("suspensionReasonCode", None),
             int(request.args.get("page", 1)),
             int(request.args.get("limit", 10)),
+            request.args.get("cursor", None),
+            request.args.get("count", None),
         )
         validate_name = request.args.get("validateName", "False")
         token = g.jwt_oidc_token_info
@@ -127,6 +128,7 @@ def search_simple_orgs():
     search_text = request.args.get("searchText", None)
     statuses = request.args.getlist("statuses") or [OrgStatus.ACTIVE.value]
     exclude_statuses = request.args.get("excludeStatuses", False)
+    cursor = request.args.get("cursor", None)
 
     response, status = (
         SimpleOrgService.search(
@@ -139,6 +141,7 @@ def search_simple_orgs():
                 exclude_statuses=exclude_statuses,
                 page=page,
                 limit=limit,
+                cursor=cursor,
             )
         ),
         HTTPStatus.OK,
@@ -389,14 +392,32 @@ def affiliation_search(org_id, use_entity_mapping=False):
     if org is None:
         raise BusinessException(Error.DATA_NOT_FOUND, None)
     search_details = AffiliationSearchDetails.from_request_args(request)
+    is_search = any([search_details.identifier, search_details.status, search_details.name, search_details.type])
+    stream = (
+        request.accept_mimetypes.best_match([ContentType.JSON.value, ContentType.NDJSON.value])
+        == ContentType.NDJSON.value
+    )
     if use_entity_mapping:
         remove_stale_drafts = False
-        affiliation_bases, has_more = EntityMappingService.populate_affiliation_base(org_id, search_details)
-        affiliations_details_list, has_more_search = asyncio.run(
-            AffiliationService.get_affiliation_details(affiliation_bases, search_details, org_id, remove_stale_drafts)
+        affiliation_bases, has_more, next_cursor = EntityMappingService.populate_affiliation_base(
+            org_id, search_details
+        )
+        if stream:
+            # Searches page in the source apis, so their hasMore comes from the summary.
+            return _stream_affiliations(
+                org_id,
+                affiliation_bases,
+                search_details,
+                remove_stale_drafts,
+                True,
+                None if is_search else has_more,
+                next_cursor,
+            )
+        affiliations_details_list, has_more_search, missing_identifiers = AffiliationService.get_affiliation_details(
+            affiliation_bases, search_details, org_id, remove_stale_drafts
         )
         # Added Pagination after fetching filtered details from LEAR and Names otherwise searches only on page 1.
-        if any([search_details.identifier, search_details.status, search_details.name, search_details.type]):
+        if is_search:
             has_more = has_more_search
 
         response = {
@@ -404,14 +425,22 @@ def affiliation_search(org_id, use_entity_mapping=False):
             "totalResults": len(affiliations_details_list),
             "hasMore": has_more,
         }
+        if next_cursor:
+            response["nextCursor"] = next_cursor
     else:
         remove_stale_drafts = True
         affiliations = AffiliationModel.find_affiliations_by_org_id(org_id)
         affiliation_bases = AffiliationService.affiliation_to_affiliation_base(affiliations)
-        affiliations_details_list, _ = asyncio.run(
-            AffiliationService.get_affiliation_details(affiliation_bases, search_details, org_id, remove_stale_drafts)
+        if stream:
+            return _stream_affiliations(org_id, affiliation_bases, search_details, remove_stale_drafts)
+        affiliations_details_list, _, missing_identifiers = AffiliationService.get_affiliation_details(
+            affiliation_bases, search_details, org_id, remove_stale_drafts
         )
         response = {"entities": affiliations_details_list, "totalResults": len(affiliations_details_list)}
+    if missing_identifiers:
+        # Some upstream chunks failed, the UI can show what it has and flag the rest.
+        response["partial"] = True
+        response["missingIdentifiers"] = missing_identifiers
     # Use orjson serializer here, it's quite a bit faster.
     response, status = (
         current_app.response_class(
@@ -424,6 +453,38 @@ def affiliation_search(org_id, use_entity_mapping=False):
     return response, status
 
 
+def _stream_affiliations(  # pylint: disable=too-many-positional-arguments,too-many-arguments
+    org_id, affiliation_bases, search_details, remove_stale_drafts, with_has_more=False, has_more=None, next_cursor=None
+):
+    """Return the affiliations as NDJSON, one entity per line as LEAR and Names answer, then a summary line.
+
+    The summary line carries totalResults, hasMore when with_has_more is set (the source apis' value when has_more
+    is None), nextCursor when there is a next page and, when anything failed upstream, partial and missingIdentifiers.
+    """
+    records = AffiliationService.stream_affiliation_details(
+        affiliation_bases, search_details, org_id, remove_stale_drafts
+    )
+
+    def generate():
+        total = 0
+        for record in records:
+            if (summary := record.get("summary")) is None:
+                total += 1
+                yield orjson.dumps(record["entity"]) + b"\n"  # pylint: disable=maybe-no-member
+                continue
+            response = {"summary": True, "totalResults": total}
+            if with_has_more:
+                response["hasMore"] = summary["hasMore"] if has_more is None else has_more
+            if next_cursor:
+                response["nextCursor"] = next_cursor
+            if summary["missingIdentifiers"]:
+                response["partial"] = True
+                response["missingIdentifiers"] = summary["missingIdentifiers"]
+            yield orjson.dumps(response) + b"\n"  # pylint: disable=maybe-no-member
+
+    return current_app.response_class(stream_with_context(generate()), mimetype=ContentType.NDJSON.value), HTTPStatus.OK
+
+
 @bp.route("/<int:org_id>/affiliations", methods=["POST"])
 @cross_origin(origins="*")
 @_jwt.has_one_of_roles([Role.SYSTEM.value, Role.STAFF_MANAGE_BUSINESS.value, Role.PUBLIC_USER.value])
@@ -494,6 +555,60 @@ def post_organization_affiliation(org_id, **kwargs):
     return response, status
 
 
+@bp.route("/<int:org_id>/affiliations/bulk", methods=["POST", "OPTIONS"])
+@cross_origin(origins="*", methods=["POST", "DELETE"])
+@_jwt.has_one_of_roles([Role.SYSTEM.value, Role.STAFF_MANAGE_BUSINESS.value, Role.PUBLIC_USER.value])
+@user_context
+def post_organization_affiliations_bulk(org_id, **kwargs):
+    """Post Affiliations for many businesses of an org, returning a result per business."""
+    request_json = request.get_json()
+    valid_format, errors = schema_utils.validate(request_json, "bulk_affiliations")
+    if not valid_format:
+        return {"message": schema_utils.serialize(errors)}, HTTPStatus.BAD_REQUEST
+
+    # Same as a single affiliation, a vendor linking key creates the affiliations against the source org.
+    user: UserContext = kwargs["user_context"]
+    affiliation_org_id = org_id
+    skip_membership_check = _jwt.has_one_of_roles([Role.SKIP_AFFILIATION_AUTH.value])
+    if linking_key := user.linking_key:
+        linked = LinkingKeyService.validate(linking_key, org_id)
+        if not linked:
+            return {"message": "Invalid or unauthorized linking key."}, HTTPStatus.FORBIDDEN
+        affiliation_org_id = linked.account_id
+        skip_membership_check = True
+
+    try:
+        results = AffiliationService.create_affiliations(
+            affiliation_org_id, request_json["affiliations"], skip_membership_check=skip_membership_check
+        )
+        response, status = {"results": results}, HTTPStatus.OK
+    except BusinessException as exception:
+        response, status = {"code": exception.code, "message": exception.message}, exception.status_code
+
+    return response, status
+
+
+@bp.route("/<int:org_id>/affiliations/bulk", methods=["DELETE"])
+@cross_origin(origins="*")
+@_jwt.has_one_of_roles([Role.SYSTEM.value, Role.STAFF_MANAGE_BUSINESS.value])
+def delete_organization_affiliations_bulk(org_id):
+    """Delete the affiliations of many businesses from an org, returning a result per business."""
+    request_json = request.get_json()
+    valid_format, errors = schema_utils.validate(request_json, "bulk_affiliations_delete")
+    if not valid_format:
+        return {"message": schema_utils.serialize(errors)}, HTTPStatus.BAD_REQUEST
+
+    try:
+        results = AffiliationService.delete_affiliations(
+            org_id, request_json["businessIdentifiers"], log_delete_draft=request_json.get("logDeleteDraft", False)
+        )
+        response, status = {"results": results}, HTTPStatus.OK
+    except BusinessException as exception:
+        response, status = {"code": exception.code, "message": exception.message}, exception.status_code
+
+    return response, status
+
+
 @bp.route("/affiliation/<string:business_identifier>", methods=["GET", "OPTIONS"])
 @cross_origin(origins="*", methods=["GET"])
 @_jwt.has_one_of_roles([Role.SYSTEM.value, Role.STAFF_VIEW_ACCOUNTS.value, Role.PUBLIC_USER.value])
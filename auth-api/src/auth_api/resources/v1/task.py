@@ -51,6 +51,8 @@ def get_tasks():
             submitted_sort_order=request.args.get("submittedSortOrder", None),
             page=int(request.args.get("page", 1)),
             limit=int(request.args.get("limit", 10)),
+            cursor=request.args.get("cursor", None),
+            count=request.args.get("count", None),
         )
 
         response, status = TaskService.fetch_tasks(task_search), HTTPStatus.OK
@@ -27,7 +27,13 @@ class UserSchema(BaseSchema):  # pylint: disable=too-many-ancestors, too-few-pub
         """Maps all of the User fields to a default schema."""
 
         model = UserModel
-        exclude = ("orgs", "is_terms_of_use_accepted", "terms_of_use_accepted_version", "terms_of_use_version")
+        exclude = (
+            "orgs",
+            "is_terms_of_use_accepted",
+            "terms_of_use_accepted_version",
+            "terms_of_use_version",
+            "search_name",
+        )
 
     user_terms = fields.Method("get_user_terms_object")
     contacts = fields.Pluck("ContactLinkSchema", "contact", many=True)
@@ -28,6 +28,9 @@ from auth_api.services.activity_log_publisher import ActivityLogPublisher
 from auth_api.utils.account_mailer import publish_to_mailer
 from auth_api.utils.date import pacific_today_isoformat, utc_to_pacific_isoformat
 from auth_api.utils.enums import ActivityAction, LinkingKeyStatus
+from auth_api.utils.write_behind import LastUsedBuffer
+
+last_used_buffer = LastUsedBuffer(AccountLinkingKeyModel, "last_used", config_prefix="LINKING_KEY_LAST_USED")
 
 
 class AccountLinkingKey:
@@ -90,7 +93,7 @@ class AccountLinkingKey:
 
         PENDING keys are not valid for authorization — the vendor must call bind() first.
         Returns None if the key is not found, expired, revoked, PENDING, or the vendor does not match.
-        Updates last_used on every successful call.
+        Records last_used on every successful call, written in batches by last_used_buffer.
         """
         record = AccountLinkingKeyModel.find_active_by_key(key)
         if not record:
@@ -100,8 +103,7 @@ class AccountLinkingKey:
             current_app.logger.debug("Linking key rejected: vendor account does not match.")
             return None
 
-        record.last_used = datetime.now(UTC)
-        record.save()
+        last_used_buffer.record(record.id, datetime.now(UTC))
         return record
 
     @staticmethod
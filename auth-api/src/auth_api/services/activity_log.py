@@ -24,6 +24,7 @@ from jinja2 import Environment, FileSystemLoader
 from auth_api.models import ActivityLog as ActivityLogModel
 from auth_api.schemas import ActivityLogSchema
 from auth_api.services.authorization import check_auth
+from auth_api.utils.date import str_to_utc_dt
 from auth_api.utils.enums import ActivityAction
 from auth_api.utils.roles import ADMIN, STAFF, Role
 from auth_api.utils.user_context import UserContext, user_context
@@ -67,10 +68,27 @@ class ActivityLog:  # pylint: disable=too-many-instance-attributes
         logs = {"activity_logs": []}
         page: int = int(kwargs.get("page"))
         limit: int = int(kwargs.get("limit"))
-        search_args = (item_name, item_type, action, page, limit)
+        cursor: str | None = kwargs.get("cursor")
+        count: str | None = kwargs.get("count")
+        # A window on created only touches the partitions it overlaps.
+        start_date = str_to_utc_dt(kwargs["start_date"], False) if kwargs.get("start_date") else None
+        end_date = str_to_utc_dt(kwargs["end_date"], True) if kwargs.get("end_date") else None
 
         current_app.logger.debug("<fetch_activity logs ")
-        results, count = ActivityLogModel.fetch_activity_logs_for_account(org_id, *search_args)
+        if cursor is not None:
+            pagination = ActivityLogModel.fetch_activity_logs_for_account_by_cursor(
+                org_id, item_name, item_type, action, limit, cursor, count, start_date, end_date
+            )
+            results = pagination.items
+            logs.update(pagination.as_dict())
+        else:
+            results, count = ActivityLogModel.fetch_activity_logs_for_account(
+                org_id, item_name, item_type, action, page, limit, count, start_date, end_date
+            )
+            logs["total"] = count
+            logs["page"] = page
+            logs["limit"] = limit
+
         is_staff_access = user_from_context.is_staff() or user_from_context.is_external_staff()
         for result in results:
             activity_log: ActivityLogModel = result[0]
@@ -82,10 +100,6 @@ class ActivityLog:  # pylint: disable=too-many-instance-attributes
             log_dict["action"] = ActivityLog._build_string(activity_log)
             logs["activity_logs"].append(log_dict)
 
-        logs["total"] = count
-        logs["page"] = page
-        logs["limit"] = limit
-
         current_app.logger.debug(">fetch_activity logs")
         return logs
 
@@ -13,14 +13,20 @@
 # limitations under the License.
 """Service for managing Affiliation data."""
 
+import asyncio
 import datetime
+import queue
 import re
+import time
+from collections.abc import Iterator
 from dataclasses import asdict
+from http import HTTPStatus
+from itertools import batched
 
 from flask import current_app
 from requests.exceptions import HTTPError
 from sbc_common_components.utils.enums import QueueMessageTypes
-from sqlalchemy.orm import contains_eager, subqueryload
+from sqlalchemy.orm import contains_eager, joinedload, subqueryload
 
 from auth_api.exceptions import BusinessException, ServiceUnavailableException
 from auth_api.exceptions.errors import Error
@@ -44,8 +50,18 @@ from auth_api.services.entity import Entity as EntityService
 from auth_api.services.org import Org as OrgService
 from auth_api.services.user import User as UserService
 from auth_api.utils.account_mailer import publish_to_mailer
-from auth_api.utils.auth_event_publisher import publish_affiliation_event
-from auth_api.utils.enums import ActivityAction, CorpType, NRActionCodes, NRNameStatus, NRStatus, QueueMessageType
+from auth_api.utils.affiliation_details_cache import affiliation_details_cache
+from auth_api.utils.auth_event_publisher import publish_affiliation_event, publish_affiliations_event
+from auth_api.utils.background_loop import background_loop
+from auth_api.utils.enums import (
+    ActivityAction,
+    CorpType,
+    EntityLoad,
+    NRActionCodes,
+    NRNameStatus,
+    NRStatus,
+    QueueMessageType,
+)
 from auth_api.utils.passcode import validate_passcode
 from auth_api.utils.roles import (
     AFFILIATION_ALLOWED_ROLES,
@@ -145,6 +161,7 @@ class Affiliation:
             .join(AffiliationModel)
             .options(
                 contains_eager(Entity.affiliations),
+                joinedload(Entity.corp_type, innerjoin=True),
                 subqueryload(Entity.contacts).subqueryload(ContactLink.contact),
                 subqueryload(Entity.created_by),
                 subqueryload(Entity.modified_by),
@@ -196,7 +213,9 @@ class Affiliation:
             if org is None:
                 raise BusinessException(Error.DATA_NOT_FOUND, None)
 
-        entity = EntityService.find_by_business_identifier(business_identifier, skip_auth=True)
+        entity = EntityService.find_by_business_identifier(
+            business_identifier, skip_auth=True, load=EntityLoad.AUTHORIZATION
+        )
         # COLIN businesses are not loaded in LEAR, so the entity is created on demand and
         # refreshed on every affiliation attempt to keep the passcode and registered office
         # email in step with COLIN.
@@ -233,6 +252,110 @@ class Affiliation:
 
         return Affiliation(affiliation)
 
+    @staticmethod
+    def create_affiliations(org_id, affiliations: list[dict], skip_membership_check=False) -> list[dict]:
+        """Create the affiliations of many businesses to an org, with a result for each.
+
+        Like create_affiliation, without the confirmation email. Each chunk of BULK_AFFILIATION_CHUNK_SIZE is checked
+        with one lookup of its entities and existing affiliations, and inserted in one transaction.
+        """
+        current_app.logger.info(f"<create_affiliations org_id:{org_id} count:{len(affiliations)}")
+        if skip_membership_check is False:
+            org = OrgService.find_by_org_id(org_id, allowed_roles=ALL_ALLOWED_ROLES)
+            if org is None:
+                raise BusinessException(Error.DATA_NOT_FOUND, None)
+        skip_auth = Affiliation.has_role_to_skip_auth()
+
+        results = []
+        for chunk in batched(affiliations, current_app.config.get("BULK_AFFILIATION_CHUNK_SIZE", 500)):
+            results.extend(Affiliation._create_affiliations_chunk(org_id, chunk, skip_auth))
+        return results
+
+    @staticmethod
+    def _create_affiliations_chunk(org_id, affiliations: list[dict], skip_auth: bool) -> list[dict]:
+        """Create the affiliations of one chunk in one transaction."""
+        entities = Affiliation._find_bulk_entities(
+            [affiliation["businessIdentifier"] for affiliation in affiliations], sync_colin=True
+        )
+        affiliated_entity_ids = {
+            affiliation.entity_id
+            for affiliation in AffiliationModel.find_affiliations_by_org_and_entity_ids(
+                org_id, [entity.identifier for entity in entities.values() if isinstance(entity, EntityService)]
+            )
+        }
+
+        results, created = [], []
+        for affiliation in affiliations:
+            business_identifier = affiliation["businessIdentifier"]
+            try:
+                entity = entities[business_identifier]
+                if isinstance(entity, BusinessException):
+                    raise entity
+                if not skip_auth and not Affiliation.is_authorized(entity, affiliation.get("passCode")):
+                    raise BusinessException(Error.INVALID_USER_CREDENTIALS, None)
+                if entity.identifier in affiliated_entity_ids:
+                    raise BusinessException(Error.DATA_ALREADY_EXISTS, None)
+            except BusinessException as exception:
+                results.append(Affiliation._bulk_result(business_identifier, exception.status_code, exception))
+                continue
+            affiliated_entity_ids.add(entity.identifier)
+            db.session.add(
+                AffiliationModel(
+                    org_id=org_id, entity_id=entity.identifier, certified_by_name=affiliation.get("certifiedByName")
+                )
+            )
+            created.append(entity)
+            results.append(Affiliation._bulk_result(business_identifier, HTTPStatus.CREATED))
+
+        claimed_ids = [entity.identifier for entity in created if entity.corp_type not in ["SP", "GP"]]
+        if claimed_ids:
+            db.session.query(Entity).filter(Entity.id.in_(claimed_ids)).update(
+                {Entity.pass_code_claimed: True}, synchronize_session=False
+            )
+        db.session.commit()
+
+        for entity in created:
+            if entity.corp_type in [CorpType.RTMP.value, CorpType.TMP.value, CorpType.ATMP.value, CorpType.CTMP.value]:
+                continue
+            name = entity.name if len(entity.name) > 0 else entity.business_identifier
+            ActivityLogPublisher.publish_activity(
+                Activity(org_id, ActivityAction.CREATE_AFFILIATION.value, name=name, id=entity.business_identifier)
+            )
+        return results
+
+    @staticmethod
+    def _find_bulk_entities(business_identifiers: list[str], sync_colin: bool = False) -> dict:
+        """Return the entity, or the BusinessException to report, by business identifier with one lookup.
+
+        With sync_colin, businesses not loaded in LEAR are created or refreshed from COLIN as create_affiliation does.
+        """
+        entities = {}
+        for entity_model in Entity.find_by_business_identifiers(list(set(business_identifiers))):
+            entities[entity_model.business_identifier] = EntityService(entity_model)
+        for business_identifier in set(business_identifiers):
+            entity = entities.get(business_identifier)
+            try:
+                if sync_colin:
+                    # Identifiers without a digit are turned away before the COLIN lookup, as for one affiliation.
+                    if not any(character.isdigit() for character in business_identifier):
+                        raise BusinessException(Error.INVALID_INPUT, None)
+                    if entity is None or not entity.is_loaded_lear:
+                        entity = EntityService.sync_from_colin(business_identifier) or entity
+                if entity is None:
+                    raise BusinessException(Error.DATA_NOT_FOUND, None)
+                entities[business_identifier] = entity
+            except BusinessException as exception:
+                entities[business_identifier] = exception
+        return entities
+
+    @staticmethod
+    def _bulk_result(business_identifier: str, status: int, exception: BusinessException = None) -> dict:
+        """Return the result of one business of a bulk request."""
+        result = {"businessIdentifier": business_identifier, "status": status}
+        if exception is not None:
+            result.update({"code": exception.code, "message": exception.message})
+        return result
+
     @staticmethod
     def _handle_affiliation_confirmation_email(entity: Entity, affiliation: AffiliationModel):
         """Send affiliation confirmation email to the current user if applicable."""
@@ -488,6 +611,78 @@ class Affiliation:
 
         publish_affiliation_event(QueueMessageTypes.BUSINESS_UNAFFILIATED.value, da.org_id, entity.business_identifier)
 
+    @staticmethod
+    def delete_affiliations(org_id, business_identifiers: list[str], log_delete_draft=False) -> list[dict]:
+        """Delete the affiliations of many businesses from an org, with a result for each.
+
+        Like delete_affiliation for staff, without the passcode reset. Each chunk of BULK_AFFILIATION_CHUNK_SIZE is
+        deleted in one transaction and publishes one unaffiliated event for its businesses.
+        """
+        current_app.logger.info(f"<delete_affiliations org_id:{org_id} count:{len(business_identifiers)}")
+        org = OrgService.find_by_org_id(org_id, allowed_roles=(*CLIENT_AUTH_ROLES, STAFF))
+        if org is None:
+            raise BusinessException(Error.DATA_NOT_FOUND, None)
+
+        results = []
+        for chunk in batched(business_identifiers, current_app.config.get("BULK_AFFILIATION_CHUNK_SIZE", 500)):
+            results.extend(Affiliation._delete_affiliations_chunk(org_id, chunk, log_delete_draft))
+        return results
+
+    @staticmethod
+    def _delete_affiliations_chunk(org_id, business_identifiers: list[str], log_delete_draft: bool) -> list[dict]:
+        """Delete the affiliations of one chunk in one transaction."""
+        entities = Affiliation._find_bulk_entities(business_identifiers)
+        affiliations_by_entity_id = {
+            affiliation.entity_id: affiliation
+            for affiliation in AffiliationModel.find_affiliations_by_org_and_entity_ids(
+                org_id, [entity.identifier for entity in entities.values() if isinstance(entity, EntityService)]
+            )
+        }
+
+        results, deleted = [], {}
+        for business_identifier in business_identifiers:
+            entity = entities[business_identifier]
+            if isinstance(entity, BusinessException):
+                results.append(Affiliation._bulk_result(business_identifier, entity.status_code, entity))
+                continue
+            affiliation = affiliations_by_entity_id.pop(entity.identifier, None)
+            if affiliation is None:
+                exception = BusinessException(Error.DATA_NOT_FOUND, None)
+                results.append(Affiliation._bulk_result(business_identifier, exception.status_code, exception))
+                continue
+            deleted[affiliation.id] = (affiliation, entity)
+            results.append(Affiliation._bulk_result(business_identifier, HTTPStatus.OK))
+
+        for affiliation_invitation in AffiliationInvitationModel.find_invitations_by_affiliations(list(deleted)):
+            db.session.delete(affiliation_invitation)
+        for affiliation, _ in deleted.values():
+            db.session.delete(affiliation)
+        if deleted:
+            db.session.query(Entity).filter(
+                Entity.id.in_([entity.identifier for _, entity in deleted.values()])
+            ).update({Entity.pass_code_claimed: False}, synchronize_session=False)
+        db.session.commit()
+
+        unaffiliated = []
+        for _, entity in deleted.values():
+            if entity.corp_type in [CorpType.RTMP.value, CorpType.TMP.value, CorpType.ATMP.value, CorpType.CTMP.value]:
+                continue
+            # Same as delete_affiliation, NR drafts along the registration path are only logged when asked to.
+            name_request = (
+                entity.status in [NRStatus.DRAFT.value, NRStatus.CONSUMED.value]
+                and entity.corp_type == CorpType.NR.value
+            ) or "NR " in entity.business_identifier
+            if log_delete_draft or not name_request:
+                name = entity.name if len(entity.name) > 0 else entity.business_identifier
+                ActivityLogPublisher.publish_activity(
+                    Activity(org_id, ActivityAction.REMOVE_AFFILIATION.value, name=name, id=entity.business_identifier)
+                )
+            unaffiliated.append(entity.business_identifier)
+
+        if unaffiliated:
+            publish_affiliations_event(QueueMessageTypes.BUSINESS_UNAFFILIATED.value, org_id, unaffiliated)
+        return results
+
     @staticmethod
     @user_context
     def fix_stale_affiliations(org_id: int, entity_details: dict, **kwargs):
@@ -592,65 +787,231 @@ class Affiliation:
         ]
 
     @staticmethod
-    async def get_affiliation_details(
+    def get_affiliation_details(
         affiliation_bases: list[AffiliationBase],
         search_details: AffiliationSearchDetails,
         org_id,
         remove_stale_drafts,
-    ) -> tuple[list, bool]:
-        """Return affiliation details by calling the source api."""
-        url_identifiers = {}  # i.e. turns into { url: [identifiers...] }
-        # Our pagination is already handled at the auth level when not doing a search.
-        if not any([search_details.status, search_details.name, search_details.type, search_details.identifier]):
-            search_details.page = 1
-        search_dict = asdict(search_details)
-        # COLIN businesses have no LEAR record, so they are served from auth data instead of
-        # being sent to LEAR (which would simply drop them from the response).
-        colin_entities = Affiliation._get_colin_entities_not_loaded_in_lear(
-            [affiliation_base.identifier for affiliation_base in affiliation_bases]
+    ) -> tuple[list, bool, list]:
+        """Return affiliation details by calling the source api.
+
+        Unfiltered loads send the identifiers in chunks of AFFILIATION_DETAILS_CHUNK_SIZE per source api, at most
+        AFFILIATION_DETAILS_MAX_PARALLEL at once, each with its own AFFILIATION_DETAILS_CHUNK_TIMEOUT. Chunks that
+        fail are left out and their identifiers returned as missing, only a load where every chunk fails raises.
+        Searches keep one call per source api, as paging and filtering is done by the source api.
+        Only the calls run on the background loop, the database lookups and the token fetch stay on this thread.
+        """
+        is_search, search_dict, colin_entities, identifiers = Affiliation._prepare_affiliation_details(
+            affiliation_bases, search_details
         )
-        colin_identifiers = {entity.business_identifier for entity in colin_entities}
-        for affiliation_base in affiliation_bases:
-            if affiliation_base.identifier in colin_identifiers:
-                continue
-            url = Affiliation._affiliation_details_url(affiliation_base.identifier)
-            url_identifiers.setdefault(url, []).append(affiliation_base.identifier)
-        call_info = [
-            {
-                "url": url,
-                "payload": {
-                    "identifiers": identifiers,
-                    **search_dict,
-                },
-            }
-            for url, identifiers in url_identifiers.items()
-        ]
+        # Unfiltered loads return the details of every identifier, so only those can be served per identifier.
+        use_cache = not is_search and affiliation_details_cache.is_enabled()
+        if use_cache:
+            cached_details, stale_identifiers, identifiers = affiliation_details_cache.lookup(identifiers)
 
         token = RestService.get_service_account_token(
             config_id="ENTITY_SVC_CLIENT_ID",
             config_secret="ENTITY_SVC_CLIENT_SECRET",  # noqa: S106
         )
+        chunk_size, call_options = Affiliation._affiliation_details_call_options(is_search)
+
+        async def fetch_details(identifiers_to_fetch: list[str], failed_calls: list | None = None) -> list:
+            call_info = Affiliation._affiliation_details_call_info(identifiers_to_fetch, search_dict, chunk_size)
+            responses = await RestService.call_posts_in_parallel(call_info, token, org_id, failed_calls, **call_options)
+            if call_info and failed_calls and len(failed_calls) == len(call_info):
+                raise ServiceUnavailableException("No affiliation details returned")
+            return responses
+
+        async def fetch_all(failed_calls: list) -> list:
+            responses = await fetch_details(identifiers, failed_calls)
+            if use_cache:
+                affiliation_details_cache.refresh_in_background(stale_identifiers, fetch_details)
+            return responses
+
         try:
-            responses = await RestService.call_posts_in_parallel(call_info, token, org_id)
+            requested_at = time.time()
+            failed_calls = []
+            responses = background_loop.run(fetch_all(failed_calls))
+            missing_identifiers = [identifier for call in failed_calls for identifier in call["payload"]["identifiers"]]
+            if missing_identifiers:
+                current_app.logger.warning(f"Affiliation details missing for org {org_id}: {missing_identifiers}")
             has_more_apis = any(r.get("hasMore", False) for r in responses if isinstance(r, dict))
+            if use_cache:
+                missing = set(missing_identifiers)
+                fetched = [identifier for identifier in identifiers if identifier not in missing]
+                affiliation_details_cache.store(fetched, responses, requested_at)
+                responses.append(cached_details)
             combined = Affiliation._combine_affiliation_details(responses, remove_stale_drafts)
             combined.extend(Affiliation._get_colin_affiliation_details(colin_entities, search_details))
             combined = Affiliation._sort_affiliations_by_created(combined, affiliation_bases)
 
             Affiliation._handle_affiliation_debug(affiliation_bases, combined)
-            return combined, has_more_apis
+            return combined, has_more_apis, missing_identifiers
         except ServiceUnavailableException as err:
             current_app.logger.debug(err)
             current_app.logger.debug("Failed to get affiliations details:  %s", affiliation_bases)
             raise ServiceUnavailableException("Failed to get affiliation details") from err
 
+    @staticmethod
+    def stream_affiliation_details(
+        affiliation_bases: list[AffiliationBase],
+        search_details: AffiliationSearchDetails,
+        org_id,
+        remove_stale_drafts,
+    ) -> Iterator[dict]:
+        """Return an iterator of affiliation details as the source apis answer, for the NDJSON affiliations response.
+
+        COLIN and cached entities come first, then the businesses and drafts without an NR of each chunk as it
+        arrives. NRs and the entities they merge into follow once every chunk is in. Records are {"entity": {...}}
+        and a last {"summary": {...}} with hasMore and the missing identifiers, entities are not sorted.
+        """
+        is_search, search_dict, colin_entities, identifiers = Affiliation._prepare_affiliation_details(
+            affiliation_bases, search_details
+        )
+        colin_details = Affiliation._get_colin_affiliation_details(colin_entities, search_details)
+        use_cache = not is_search and affiliation_details_cache.is_enabled()
+        stale_identifiers = []
+        results = queue.SimpleQueue()
+        if use_cache:
+            cached_details, stale_identifiers, identifiers = affiliation_details_cache.lookup(identifiers)
+            results.put(([cached_details], []))
+        # Fetched before the first line is written, so a token failure is still an error response.
+        token = RestService.get_service_account_token(
+            config_id="ENTITY_SVC_CLIENT_ID",
+            config_secret="ENTITY_SVC_CLIENT_SECRET",  # noqa: S106
+        )
+        chunk_size, call_options = Affiliation._affiliation_details_call_options(is_search)
+
+        async def fetch_details(identifiers_to_fetch: list[str]) -> list:
+            call_info = Affiliation._affiliation_details_call_info(identifiers_to_fetch, search_dict, chunk_size)
+            return await RestService.call_posts_in_parallel(call_info, token, org_id)
+
+        async def fetch_chunks():
+            limit = asyncio.Semaphore(call_options["max_parallel"])
+
+            async def fetch_chunk(call):
+                async with limit:
+                    failed_calls = []
+                    try:
+                        requested_at = time.time()
+                        responses = await RestService.call_posts_in_parallel(
+                            [call], token, org_id, failed_calls, timeout=call_options["timeout"]
+                        )
+                        if use_cache and not failed_calls:
+                            affiliation_details_cache.store(call["payload"]["identifiers"], responses, requested_at)
+                    except Exception as e:  # NOQA # pylint: disable=broad-except
+                        current_app.logger.warning(f"Affiliation details chunk failed for org {org_id}: {e}")
+                        responses, failed_calls = [], [call]
+                    results.put((responses, failed_calls))
+
+            try:
+                if use_cache:
+                    affiliation_details_cache.refresh_in_background(stale_identifiers, fetch_details)
+                call_info = Affiliation._affiliation_details_call_info(identifiers, search_dict, chunk_size)
+                await asyncio.gather(*[fetch_chunk(call) for call in call_info])
+            finally:
+                results.put(None)
+
+        def stream():
+            for entity in colin_details:
+                yield {"entity": entity}
+            future = background_loop.submit(fetch_chunks())
+            # Entities with an NR are held back, their NR may only arrive with a later chunk.
+            held = {"businessEntities": [], "draftEntities": [], "requests": []}
+            has_more, missing_identifiers = False, []
+            try:
+                while (result := results.get()) is not None:
+                    responses, failed_calls = result
+                    missing_identifiers.extend(
+                        identifier for call in failed_calls for identifier in call["payload"]["identifiers"]
+                    )
+                    for response in responses:
+                        held["requests"].extend(Affiliation._extract_name_requests(response)["requests"])
+                        if not isinstance(response, dict):
+                            continue
+                        has_more = has_more or response.get("hasMore", False)
+                        for entities_key in ("businessEntities", "draftEntities"):
+                            for entity in response.get(entities_key) or []:
+                                if entity.get("nrNumber"):
+                                    held[entities_key].append(entity)
+                                else:
+                                    yield {"entity": entity}
+            finally:
+                # Stops the outstanding chunks when the client goes away mid stream.
+                future.cancel()
+
+            if missing_identifiers:
+                current_app.logger.warning(f"Affiliation details missing for org {org_id}: {missing_identifiers}")
+            for entity in Affiliation._combine_affiliation_details([held], remove_stale_drafts):
+                yield {"entity": entity}
+            yield {"summary": {"hasMore": has_more, "missingIdentifiers": missing_identifiers}}
+
+        return stream()
+
+    @staticmethod
+    def _prepare_affiliation_details(affiliation_bases: list[AffiliationBase], search_details):
+        """Return if this is a search, the search payload, the COLIN entities and the identifiers to look up."""
+        is_search = any([search_details.status, search_details.name, search_details.type, search_details.identifier])
+        # Our pagination is already handled at the auth level when not doing a search.
+        if not is_search:
+            search_details.page = 1
+        search_dict = asdict(search_details)
+        # The cursor pages the auth rows, the source apis only page searches.
+        search_dict.pop("cursor", None)
+        # COLIN businesses have no LEAR record, so they are served from auth data instead of
+        # being sent to LEAR (which would simply drop them from the response).
+        colin_entities = Affiliation._get_colin_entities_not_loaded_in_lear(
+            [affiliation_base.identifier for affiliation_base in affiliation_bases]
+        )
+        colin_identifiers = {entity.business_identifier for entity in colin_entities}
+        identifiers = [
+            affiliation_base.identifier
+            for affiliation_base in affiliation_bases
+            if affiliation_base.identifier not in colin_identifiers
+        ]
+        return is_search, search_dict, colin_entities, identifiers
+
+    @staticmethod
+    def _affiliation_details_call_options(is_search: bool) -> tuple[int | None, dict]:
+        """Return the chunk size and the call_posts_in_parallel options for affiliation details calls."""
+        config = current_app.config
+        chunk_size = None if is_search else config.get("AFFILIATION_DETAILS_CHUNK_SIZE", 250)
+        call_options = {
+            "max_parallel": config.get("AFFILIATION_DETAILS_MAX_PARALLEL", 4),
+            "timeout": config.get("AFFILIATION_DETAILS_CHUNK_TIMEOUT", 20),
+        }
+        return chunk_size, call_options
+
+    @staticmethod
+    def _affiliation_details_call_info(
+        identifiers: list[str], search_dict: dict, chunk_size: int | None = None
+    ) -> list[dict]:
+        """Group the identifiers into details calls per source api, of at most chunk_size identifiers each."""
+        url_identifiers = {}  # i.e. turns into { url: [identifiers...] }
+        for identifier in identifiers:
+            url = Affiliation._affiliation_details_url(identifier)
+            url_identifiers.setdefault(url, []).append(identifier)
+        return [
+            {
+                "url": url,
+                "payload": {
+                    "identifiers": list(chunk),
+                    **search_dict,
+                },
+            }
+            for url, url_identifier_list in url_identifiers.items()
+            for chunk in batched(url_identifier_list, chunk_size or len(url_identifier_list))
+        ]
+
     @staticmethod
     def _sort_affiliations_by_created(combined: list, affiliation_bases: list) -> list:
         """Sort affiliations by created date."""
-        ordered = {
-            affiliation.identifier: affiliation.created
-            for affiliation in sorted(affiliation_bases, key=lambda x: x.created, reverse=True)
-        }
+        # Earliest created date per identifier, duplicates are rare so this is a single pass instead of a sort.
+        ordered = {}
+        for affiliation in affiliation_bases:
+            created = ordered.get(affiliation.identifier)
+            if created is None or affiliation.created < created:
+                ordered[affiliation.identifier] = affiliation.created
 
         def sort_key(item):
             return ordered.get(
@@ -726,27 +1087,36 @@ class Affiliation:
         return business
 
     @staticmethod
-    def _process_nr_for_business(business, name_requests, drafts):
-        """Process NR for a business entity."""
+    def _process_nr_for_business(business, name_requests) -> bool:
+        """Attach the NR to a business entity, return True if the business had an NR in the response."""
         nr_num = business["nrNumber"]
-        if nr_num in name_requests:
-            business["nameRequest"] = name_requests[nr_num]["nameRequest"]
-            business = Affiliation._update_draft_type_for_amalgamation_nr(business)
-            if business["nameRequest"]["stateCd"] == NRStatus.CONSUMED.value:
-                drafts.remove(business)
-            del name_requests[nr_num]
-            return True
-        return False
+        if (name_request := name_requests.pop(nr_num, None)) is None:
+            return False
+        business["nameRequest"] = name_request["nameRequest"]
+        Affiliation._update_draft_type_for_amalgamation_nr(business)
+        return True
 
     @staticmethod
     def _combine_nrs(name_requests, businesses, drafts, remove_stale_drafts=True):
-        """Combine NRs with the business and draft entities."""
-        for business in drafts + businesses:
-            if "nrNumber" in business and business["nrNumber"]:
-                processed = Affiliation._process_nr_for_business(business, name_requests, drafts)
-                if not processed and remove_stale_drafts and business in drafts:
-                    drafts.remove(business)
-        return list(name_requests.values()) + drafts + businesses
+        """Combine NRs with the business and draft entities.
+
+        Single pass over drafts then businesses, NRs are looked up by number and dropped drafts are tracked by
+        position, the result keeps the order: unmatched NRs, remaining drafts, businesses.
+        """
+        kept_drafts = []
+        for draft in drafts:
+            if not draft.get("nrNumber"):
+                kept_drafts.append(draft)
+            elif Affiliation._process_nr_for_business(draft, name_requests):
+                # A consumed NR means the draft has been filed, the business entity is returned instead.
+                if draft["nameRequest"]["stateCd"] != NRStatus.CONSUMED.value:
+                    kept_drafts.append(draft)
+            elif not remove_stale_drafts:
+                kept_drafts.append(draft)
+        for business in businesses:
+            if business.get("nrNumber"):
+                Affiliation._process_nr_for_business(business, name_requests)
+        return list(name_requests.values()) + kept_drafts + businesses
 
     @staticmethod
     def _combine_affiliation_details(details, remove_stale_drafts=True):
@@ -15,6 +15,7 @@
 
 from dataclasses import fields
 from datetime import UTC, datetime
+from functools import cache
 from urllib.parse import urlencode
 
 from flask import current_app
@@ -53,6 +54,7 @@ from auth_api.utils.enums import (
     AccessType,
     AffiliationInvitationAction,
     AffiliationInvitationType,
+    EntityLoad,
     InvitationStatus,
     LoginSource,
     QueueMessageType,
@@ -69,6 +71,12 @@ ENV = Environment(loader=FileSystemLoader("."), autoescape=True)
 CONFIG = get_named_config()
 
 
+@cache
+def _dataclass_field_names(dataclass) -> tuple[str, ...]:
+    """Return the field names of a dataclass, looked up once per class."""
+    return tuple(field.name for field in fields(dataclass))
+
+
 class AffiliationInvitation:
     """Manages Affiliation Invitation data.
 
@@ -107,17 +115,28 @@ class AffiliationInvitation:
         if not affiliation_invitation_dicts:
             return []
 
+        business_identifiers = list(dict.fromkeys(afi["business_identifier"] for afi in affiliation_invitation_dicts))
         business_entities = AffiliationInvitation._get_multiple_business_details(
-            business_identifiers=[afi["business_identifier"] for afi in affiliation_invitation_dicts],
+            business_identifiers=business_identifiers,
             token=RestService.get_service_account_token(
                 config_id="ENTITY_SVC_CLIENT_ID",
                 config_secret="ENTITY_SVC_CLIENT_SECRET",  # noqa: S106
             ),
         )
+        business_entities_by_identifier = {}
+        for business_entity in business_entities:
+            business_entities_by_identifier.setdefault(business_entity["identifier"], business_entity)
+        # Businesses legal-api doesn't know about are served from auth in one query, not one per invitation.
+        entity_models_by_identifier = {
+            entity_model.business_identifier: entity_model
+            for entity_model in EntityModel.find_by_business_identifiers(
+                [identifier for identifier in business_identifiers if identifier not in business_entities_by_identifier]
+            )
+        }
         result = []
 
         def _init_dict_for_dataclass_from_dict(dataclass, initial_dict: dict):
-            return {field.name: initial_dict.get(field.name) for field in fields(dataclass)}
+            return {field_name: initial_dict.get(field_name) for field_name in _dataclass_field_names(dataclass)}
 
         for affiliation_invitation_dict in affiliation_invitation_dicts:
             from_org = AffiliationInvitationData.OrgDetails(
@@ -132,14 +151,7 @@ class AffiliationInvitation:
             else:
                 to_org = None
 
-            business_entity = next(
-                (
-                    be
-                    for be in business_entities
-                    if affiliation_invitation_dict["business_identifier"] == be["identifier"]
-                ),
-                None,
-            )
+            business_entity = business_entities_by_identifier.get(affiliation_invitation_dict["business_identifier"])
 
             entity_details = None
             if business_entity:
@@ -160,9 +172,7 @@ class AffiliationInvitation:
                     corp_sub_type=business_entity.get("legalSubType", None),
                 )
             elif (
-                entity_model := EntityModel.find_by_business_identifier(
-                    affiliation_invitation_dict["business_identifier"]
-                )
+                entity_model := entity_models_by_identifier.get(affiliation_invitation_dict["business_identifier"])
             ) and not entity_model.is_loaded_lear:
                 # a business not loaded in LEAR (eg. still managed in COLIN) can't be enriched
                 # from legal-api - serve the auth entity data instead of a null entity
@@ -231,7 +241,9 @@ class AffiliationInvitation:
             raise BusinessException(Error.DATA_NOT_FOUND, None)
 
         # COLIN businesses are created in auth on demand, and refreshed on every affiliation to prevent stale data
-        entity = EntityService.find_by_business_identifier(business_identifier, skip_auth=True)
+        entity = EntityService.find_by_business_identifier(
+            business_identifier, skip_auth=True, load=EntityLoad.AUTHORIZATION
+        )
         if (
             business_identifier
             and (entity is None or not entity.is_loaded_lear)
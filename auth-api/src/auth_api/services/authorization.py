@@ -21,6 +21,7 @@ from flask import abort, current_app
 from auth_api.models.views.authorization import Authorization as AuthorizationView
 from auth_api.services.account_linking_key import AccountLinkingKey as LinkingKeyService
 from auth_api.services.permissions import Permissions as PermissionsService
+from auth_api.utils.authorization_cache import authorization_cache
 from auth_api.utils.enums import ProductTypeCode as ProductTypeCodeEnum
 from auth_api.utils.roles import STAFF, Role
 from auth_api.utils.user_context import UserContext, user_context
@@ -51,7 +52,9 @@ class Authorization:
         if any(role in [Role.STAFF.value, Role.EXTERNAL_STAFF_READONLY.value] for role in token_roles):
             if expanded:
                 # Query Authorization view by business identifier
-                auth = AuthorizationView.find_authorization_for_admin_by_org_id(account_id)
+                auth = authorization_cache.find(
+                    AuthorizationView.find_authorization_for_admin_by_org_id, org_id=account_id
+                )
                 auth_response = Authorization(auth).as_dict(expanded)
             auth_response["roles"] = token_roles
 
@@ -62,18 +65,29 @@ class Authorization:
             check_product_based_auth = Authorization._is_product_based_auth(corp_type_code)
             if check_product_based_auth:
                 if account_id_claim:
-                    auth = AuthorizationView.find_account_authorization_by_org_id_and_product(
-                        account_id_claim, corp_type_code
+                    auth = authorization_cache.find(
+                        AuthorizationView.find_account_authorization_by_org_id_and_product,
+                        org_id=account_id_claim,
+                        product=corp_type_code,
                     )
                 else:
-                    auth = AuthorizationView.find_account_authorization_by_org_id_and_product_for_user(
-                        keycloak_guid, account_id, corp_type_code
+                    auth = authorization_cache.find(
+                        AuthorizationView.find_account_authorization_by_org_id_and_product_for_user,
+                        keycloak_guid=keycloak_guid,
+                        org_id=account_id,
+                        product=corp_type_code,
                     )
             else:
                 if account_id_claim and account_id == int(account_id_claim):
-                    auth = AuthorizationView.find_authorization_for_admin_by_org_id(account_id_claim)
+                    auth = authorization_cache.find(
+                        AuthorizationView.find_authorization_for_admin_by_org_id, org_id=account_id_claim
+                    )
                 elif account_id and keycloak_guid:
-                    auth = AuthorizationView.find_user_authorization_by_org_id(keycloak_guid, account_id)
+                    auth = authorization_cache.find(
+                        AuthorizationView.find_user_authorization_by_org_id,
+                        keycloak_guid=keycloak_guid,
+                        org_id=account_id,
+                    )
             auth_response["roles"] = []
             if auth:
                 permissions = PermissionsService.get_permissions_for_membership(auth.status_code, auth.org_membership)
@@ -94,7 +108,11 @@ class Authorization:
         if Role.STAFF.value in token_roles:
             if expanded:
                 # Query Authorization view by business identifier
-                auth = AuthorizationView.find_user_authorization_by_business_number(business_identifier, is_staff=True)
+                auth = authorization_cache.find(
+                    AuthorizationView.find_user_authorization_by_business_number,
+                    business_identifier=business_identifier,
+                    is_staff=True,
+                )
                 auth_response = Authorization(auth).as_dict(expanded)
             auth_response["roles"] = token_roles
 
@@ -102,8 +120,10 @@ class Authorization:
             # a service account in keycloak should have product_code claim setup.
             keycloak_product_code = user_from_context.token_info.get("product_code", None)
             if keycloak_product_code:
-                auth = AuthorizationView.find_user_authorization_by_business_number_and_product(
-                    business_identifier, keycloak_product_code
+                auth = authorization_cache.find(
+                    AuthorizationView.find_user_authorization_by_business_number_and_product,
+                    business_identifier=business_identifier,
+                    product_code=keycloak_product_code,
                 )
                 if auth:
                     auth_response = Authorization(auth).as_dict(expanded)
@@ -123,13 +143,15 @@ class Authorization:
 
                 # With a linking key the caller isn't a member of the source org, so omit keycloak_guid
                 if keycloak_guid := (user_from_context.sub if not payment_account_id else None):
-                    auth = AuthorizationView.find_user_authorization_by_business_number(
+                    auth = authorization_cache.find(
+                        AuthorizationView.find_user_authorization_by_business_number,
                         business_identifier=business_identifier,
                         keycloak_guid=keycloak_guid,
                         org_id=business_access_org_id,
                     )
                 else:
-                    auth = AuthorizationView.find_user_authorization_by_business_number(
+                    auth = authorization_cache.find(
+                        AuthorizationView.find_user_authorization_by_business_number,
                         business_identifier=business_identifier,
                         org_id=business_access_org_id,
                     )
@@ -143,6 +165,72 @@ class Authorization:
 
         return auth_response
 
+    @staticmethod
+    @user_context
+    def get_user_authorizations_for_entities(business_identifiers: list[str], expanded: bool = False, **kwargs):
+        """Get User authorizations for many entities, keyed by business identifier.
+
+        Applies the same rules as get_user_authorizations_for_entity, but resolves every identifier with one query.
+        """
+        user_from_context: UserContext = kwargs["user_context"]
+        token_roles = user_from_context.roles
+        business_identifiers = list(dict.fromkeys(identifier for identifier in business_identifiers if identifier))
+        payment_account_id = None
+        membership_override = None
+        auths = {}
+
+        if Role.STAFF.value in token_roles:
+            if expanded:
+                auths = AuthorizationView.find_user_authorizations_by_business_numbers(
+                    business_identifiers, is_staff=True
+                )
+            return {
+                identifier: {
+                    **(Authorization(auths.get(identifier)).as_dict(expanded) if expanded else {}),
+                    "roles": token_roles,
+                }
+                for identifier in business_identifiers
+            }
+
+        if Role.SYSTEM.value in token_roles:
+            # a service account in keycloak should have product_code claim setup.
+            if keycloak_product_code := user_from_context.token_info.get("product_code", None):
+                auths = AuthorizationView.find_user_authorizations_by_business_numbers_and_product(
+                    business_identifiers, keycloak_product_code
+                )
+            membership_override = "SYSTEM"
+        elif business_identifiers:
+            business_access_org_id = user_from_context.account_id
+            if (linking_key := user_from_context.linking_key) and user_from_context.account_id:
+                linked = LinkingKeyService.validate(linking_key, user_from_context.account_id)
+                if not linked:
+                    abort(403)
+                business_access_org_id = linked.account_id
+                payment_account_id = linked.vendor_account_id  # vendor (e.g. ALF) pays
+
+            # With a linking key the caller isn't a member of the source org, so omit keycloak_guid
+            auths = AuthorizationView.find_user_authorizations_by_business_numbers(
+                business_identifiers,
+                keycloak_guid=user_from_context.sub if not payment_account_id else None,
+                org_id=business_access_org_id,
+            )
+
+        # Most entities share an org, so permissions are resolved once per (status, membership) pair.
+        permissions = {}
+        response = {}
+        for identifier in business_identifiers:
+            if (auth := auths.get(identifier)) is None:
+                response[identifier] = {}
+                continue
+            key = (auth.status_code, membership_override or auth.org_membership)
+            if key not in permissions:
+                permissions[key] = PermissionsService.get_permissions_for_membership(*key)
+            response[identifier] = {
+                **Authorization(auth).as_dict(expanded, payment_account_id=payment_account_id),
+                "roles": permissions[key],
+            }
+        return response
+
     @staticmethod
     def get_user_authorizations(keycloak_guid: str):
         """Get all user authorizations."""
@@ -161,10 +249,17 @@ class Authorization:
         user_from_context: UserContext = kwargs["user_context"]
         account_id_claim = user_from_context.account_id
         if account_id_claim:
-            auth = AuthorizationView.find_account_authorization_by_org_id_and_product(account_id_claim, product_code)
+            auth = authorization_cache.find(
+                AuthorizationView.find_account_authorization_by_org_id_and_product,
+                org_id=account_id_claim,
+                product=product_code,
+            )
         else:
-            auth = AuthorizationView.find_account_authorization_by_org_id_and_product_for_user(
-                user_from_context.sub, account_id, product_code
+            auth = authorization_cache.find(
+                AuthorizationView.find_account_authorization_by_org_id_and_product_for_user,
+                keycloak_guid=user_from_context.sub,
+                org_id=account_id,
+                product=product_code,
             )
         auth_response = Authorization(auth).as_dict(expanded)
         auth_response["roles"] = []
@@ -223,7 +318,9 @@ def is_competent_authority_or_external_staff(**kwargs) -> bool:
     if account_id is None:
         return False
 
-    authorization = AuthorizationView.find_account_authorization_by_org_id_and_product(account_id, "CA_SEARCH")
+    authorization = authorization_cache.find(
+        AuthorizationView.find_account_authorization_by_org_id_and_product, org_id=account_id, product="CA_SEARCH"
+    )
 
     return authorization is not None
 
@@ -264,9 +361,15 @@ def check_auth(**kwargs):
             if user_from_context.account_id_claim and int(user_from_context.account_id_claim) == kwargs.get(
                 "org_id", None
             ):
-                auth_record = AuthorizationView.find_authorization_for_admin_by_org_id(user_from_context.account_id)
+                auth_record = authorization_cache.find(
+                    AuthorizationView.find_authorization_for_admin_by_org_id, org_id=user_from_context.account_id
+                )
             else:
-                auth_record = AuthorizationView.find_user_authorization_by_org_id(user_from_context.sub, org_identifier)
+                auth_record = authorization_cache.find(
+                    AuthorizationView.find_user_authorization_by_org_id,
+                    keycloak_guid=user_from_context.sub,
+                    org_id=org_identifier,
+                )
             auth = Authorization(auth_record).as_dict() if auth_record else None
 
         _check_for_roles(auth.get("orgMembership", None) if auth else None, kwargs)
@@ -28,6 +28,8 @@ from auth_api.models.db import db
 from auth_api.models.entity import Entity as EntityModel
 from auth_api.schemas import EntitySchema
 from auth_api.utils.account_mailer import publish_to_mailer
+from auth_api.utils.affiliation_details_cache import affiliation_details_cache
+from auth_api.utils.enums import EntityLoad
 from auth_api.utils.passcode import passcode_hash
 from auth_api.utils.roles import ALL_ALLOWED_ROLES
 from auth_api.utils.user_context import UserContext, user_context
@@ -103,12 +105,16 @@ class Entity:
 
     @classmethod
     def find_by_business_identifier(
-        cls, business_identifier: str = None, allowed_roles: tuple = None, skip_auth: bool = False
+        cls,
+        business_identifier: str = None,
+        allowed_roles: tuple = None,
+        skip_auth: bool = False,
+        load: EntityLoad = EntityLoad.MINIMAL,
     ):
         """Given a business identifier, this will return the corresponding entity or None."""
         if not business_identifier:
             return None
-        entity_model = EntityModel.find_by_business_identifier(business_identifier)
+        entity_model = EntityModel.find_by_business_identifier(business_identifier, load=load)
 
         if not entity_model:
             return None
@@ -137,7 +143,9 @@ class Entity:
         if not entity_info:
             return None
 
-        existing_entity = EntityModel.find_by_business_identifier(entity_info["businessIdentifier"])
+        existing_entity = EntityModel.find_by_business_identifier(
+            entity_info["businessIdentifier"], load=EntityLoad.AFFILIATIONS
+        )
         if existing_entity is None:
             entity_model = EntityModel.create_from_dict(entity_info)
         else:
@@ -146,6 +154,7 @@ class Entity:
             existing_entity.update_from_dict(**camelback2snake(entity_info))
             entity_model = existing_entity
             entity_model.commit()
+        affiliation_details_cache.invalidate([entity_model.business_identifier])
 
         entity = Entity(entity_model)
         return entity
@@ -222,7 +231,7 @@ class Entity:
         user_from_context: UserContext = kwargs["user_context"]
         if not user_from_context.is_system():
             check_auth(one_of_roles=ALL_ALLOWED_ROLES, business_identifier=business_identifier)
-        entity = EntityModel.find_by_business_identifier(business_identifier)
+        entity = EntityModel.find_by_business_identifier(business_identifier, load=EntityLoad.AFFILIATIONS)
         if entity is None or entity.corp_type_code is None:
             raise BusinessException(Error.DATA_NOT_FOUND, None)
         if user_from_context.is_system():
@@ -236,6 +245,7 @@ class Entity:
 
         entity.update_from_dict(**camelback2snake(entity_info))
         entity.commit()
+        affiliation_details_cache.invalidate(list({business_identifier, entity.business_identifier}))
 
         entity = Entity(entity)
         return entity
@@ -247,7 +257,7 @@ class Entity:
         user_from_context: UserContext = kwargs["user_context"]
         check_auth(one_of_roles=ALL_ALLOWED_ROLES, business_identifier=business_identifier)
         current_app.logger.debug("reset passcode")
-        entity: EntityModel = EntityModel.find_by_business_identifier(business_identifier)
+        entity: EntityModel = EntityModel.find_by_business_identifier(business_identifier, load=EntityLoad.AFFILIATIONS)
         # generate passcode and set
         new_pass_code = "".join(secrets.choice(string.digits) for i in range(9))
 
@@ -13,17 +13,25 @@
 # limitations under the License.
 """Service for managing Affiliation Mapping data."""
 
+import base64
+import math
+from datetime import datetime
+from itertools import batched
+
+import orjson
 from flask import current_app
 from requests import HTTPError
-from sqlalchemy import and_, case, func, or_, select
-from sqlalchemy.dialects.postgresql import array
+from sqlalchemy import and_, or_
 
+from auth_api.exceptions import BusinessException
+from auth_api.exceptions.errors import Error
 from auth_api.models import db
-from auth_api.models.affiliation import Affiliation as AffiliationModel
 from auth_api.models.dataclass import AffiliationBase, AffiliationSearchDetails
 from auth_api.models.entity import Entity
 from auth_api.models.entity_mapping import EntityMapping
+from auth_api.models.org_affiliation_rollup import OrgAffiliationRollup
 from auth_api.services.rest_service import RestService
+from auth_api.utils.background_loop import background_loop
 from auth_api.utils.user_context import UserContext, user_context
 
 
@@ -54,137 +62,53 @@ class EntityMappingService:
             - but if this bad data shows up Org 1 would have business, Org 2 would have NR (without affiliation)
             - EG. For Temp Org 1, NR Org2
             - Temp would show on Org 1, NR would show on Org2
-        """
-        org_id = int(org_id or -1)
-
-        affiliated_identifiers_cte = (
-            db.session.query(Entity.business_identifier)
-            .join(AffiliationModel, AffiliationModel.entity_id == Entity.id)
-            .filter(AffiliationModel.org_id == org_id)
-            .cte("affiliated_identifiers")
-        )
-
-        filtered_mappings = (
-            db.session.query(EntityMapping)
-            .filter(
-                or_(
-                    EntityMapping.business_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier)),
-                    EntityMapping.bootstrap_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier)),
-                    EntityMapping.nr_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier)),
-                ),
-                or_(
-                    EntityMapping.business_identifier.is_(None),
-                    EntityMapping.business_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier)),
-                ),
-            )
-            .subquery()
-        )
-
-        business_in_org = filtered_mappings.c.business_identifier.in_(
-            select(affiliated_identifiers_cte.c.business_identifier)
-        )
-        bootstrap_in_org = filtered_mappings.c.bootstrap_identifier.in_(
-            select(affiliated_identifiers_cte.c.business_identifier)
-        )
-        nr_in_org = filtered_mappings.c.nr_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier))
 
-        paired_nrs_cte = (
-            db.session.query(filtered_mappings.c.nr_identifier)
-            .filter(
-                filtered_mappings.c.bootstrap_identifier.isnot(None),
-                filtered_mappings.c.nr_identifier.isnot(None),
-                filtered_mappings.c.bootstrap_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier)),
-                filtered_mappings.c.nr_identifier.in_(select(affiliated_identifiers_cte.c.business_identifier)),
-            )
-            .cte("paired_nrs")
-        )
-
-        identifiers_case = case(
-            # Business identifier takes priority
-            (business_in_org, array([filtered_mappings.c.business_identifier])),
-            # TEMP + NR both in org
-            (
-                and_(bootstrap_in_org, nr_in_org),
-                array([filtered_mappings.c.bootstrap_identifier, filtered_mappings.c.nr_identifier]),
-            ),
-            # TEMP only in org
-            (bootstrap_in_org, array([filtered_mappings.c.bootstrap_identifier])),
-            # NR only in org (but exclude if this NR is already part of a TEMP+NR pair)
-            (
-                and_(
-                    nr_in_org,
-                    or_(filtered_mappings.c.bootstrap_identifier.is_(None), ~bootstrap_in_org),
-                    filtered_mappings.c.nr_identifier.not_in(select(paired_nrs_cte.c.nr_identifier)),
-                ),
-                array([filtered_mappings.c.nr_identifier]),
-            ),
-            else_=func.cast(array([]), db.ARRAY(db.String)),
-        ).label("identifiers")
-
-        created_date_case = case(
-            (filtered_mappings.c.business_identifier == Entity.business_identifier, AffiliationModel.created),
-            (filtered_mappings.c.bootstrap_identifier == Entity.business_identifier, AffiliationModel.created),
-            (filtered_mappings.c.nr_identifier == Entity.business_identifier, AffiliationModel.created),
-        ).label("created_on")
-
-        row_number_column = (
-            func.row_number().over(partition_by=identifiers_case, order_by=created_date_case.desc()).label("row_number")
-        )
-
-        complete_mappings_cte = (
-            db.session.query(filtered_mappings.c.nr_identifier)
-            .join(Entity, Entity.business_identifier == filtered_mappings.c.business_identifier)
-            .join(AffiliationModel, AffiliationModel.entity_id == Entity.id)
-            .filter(
-                filtered_mappings.c.business_identifier.isnot(None),
-                filtered_mappings.c.bootstrap_identifier.isnot(None),
-                filtered_mappings.c.nr_identifier.isnot(None),
-                AffiliationModel.org_id == org_id,
-            )
-            .cte("complete_mappings")
-        )
-
-        subq = (
-            db.session.query(identifiers_case, created_date_case, row_number_column)
-            .select_from(filtered_mappings)
-            .join(
-                Entity,
-                or_(
-                    filtered_mappings.c.business_identifier == Entity.business_identifier,
-                    filtered_mappings.c.bootstrap_identifier == Entity.business_identifier,
-                    filtered_mappings.c.nr_identifier == Entity.business_identifier,
-                ),
+        The rows are precomputed per org in org_affiliation_rollups whenever affiliations or entity mappings change.
+        Pages continue from search_details.cursor when it is set, so a deep page costs the same as the first one.
+        """
+        # For search we need all identifiers, the filtering is done in LEAR and NAMES.
+        if any([search_details.identifier, search_details.status, search_details.name, search_details.type]):
+            return OrgAffiliationRollup.find_by_org_id(org_id), False
+
+        if search_details.cursor:
+            data = OrgAffiliationRollup.find_by_org_id(
+                org_id,
+                limit=search_details.limit + 1,
+                after=EntityMappingService.decode_cursor(search_details.cursor),
             )
-            .join(AffiliationModel, AffiliationModel.entity_id == Entity.id)
-            .filter(
-                AffiliationModel.org_id == org_id,
-                or_(
-                    filtered_mappings.c.business_identifier.isnot(None),
-                    filtered_mappings.c.nr_identifier.is_(None),
-                    filtered_mappings.c.nr_identifier.not_in(select(complete_mappings_cte.c.nr_identifier)),
-                ),
-                identifiers_case != func.cast(array([]), db.ARRAY(db.String)),
+        else:
+            data = OrgAffiliationRollup.find_by_org_id(
+                org_id,
+                limit=search_details.limit + 1,
+                offset=(search_details.page - 1) * search_details.limit,
             )
-        ).subquery()
+        return data[: search_details.limit], len(data) > search_details.limit
 
-        query = (
-            db.session.query(subq.c.identifiers, subq.c.created_on)
-            .filter(subq.c.row_number == 1)
-            .order_by(subq.c.created_on.desc())
-        )
-        # For search we need all identifiers, the filtering is done in LEAR and NAMES.
-        if not any([search_details.identifier, search_details.status, search_details.name, search_details.type]):
-            query = query.offset((search_details.page - 1) * search_details.limit).limit(search_details.limit + 1)
-            data = query.all()
-            return data[: search_details.limit], len(data) > search_details.limit
+    @staticmethod
+    def encode_cursor(row) -> str:
+        """Return the cursor for the page that starts after this (identifiers, created_on) row."""
+        identifiers, created_on = row
+        value = orjson.dumps([created_on.isoformat() if created_on else None, identifiers])
+        return base64.urlsafe_b64encode(value).decode("utf-8")
 
-        data = query.all()
-        return data, False
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime | None, list[str]]:
+        """Return the (created_on, identifiers) a cursor points after, created_on is None for an undated row."""
+        try:
+            created_on, identifiers = orjson.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+            created_on = datetime.fromisoformat(created_on) if created_on is not None else None
+            return created_on, [str(identifier) for identifier in identifiers]
+        except (ValueError, TypeError) as e:
+            raise BusinessException(Error.INVALID_INPUT, e) from e
 
     @staticmethod
     def populate_affiliation_base(org_id: int, search_details: AffiliationSearchDetails):
-        """Get entity details from the database and expand multiple identifiers into separate rows."""
+        """Get entity details from the database and expand multiple identifiers into separate rows.
+
+        Also returns if there are more pages, and the cursor of the next page when there are.
+        """
         data, has_more = EntityMappingService.paginate_from_affiliations(org_id, search_details)
+        next_cursor = EntityMappingService.encode_cursor(data[-1]) if has_more and data else None
 
         affiliation_bases = [
             AffiliationBase(identifier=identifier, created=created)
@@ -204,7 +128,7 @@ class EntityMappingService:
             current_app.logger.debug(f"NR identifiers ({len(nr_identifiers)}): {', '.join(nr_identifiers)}")
             current_app.logger.debug(f"Other identifiers ({len(other_identifiers)}): {', '.join(other_identifiers)}")
 
-        return affiliation_bases, has_more
+        return affiliation_bases, has_more, next_cursor
 
     @staticmethod
     def _is_duplicate_mapping(nr_identifier: str, bootstrap_identifier: str, business_identifier: str) -> bool:
@@ -227,6 +151,21 @@ class EntityMappingService:
 
         Returns True if the mapping was updated, False otherwise.
         """
+        should_update = EntityMappingService._fill_mapping(
+            existing_mapping, nr_identifier, bootstrap_identifier, business_identifier
+        )
+        if should_update:
+            existing_mapping.save()
+        return should_update
+
+    @staticmethod
+    def _fill_mapping(
+        existing_mapping: EntityMapping | None, nr_identifier: str, bootstrap_identifier: str, business_identifier: str
+    ) -> bool:
+        """Fill in the identifiers an existing mapping is missing, without saving it.
+
+        Returns True if the mapping was changed, False otherwise.
+        """
         if existing_mapping is None:
             return False
         should_update = False
@@ -247,7 +186,6 @@ class EntityMappingService:
                 f"bootstrap_identifier: {bootstrap_identifier}, "
                 f"nr_identifier: {nr_identifier}"
             )
-            existing_mapping.save()
         return should_update
 
     @staticmethod
@@ -256,47 +194,49 @@ class EntityMappingService:
 
         Each case ensures that other identifiers are None to prevent partial matches.
         """
-        # Full business
-        if all([nr_identifier, bootstrap_identifier, business_identifier]):
+        mapping_key = EntityMappingService._mapping_key(nr_identifier, bootstrap_identifier, business_identifier)
+        if mapping_key is None:
             return [
-                EntityMapping.nr_identifier == nr_identifier,
-                EntityMapping.bootstrap_identifier == bootstrap_identifier,
-                EntityMapping.business_identifier.is_(None),
+                EntityMapping.id == -1,
             ]
+        return [
+            getattr(EntityMapping, column) == value if value else getattr(EntityMapping, column).is_(None)
+            for column, value in mapping_key.items()
+        ]
+
+    @staticmethod
+    def _mapping_key(nr_identifier: str, bootstrap_identifier: str, business_identifier: str) -> dict | None:
+        """Return the identifiers an existing mapping must have to be filled in, None is a missing identifier.
+
+        Returns None for an identifier combination that can't happen.
+        """
+        # Full business
+        if all([nr_identifier, bootstrap_identifier, business_identifier]):
+            return {
+                "nr_identifier": nr_identifier,
+                "bootstrap_identifier": bootstrap_identifier,
+                "business_identifier": None,
+            }
         # Numbered business or bootstrap only numbered business
         elif all([bootstrap_identifier, business_identifier]) or (
             bootstrap_identifier and not nr_identifier and not business_identifier
         ):
-            return [
-                EntityMapping.nr_identifier.is_(None),
-                EntityMapping.bootstrap_identifier == bootstrap_identifier,
-                EntityMapping.business_identifier.is_(None),
-            ]
+            return {"nr_identifier": None, "bootstrap_identifier": bootstrap_identifier, "business_identifier": None}
         # NR and Bootstrap or just NR
         elif all([nr_identifier, bootstrap_identifier]) or (
             nr_identifier and not bootstrap_identifier and not business_identifier
         ):
-            return [
-                EntityMapping.nr_identifier == nr_identifier,
-                EntityMapping.business_identifier.is_(None),
-                EntityMapping.bootstrap_identifier.is_(None),
-            ]
+            return {"nr_identifier": nr_identifier, "bootstrap_identifier": None, "business_identifier": None}
         # Business only, could be from COLIN
         elif business_identifier and (not nr_identifier and not bootstrap_identifier):
-            return [
-                EntityMapping.nr_identifier.is_(None),
-                EntityMapping.bootstrap_identifier.is_(None),
-                EntityMapping.business_identifier == business_identifier,
-            ]
+            return {"nr_identifier": None, "bootstrap_identifier": None, "business_identifier": business_identifier}
         else:
             # Handle not possible cases like NR, no TEMP and BUSINESS IDENTIFIER
             # Log warning instead of raising an exception incase we have some of these weird cases.
             current_app.logger.warning(
                 f"Invalid identifier combination provided: {nr_identifier},{bootstrap_identifier},{business_identifier}"
             )
-            return [
-                EntityMapping.id == -1,
-            ]
+            return None
 
     @staticmethod
     @user_context
@@ -351,6 +291,136 @@ class EntityMappingService:
         if entity_mapping := EntityMappingService.fetch_entity_mapping_details(identifier):
             EntityMappingService.from_entity_details(entity_mapping[0], skip_auth=True)
 
+    @staticmethod
+    def upsert_entity_mappings(entity_details_list: list[dict]) -> int:
+        """Apply the from_entity_details rules to many entities with one lookup and one commit.
+
+        Meant for system jobs, there is no user check. Returns the number of mappings created or filled in.
+        """
+        identifiers = {
+            identifier
+            for entity_details in entity_details_list
+            for identifier in EntityMappingService._details_identifiers(entity_details)
+            if identifier
+        }
+        if not identifiers:
+            return 0
+        existing = (
+            db.session.query(EntityMapping)
+            .filter(
+                or_(
+                    EntityMapping.nr_identifier.in_(identifiers),
+                    EntityMapping.bootstrap_identifier.in_(identifiers),
+                    EntityMapping.business_identifier.in_(identifiers),
+                )
+            )
+            .order_by(EntityMapping.id)
+            .all()
+        )
+        # Mappings by each of their identifiers, rows added by this batch are indexed as they are created.
+        mappings_by_identifier = {}
+
+        def index(mapping: EntityMapping):
+            for identifier in {mapping.nr_identifier, mapping.bootstrap_identifier, mapping.business_identifier}:
+                if identifier:
+                    mappings_by_identifier.setdefault(identifier, []).append(mapping)
+
+        for mapping in existing:
+            index(mapping)
+
+        written = 0
+        for entity_details in entity_details_list:
+            nr_identifier, bootstrap_identifier, business_identifier = EntityMappingService._details_identifiers(
+                entity_details
+            )
+            wanted = {
+                "nr_identifier": nr_identifier,
+                "bootstrap_identifier": bootstrap_identifier,
+                "business_identifier": business_identifier,
+            }
+            provided = {column: value for column, value in wanted.items() if value}
+            if not provided:
+                continue
+            candidates = mappings_by_identifier.get(next(iter(provided.values())), [])
+            if any(EntityMappingService._mapping_matches(mapping, provided) for mapping in candidates):
+                continue
+
+            mapping_key = EntityMappingService._mapping_key(nr_identifier, bootstrap_identifier, business_identifier)
+            if mapping_key is not None:
+                key_identifier = next(value for value in mapping_key.values() if value)
+                existing_mapping = next(
+                    (
+                        mapping
+                        for mapping in mappings_by_identifier.get(key_identifier, [])
+                        if EntityMappingService._mapping_matches(mapping, mapping_key)
+                    ),
+                    None,
+                )
+                if EntityMappingService._fill_mapping(
+                    existing_mapping, nr_identifier, bootstrap_identifier, business_identifier
+                ):
+                    index(existing_mapping)
+                    written += 1
+                    continue
+
+            new_mapping = EntityMapping(**wanted)
+            db.session.add(new_mapping)
+            index(new_mapping)
+            written += 1
+        db.session.commit()
+        return written
+
+    @staticmethod
+    def _details_identifiers(entity_details: dict) -> tuple[str, str, str]:
+        """Return the NR, bootstrap and business identifiers of the entity details."""
+        return (
+            entity_details.get("nrNumber"),
+            entity_details.get("bootstrapIdentifier"),
+            entity_details.get("identifier"),
+        )
+
+    @staticmethod
+    def _mapping_matches(mapping: EntityMapping, values: dict) -> bool:
+        """Return True if the mapping has these column values, a None value has to be missing on the mapping."""
+        return all((getattr(mapping, column) or None) == value for column, value in values.items())
+
+    @staticmethod
+    def fetch_entity_mapping_details_for_identifiers(
+        identifiers: list[str], batch_size: int, max_parallel: int, timeout: float | None = None
+    ) -> tuple[list[dict], list[str]]:
+        """Return the entity mapping details from LEAR for many identifiers, and the identifiers that failed.
+
+        Sent in batches of batch_size identifiers, at most max_parallel at once, on the background loop. Waits for
+        every round of batches to take up to timeout, or for BACKGROUND_LOOP_TIMEOUT when there is no timeout.
+        """
+        if not identifiers:
+            return [], []
+        token = RestService.get_service_account_token(
+            config_id="ENTITY_SVC_CLIENT_ID",
+            config_secret="ENTITY_SVC_CLIENT_SECRET",  # noqa: S106
+        )
+        endpoint = EntityMappingService._affiliation_mappings_url()
+        call_info = [
+            {"url": endpoint, "payload": {"identifiers": list(batch)}} for batch in batched(identifiers, batch_size)
+        ]
+        failed_calls = []
+        run_timeout = timeout * math.ceil(len(call_info) / max_parallel) + 5 if timeout else None
+        responses = background_loop.run(
+            RestService.call_posts_in_parallel(
+                call_info, token, None, failed_calls, max_parallel=max_parallel, timeout=timeout
+            ),
+            run_timeout,
+        )
+        entity_details = [details for response in responses for details in (response or {}).get("entityDetails") or []]
+        failed_identifiers = [identifier for call in failed_calls for identifier in call["payload"]["identifiers"]]
+        return entity_details, failed_identifiers
+
+    @staticmethod
+    def _affiliation_mappings_url() -> str:
+        """Return the LEAR endpoint that returns the mapping details of a list of identifiers."""
+        new_url = f"{current_app.config.get('LEGAL_API_URL')}{current_app.config.get('LEGAL_API_VERSION_2')}"
+        return f"{new_url}/businesses/search/affiliation_mappings"
+
     @staticmethod
     def fetch_entity_mapping_details(identifier: str):
         """Return affiliation details by calling the source api."""
@@ -359,8 +429,7 @@ class EntityMappingService:
             config_id="ENTITY_SVC_CLIENT_ID",
             config_secret="ENTITY_SVC_CLIENT_SECRET",  # noqa: S106
         )
-        new_url = f"{current_app.config.get('LEGAL_API_URL')}{current_app.config.get('LEGAL_API_VERSION_2')}"
-        endpoint = f"{new_url}/businesses/search/affiliation_mappings"
+        endpoint = EntityMappingService._affiliation_mappings_url()
         try:
             response = RestService.post(endpoint, token=token, data={"identifiers": [identifier]})
             return response.json().get("entityDetails")
@@ -15,10 +15,12 @@
 
 import asyncio
 import json
+import threading
+import time
 from dataclasses import dataclass
+from http import HTTPStatus
 
 import aiohttp
-import requests
 from aiohttp_retry import ExponentialRetry, RetryClient
 from flask import current_app
 
@@ -31,7 +33,9 @@ from auth_api.utils.constants import (
     GROUP_PUBLIC_USERS,
 )
 from auth_api.utils.enums import ContentType, KeycloakGroupActions, LoginSource
+from auth_api.utils.http_client import http_client
 from auth_api.utils.roles import Role
+from auth_api.utils.service_token import service_token_manager
 from auth_api.utils.user_context import UserContext, user_context
 
 
@@ -47,6 +51,10 @@ class KCRequestConfig:
 class KeycloakService:
     """For Keycloak services."""
 
+    # Group name -> (group id, monotonic time it was looked up), shared by every caller in the process.
+    _group_ids: dict[str, tuple[str, float]] = {}
+    _group_ids_lock = threading.Lock()
+
     @staticmethod
     def get_user_groups(user_id):
         """Get user from Keycloak by username."""
@@ -58,7 +66,7 @@ class KeycloakService:
 
         # Get the user and return
         query_user_url = f"{base_url}/auth/admin/realms/{realm}/users/{user_id}/groups"
-        response = requests.get(query_user_url, headers=headers, timeout=timeout)
+        response = http_client.get(query_user_url, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response.json()
 
@@ -77,7 +85,7 @@ class KeycloakService:
 
             headers = {"Content-Type": "application/x-www-form-urlencoded"}
             token_url = f"{base_url}/auth/realms/{realm}/protocol/openid-connect/token"
-            response = requests.post(token_url, data=token_request, headers=headers, timeout=timeout)
+            response = http_client.post(token_url, data=token_request, headers=headers, timeout=timeout)
 
             response.raise_for_status()
             return response.json()
@@ -190,16 +198,36 @@ class KeycloakService:
             exceptions={TimeoutError, aiohttp.ClientConnectionError},
         )
         async with RetryClient(connector=connector, retry_options=retry_options) as session:
-            tasks = [
-                session.request(
-                    method,
-                    f"{base_url}/auth/admin/realms/{realm}/users/{kg.user_guid}/groups/{group_ids[kg.group_name]}",
-                    headers=headers,
-                    timeout=timeout,
-                )
-                for kg in kgs
+
+            async def send(subscriptions: list[KeycloakGroupSubscription]):
+                tasks = [
+                    session.request(
+                        method,
+                        f"{base_url}/auth/admin/realms/{realm}/users/{kg.user_guid}/groups/{group_ids[kg.group_name]}",
+                        headers=headers,
+                        timeout=timeout,
+                    )
+                    for kg in subscriptions
+                ]
+                return await asyncio.gather(*tasks, return_exceptions=True)
+
+            tasks = await send(kgs)
+            # A 404 can mean the cached group id is stale (group recreated), look the group up again and retry once.
+            not_found = [
+                index
+                for index, task in enumerate(tasks)
+                if not isinstance(task, Exception) and task.status == HTTPStatus.NOT_FOUND
             ]
-            tasks = await asyncio.gather(*tasks, return_exceptions=True)
+            refreshed_groups = set()
+            for group_name in {kgs[index].group_name for index in not_found}:
+                group_id = KeycloakService._get_group_id(admin_token, group_name, refresh=True)
+                if group_id and group_id != group_ids[group_name]:
+                    group_ids[group_name] = group_id
+                    refreshed_groups.add(group_name)
+            if retry_indexes := [index for index in not_found if kgs[index].group_name in refreshed_groups]:
+                retried = await send([kgs[index] for index in retry_indexes])
+                for index, task in zip(retry_indexes, retried, strict=True):
+                    tasks[index] = task
             for task in tasks:
                 if isinstance(task, aiohttp.ClientConnectionError):
                     current_app.logger.error(f"Connection error: {task}", exc_info=task)
@@ -234,7 +262,7 @@ class KeycloakService:
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
         get_role_groups = f"{kc_config.base_url}/auth/admin/realms/{kc_config.realm}/roles/{role}/groups"
 
-        response = requests.get(get_role_groups, headers=headers, timeout=kc_config.timeout)
+        response = http_client.get(get_role_groups, headers=headers, timeout=kc_config.timeout)
         if response.status_code == 404:
             raise BusinessException(Error.DATA_NOT_FOUND, None)
         response.raise_for_status()
@@ -248,7 +276,7 @@ class KeycloakService:
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
         get_group_members = f"{kc_config.base_url}/auth/admin/realms/{kc_config.realm}/groups/{group_id}/members"
 
-        response = requests.get(get_group_members, headers=headers, timeout=kc_config.timeout)
+        response = http_client.get(get_group_members, headers=headers, timeout=kc_config.timeout)
         if response.status_code == 404:
             raise BusinessException(Error.DATA_NOT_FOUND, None)
         response.raise_for_status()
@@ -262,7 +290,7 @@ class KeycloakService:
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
         get_role_users = f"{kc_config.base_url}/auth/admin/realms/{kc_config.realm}/roles/{role}/users"
 
-        response = requests.get(get_role_users, headers=headers, timeout=kc_config.timeout)
+        response = http_client.get(get_role_users, headers=headers, timeout=kc_config.timeout)
         if response.status_code == 404:
             raise BusinessException(Error.DATA_NOT_FOUND, None)
         response.raise_for_status()
@@ -291,70 +319,89 @@ class KeycloakService:
     @staticmethod
     def add_user_to_group(user_id: str, group_name: str):
         """Add user to the keycloak group."""
-        config = current_app.config
-        base_url = config.get("KEYCLOAK_BASE_URL")
-        realm = config.get("KEYCLOAK_REALMNAME")
-        timeout = config.get("CONNECT_TIMEOUT", 60)
-        # Create an admin token
-        admin_token = KeycloakService._get_admin_token()
-        # Get the '$group_name' group
-        group_id = KeycloakService._get_group_id(admin_token, group_name)
-
-        # Add user to the keycloak group '$group_name'
-        headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
-        add_to_group_url = f"{base_url}/auth/admin/realms/{realm}/users/{user_id}/groups/{group_id}"
-        response = requests.put(add_to_group_url, headers=headers, timeout=timeout)
-        response.raise_for_status()
+        KeycloakService._update_group_membership("PUT", user_id, group_name)
 
     @staticmethod
     def remove_user_from_group(user_id: str, group_name: str):
         """Remove user from the keycloak group."""
+        KeycloakService._update_group_membership("DELETE", user_id, group_name)
+
+    @staticmethod
+    def _update_group_membership(method: str, user_id: str, group_name: str):
+        """Add (PUT) or remove (DELETE) the user from the keycloak group."""
         config = current_app.config
         base_url = config.get("KEYCLOAK_BASE_URL")
         realm = config.get("KEYCLOAK_REALMNAME")
         timeout = config.get("CONNECT_TIMEOUT", 60)
-        # Create an admin token
         admin_token = KeycloakService._get_admin_token()
-        # Get the '$group_name' group
         group_id = KeycloakService._get_group_id(admin_token, group_name)
 
-        # Remove user from keycloak group '$group_name'
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
-        remove_group_url = f"{base_url}/auth/admin/realms/{realm}/users/{user_id}/groups/{group_id}"
-        response = requests.delete(remove_group_url, headers=headers, timeout=timeout)
+        group_url = f"{base_url}/auth/admin/realms/{realm}/users/{user_id}/groups/{{}}"
+        response = http_client.request(method, group_url.format(group_id), headers=headers, timeout=timeout)
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            # The cached group id may be stale (group recreated), look the group up again and retry once.
+            refreshed_group_id = KeycloakService._get_group_id(admin_token, group_name, refresh=True)
+            if refreshed_group_id and refreshed_group_id != group_id:
+                response = http_client.request(
+                    method, group_url.format(refreshed_group_id), headers=headers, timeout=timeout
+                )
         response.raise_for_status()
 
     @staticmethod
     def _get_admin_token():
-        """Create an admin token."""
-        config = current_app.config
-        base_url = config.get("KEYCLOAK_BASE_URL")
-        realm = config.get("KEYCLOAK_REALMNAME")
-        admin_client_id = config.get("KEYCLOAK_ADMIN_USERNAME")
-        admin_secret = config.get("KEYCLOAK_ADMIN_SECRET")
-        timeout = config.get("CONNECT_TIMEOUT", 60)
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        token_url = f"{base_url}/auth/realms/{realm}/protocol/openid-connect/token"
+        """Return an admin token, reused until shortly before it expires."""
+
+        def fetch():
+            config = current_app.config
+            base_url = config.get("KEYCLOAK_BASE_URL")
+            realm = config.get("KEYCLOAK_REALMNAME")
+            admin_client_id = config.get("KEYCLOAK_ADMIN_USERNAME")
+            admin_secret = config.get("KEYCLOAK_ADMIN_SECRET")
+            timeout = config.get("CONNECT_TIMEOUT", 60)
+            headers = {"Content-Type": "application/x-www-form-urlencoded"}
+            token_url = f"{base_url}/auth/realms/{realm}/protocol/openid-connect/token"
 
-        response = requests.post(
-            token_url,
-            data=f"client_id={admin_client_id}&grant_type=client_credentials&client_secret={admin_secret}",
-            headers=headers,
-            timeout=timeout,
-        )
-        return response.json().get("access_token")
+            response = http_client.post(
+                token_url,
+                data=f"client_id={admin_client_id}&grant_type=client_credentials&client_secret={admin_secret}",
+                headers=headers,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+
+        return service_token_manager.get(("KEYCLOAK_ADMIN_USERNAME", "KEYCLOAK_ADMIN_SECRET"), fetch)
 
     @staticmethod
-    def _get_group_id(admin_token: str, group_name: str):
-        """Get a group id for the group name."""
+    def _get_group_id(admin_token: str, group_name: str, refresh: bool = False):
+        """Get a group id for the group name, cached for KEYCLOAK_GROUP_ID_CACHE_TIMEOUT seconds."""
         config = current_app.config
+        ttl = config.get("KEYCLOAK_GROUP_ID_CACHE_TIMEOUT", 3600)
+        cached = KeycloakService._group_ids.get(group_name)
+        if not refresh and cached and time.monotonic() - cached[1] < ttl:
+            return cached[0]
+
         base_url = config.get("KEYCLOAK_BASE_URL")
         realm = config.get("KEYCLOAK_REALMNAME")
         timeout = config.get("CONNECT_TIMEOUT", 60)
         get_group_url = f"{base_url}/auth/admin/realms/{realm}/groups?search={group_name}"
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
-        response = requests.get(get_group_url, headers=headers, timeout=timeout)
-        return KeycloakService._find_group_or_subgroup_id(response.json(), group_name)
+        response = http_client.get(get_group_url, headers=headers, timeout=timeout)
+        group_id = KeycloakService._find_group_or_subgroup_id(response.json(), group_name)
+        with KeycloakService._group_ids_lock:
+            if group_id:
+                KeycloakService._group_ids[group_name] = (group_id, time.monotonic())
+            else:
+                # Not cached, a missing group is looked up again on the next call.
+                KeycloakService._group_ids.pop(group_name, None)
+        return group_id
+
+    @staticmethod
+    def clear_group_ids():
+        """Forget every cached group id."""
+        with KeycloakService._group_ids_lock:
+            KeycloakService._group_ids.clear()
 
     @staticmethod
     def _find_group_or_subgroup_id(groups: list, group_name: str):
@@ -381,15 +428,15 @@ class KeycloakService:
         configure_otp_url = f"{base_url}/auth/admin/realms/{realm}/users/{user_id}"
         input_data = json.dumps({"id": user_id, "requiredActions": ["CONFIGURE_TOTP"]})
 
-        response = requests.put(configure_otp_url, headers=headers, data=input_data, timeout=timeout)
+        response = http_client.put(configure_otp_url, headers=headers, data=input_data, timeout=timeout)
 
         if response.status_code == 204:
             get_credentials_url = f"{base_url}/auth/admin/realms/{realm}/users/{user_id}/credentials"
-            response = requests.get(get_credentials_url, headers=headers, timeout=timeout)
+            response = http_client.get(get_credentials_url, headers=headers, timeout=timeout)
             for credential in response.json():
                 if credential["type"] == "otp":
                     delete_credential_url = f"{get_credentials_url}/{credential['id']}"
-                    response = requests.delete(delete_credential_url, headers=headers, timeout=timeout)
+                    response = http_client.delete(delete_credential_url, headers=headers, timeout=timeout)
         response.raise_for_status()
 
     @staticmethod
@@ -404,7 +451,7 @@ class KeycloakService:
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
 
         create_client_url = f"{base_url}/auth/admin/realms/{realm}/clients"
-        response = requests.post(
+        response = http_client.post(
             create_client_url, data=json.dumps(client_representation), headers=headers, timeout=timeout
         )
         response.raise_for_status()
@@ -418,7 +465,7 @@ class KeycloakService:
         timeout = config.get("CONNECT_TIMEOUT", 60)
         admin_token = KeycloakService._get_admin_token()
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
-        response = requests.get(
+        response = http_client.get(
             f"{base_url}/auth/admin/realms/{realm}/clients?clientId={client_name}",
             headers=headers,
             timeout=timeout,
@@ -438,7 +485,7 @@ class KeycloakService:
         timeout = config.get("CONNECT_TIMEOUT", 60)
         admin_token = KeycloakService._get_admin_token()
         headers = {"Content-Type": ContentType.JSON.value, "Authorization": f"Bearer {admin_token}"}
-        response = requests.get(
+        response = http_client.get(
             f"{base_url}/auth/admin/realms/{realm}/clients/{client_identifier}/service-account-user",
             headers=headers,
             timeout=timeout,
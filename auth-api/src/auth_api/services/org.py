@@ -896,6 +896,11 @@ class Org:  # pylint: disable=too-many-public-methods
                 raise BusinessException(Error.INVALID_USER_CREDENTIALS, None)
             org_models, orgs_result["total"] = OrgModel.search_pending_activation_orgs(name=search.name)
             include_invitations = True
+        elif search.cursor is not None:
+            # Cursor paging seeks from the last org of the previous page, so it skips OFFSET and the count.
+            pagination = OrgModel.search_org_by_cursor(search)
+            org_models = pagination.items
+            orgs_result = {"orgs": [], **pagination.as_dict()}
         else:
             org_models, orgs_result["total"] = OrgModel.search_org(search)
 
@@ -13,6 +13,11 @@
 # limitations under the License.
 """Service to invoke Rest services."""
 
+import time
+import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from flask import current_app
 from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
@@ -27,38 +32,85 @@ from auth_api.utils.enums import OrgStatus, Status
 from auth_api.utils.roles import VALID_ORG_STATUSES
 from auth_api.utils.user_context import UserContext, user_context
 
+PERMISSIONS_VERSION_KEY = "permissions:version"
+PERMISSIONS_MATRIX_KEY = "permissions:matrix"
+
+PermissionMatrix = Mapping[tuple[str | None, str], frozenset[str]]
+
 
 class Permissions:  # pylint: disable=too-few-public-methods
     """Service for user settings."""
 
+    # (version, matrix) for this worker, replaced as a whole so readers never see a half built matrix.
+    _matrix: tuple[str | None, PermissionMatrix] | None = None
+    _matrix_checked_at: float = 0.0
+
     def __init__(self, model):
         """Return an Permissions Service."""
         self._model = model
 
     @classmethod
     def build_all_permission_cache(cls):
-        """Build cache for all permission values."""
+        """Compile the permission matrix and publish a new version so every worker reloads it."""
         try:
-            permissions: list[PermissionsModel] = PermissionsModel.get_all_permissions()
-            per_kv: dict[tuple[str, int], list[str]] = {}
-            for perm in permissions:
-                key_tuple = (perm.org_status_code, perm.membership_type_code)
-                actions_v: list = per_kv.get(key_tuple)
-                if actions_v:
-                    actions_v.append(perm.actions)
-                    per_kv.update({key_tuple: actions_v})
-                else:
-                    per_kv[key_tuple] = [perm.actions]
-
-            for key, val in per_kv.items():
-                cache.set(key, val)
-
+            matrix = cls._compile_matrix(PermissionsModel.get_all_permissions())
         except SQLAlchemyError as e:
             current_app.logger.info("Error on building cache %s", e)
+            return
+
+        version = uuid.uuid4().hex
+        cls._matrix, cls._matrix_checked_at = (version, matrix), time.monotonic()
+        try:
+            # The matrix goes first, a worker that sees the new version can always read it.
+            cache.set(PERMISSIONS_MATRIX_KEY, (version, dict(matrix)), timeout=0)
+            cache.set(PERMISSIONS_VERSION_KEY, version, timeout=0)
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Error on publishing permission matrix {e}")
+
+    @classmethod
+    def get_permission_matrix(cls) -> PermissionMatrix:
+        """Return the compiled permission matrix, reloading it when the published version has changed.
+
+        The version key is checked at most once every PERMISSIONS_VERSION_CHECK_INTERVAL seconds, every other
+        call is a dictionary lookup.
+        """
+        matrix = cls._matrix
+        now = time.monotonic()
+        if matrix is None or now - cls._matrix_checked_at >= current_app.config.get(
+            "PERMISSIONS_VERSION_CHECK_INTERVAL", 30
+        ):
+            cls._matrix_checked_at = now
+            matrix = cls._reload_matrix(matrix)
+        return matrix[1]
+
+    @classmethod
+    def _reload_matrix(cls, matrix):
+        version = matrix[0] if matrix else None
+        try:
+            version = cache.get(PERMISSIONS_VERSION_KEY)
+            if matrix is not None and matrix[0] == version:
+                return matrix
+            shared = cache.get(PERMISSIONS_MATRIX_KEY) if version else None
+            if shared and shared[0] == version:
+                cls._matrix = (version, MappingProxyType(shared[1]))
+                return cls._matrix
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Error on reading permission matrix version {e}")
+            if matrix is not None:
+                return matrix
+        cls._matrix = (version, cls._compile_matrix(PermissionsModel.get_all_permissions()))
+        return cls._matrix
 
     @staticmethod
+    def _compile_matrix(permissions: list[PermissionsModel]) -> PermissionMatrix:
+        per_kv: dict[tuple[str | None, str], set[str]] = {}
+        for perm in permissions:
+            per_kv.setdefault((perm.org_status_code, perm.membership_type_code), set()).add(perm.actions)
+        return MappingProxyType({key: frozenset(actions) for key, actions in per_kv.items()})
+
+    @classmethod
     def get_permissions_for_membership(
-        org_status, membership_type, user_model: UserModel = None, include_all_permissions: bool = False
+        cls, org_status, membership_type, user_model: UserModel = None, include_all_permissions: bool = False
     ):
         """Get the permissions for the membership type."""
         # Just a tweak til we get all org status to DB
@@ -69,20 +121,12 @@ class Permissions:  # pylint: disable=too-few-public-methods
             OrgStatus.SUSPENDED.value,
         ):
             org_status = None
-        key_tuple = (org_status, membership_type)
-        actions_from_cache = cache.get(key_tuple)
+        actions = cls.get_permission_matrix().get((org_status, membership_type), frozenset())
 
         additional_permissions = []
         if include_all_permissions:
             additional_permissions = Permissions.get_additional_user_permissions(user_model)
-        if actions_from_cache:
-            actions = actions_from_cache + additional_permissions
-        else:
-            permissions = PermissionsModel.get_permissions_by_membership(org_status, membership_type)
-            actions = []
-            for permission in permissions:
-                actions.append(permission.actions)
-        return actions + additional_permissions
+        return sorted(actions) + additional_permissions
 
     @staticmethod
     @user_context
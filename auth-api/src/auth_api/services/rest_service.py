@@ -14,26 +14,24 @@
 """Service to invoke Rest services."""
 
 import asyncio
+import contextlib
 import json
 from collections.abc import Iterable
 from http import HTTPStatus
 
 import aiohttp
-import requests
 from aiohttp.client_exceptions import ClientConnectorError  # pylint:disable=ungrouped-imports
 from flask import current_app, request
-from requests.adapters import HTTPAdapter  # pylint:disable=ungrouped-imports
 
 # pylint:disable=ungrouped-imports
 from requests.exceptions import ConnectionError as ReqConnectionError
 from requests.exceptions import ConnectTimeout, HTTPError
-from urllib3.util.retry import Retry
 
 from auth_api.exceptions import ServiceUnavailableException
-from auth_api.utils.cache import cache
+from auth_api.utils.background_loop import background_loop
 from auth_api.utils.enums import AuthHeaderType, ContentType
-
-RETRY_ADAPTER = HTTPAdapter(max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[404]))
+from auth_api.utils.http_client import http_client
+from auth_api.utils.service_token import service_token_manager
 
 
 class RestService:
@@ -68,10 +66,7 @@ class RestService:
         current_app.logger.debug(f"headers : {safe_headers}")
         response = None
         try:
-            invoke_rest_method = getattr(requests, rest_method)
-            response = invoke_rest_method(
-                endpoint, data=data, headers=headers, timeout=current_app.config.get("CONNECT_TIMEOUT", 60)
-            )
+            response = http_client.request(rest_method, endpoint, data=data, headers=headers)
             if raise_for_status:
                 response.raise_for_status()
         except (ReqConnectionError, ConnectTimeout) as exc:
@@ -228,12 +223,9 @@ class RestService:
         safe_headers.pop("Authorization", None)
         current_app.logger.debug(f"Endpoint : {endpoint}")
         current_app.logger.debug(f"headers : {safe_headers}")
-        session = requests.Session()
-        if retry_on_failure:
-            session.mount(endpoint, RETRY_ADAPTER)
         response = None
         try:
-            response = session.get(endpoint, headers=headers, timeout=current_app.config.get("CONNECT_TIMEOUT", 60))
+            response = http_client.get(endpoint, headers=headers, retry_on_failure=retry_on_failure)
             response.raise_for_status()
         except (ReqConnectionError, ConnectTimeout) as exc:
             current_app.logger.error("---Error on GET---")
@@ -258,26 +250,28 @@ class RestService:
         return response
 
     @staticmethod
-    @cache.cached(query_string=True)
     def get_service_account_token(
         config_id="KEYCLOAK_SERVICE_ACCOUNT_ID",
         config_secret="KEYCLOAK_SERVICE_ACCOUNT_SECRET",  # noqa: S107
     ) -> str:
-        """Generate a service account token."""
-        kc_service_id = current_app.config.get(config_id)
-        kc_secret = current_app.config.get(config_secret)
-
-        issuer_url = current_app.config.get("JWT_OIDC_ISSUER")
-        token_url = issuer_url + "/protocol/openid-connect/token"
-        auth_response = requests.post(
-            token_url,
-            auth=(kc_service_id, kc_secret),
-            headers={"Content-Type": ContentType.FORM_URL_ENCODED.value},
-            data="grant_type=client_credentials",
-            timeout=current_app.config.get("CONNECT_TIMEOUT", 60),
-        )
-        auth_response.raise_for_status()
-        return auth_response.json().get("access_token")
+        """Return a service account token, reused until shortly before it expires."""
+
+        def fetch():
+            kc_service_id = current_app.config.get(config_id)
+            kc_secret = current_app.config.get(config_secret)
+
+            issuer_url = current_app.config.get("JWT_OIDC_ISSUER")
+            token_url = issuer_url + "/protocol/openid-connect/token"
+            auth_response = http_client.post(
+                token_url,
+                auth=(kc_service_id, kc_secret),
+                headers={"Content-Type": ContentType.FORM_URL_ENCODED.value},
+                data="grant_type=client_credentials",
+            )
+            auth_response.raise_for_status()
+            return auth_response.json()
+
+        return service_token_manager.get((config_id, config_secret), fetch)
 
     @staticmethod
     def _generate_headers(content_type, additional_headers, token, auth_header_type):
@@ -289,32 +283,77 @@ class RestService:
         }
 
     @staticmethod
-    async def call_posts_in_parallel(call_info: dict, token: str, org_id):
-        """Call the services in parallel and return the responses."""
+    async def call_posts_in_parallel(  # pylint: disable=too-many-positional-arguments,too-many-arguments
+        call_info: dict,
+        token: str,
+        org_id,
+        failed_calls: list | None = None,
+        max_parallel: int | None = None,
+        timeout: float | None = None,
+    ):
+        """Call the services in parallel and return the responses.
+
+        At most max_parallel calls are in flight at once and each call gives up after timeout seconds. When
+        failed_calls is given the calls that fail are appended to it and the other responses are returned,
+        otherwise the first failure raises ServiceUnavailableException.
+        """
         headers = {"Content-Type": "application/json", "Authorization": f"Bearer {token}"}
+        limits = [asyncio.Semaphore(max_parallel)] if max_parallel else []
+        post_options = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+        if background_loop.is_current():
+            # Pooled session shared by every request in this worker, bounded by ASYNC_HTTP_MAX_CONCURRENCY.
+            session = await background_loop.session()
+            limits.append(background_loop.semaphore())
+            tasks = await RestService._post_all(session, limits, call_info, headers, post_options)
+        else:
+            async with aiohttp.ClientSession() as session:
+                tasks = await RestService._post_all(session, limits, call_info, headers, post_options)
+
         responses = []
-        # call all urls in parallel
-        async with aiohttp.ClientSession() as session:
-            fetch_tasks = [
-                asyncio.create_task(session.post(data["url"], json=data["payload"], headers=headers))
-                for data in call_info
-            ]
-            tasks = await asyncio.gather(*fetch_tasks, return_exceptions=True)
-
-            for task in tasks:
-                if isinstance(task, ClientConnectorError):
-                    # if no response from task we will go in here (i.e. namex-api is down)
-                    error_msg = f"Error for ({str(org_id)}) in _call_urls_in_parallel: no response from {task.os_error}"
-                    current_app.logger.error(error_msg)
-                    raise ServiceUnavailableException(f"No response from {task.os_error}")
-                if task.status != HTTPStatus.OK:
-                    error_msg = f"Error for ({str(org_id)}) in _call_urls_in_parallel: error response from {task.url}"
-                    current_app.logger.error(error_msg)
-                    raise ServiceUnavailableException(f"Error response from {task.url}")
-                task_json = await task.json()
-                responses.append(task_json)
+        for data, task in zip(call_info, tasks, strict=True):
+            if (error := RestService._parallel_post_error(task, org_id)) is None:
+                responses.append(task[2])
+            elif failed_calls is None:
+                raise error
+            else:
+                failed_calls.append(data)
         return responses
 
+    @staticmethod
+    def _parallel_post_error(task, org_id) -> ServiceUnavailableException | None:
+        """Return the error for a failed parallel post, None when it succeeded."""
+        if isinstance(task, ClientConnectorError):
+            # if no response from task we will go in here (i.e. namex-api is down)
+            error_msg = f"Error for ({str(org_id)}) in _call_urls_in_parallel: no response from {task.os_error}"
+            current_app.logger.error(error_msg)
+            return ServiceUnavailableException(f"No response from {task.os_error}")
+        if isinstance(task, Exception):
+            current_app.logger.error(f"Error for ({str(org_id)}) in _call_urls_in_parallel: {task!r}")
+            return ServiceUnavailableException(f"Error calling upstream: {task!r}")
+        status, url, _ = task
+        if status != HTTPStatus.OK:
+            error_msg = f"Error for ({str(org_id)}) in _call_urls_in_parallel: error response from {url}"
+            current_app.logger.error(error_msg)
+            return ServiceUnavailableException(f"Error response from {url}")
+        return None
+
+    @staticmethod
+    async def _post_all(
+        session: aiohttp.ClientSession, limits: list[asyncio.Semaphore], call_info, headers, post_options: dict
+    ):
+        """Post every payload in parallel, return (status, url, json) or the error for each call."""
+
+        async def post(data):
+            async with contextlib.AsyncExitStack() as stack:
+                # Wait for the per call limit before taking a slot of the process wide one.
+                for limit in limits:
+                    await stack.enter_async_context(limit)
+                async with session.post(data["url"], json=data["payload"], headers=headers, **post_options) as response:
+                    body = await response.json() if response.status == HTTPStatus.OK else None
+                    return response.status, response.url, body
+
+        return await asyncio.gather(*[post(data) for data in call_info], return_exceptions=True)
+
 
 def _get_token() -> str:
     token: str = request.headers["Authorization"] if request and "Authorization" in request.headers else None
@@ -15,7 +15,7 @@
 
 from flask import current_app
 from jinja2 import Environment, FileSystemLoader
-from sqlalchemy import String, and_, desc, func, or_
+from sqlalchemy import Double, String, and_, cast, desc, func, or_
 
 from auth_api.config import get_named_config
 from auth_api.models import Org as OrgModel
@@ -46,8 +46,11 @@ class SimpleOrg:  # pylint: disable=too-few-public-methods
         current_app.logger.debug("<search")
         query = db.session.query(OrgModel)
 
-        query = query.filter_conditionally(search_criteria.id, func.cast(OrgModel.id, String), is_like=True)
-        query = query.filter_conditionally(search_criteria.name, OrgModel.name, is_like=True)
+        # Plain ILIKE rather than filter_conditionally's lower(...) so the trigram indexes on orgs can be used.
+        if search_criteria.id:
+            query = query.filter(cast(OrgModel.id, String).ilike(f"%{search_criteria.id}%"))
+        if search_criteria.name:
+            query = query.filter(OrgModel.name.ilike(f"%{search_criteria.name}%"))
         if search_criteria.exclude_statuses:
             query = query.filter(OrgModel.status_code.notin_(search_criteria.statuses))
         else:
@@ -65,21 +68,30 @@ class SimpleOrg:  # pylint: disable=too-few-public-methods
             query = query.filter(
                 and_(
                     or_(
-                        func.cast(OrgModel.id, String).ilike(search_text),
+                        cast(OrgModel.id, String).ilike(search_text),
                         OrgModel.name.ilike(search_text),
                         and_(OrgModel.branch_name.ilike(search_text), OrgModel.branch_name != ""),
                     )
                 )
             )
 
-        query = cls.get_order_by(search_criteria, query)
-        pagination = query.paginate(per_page=search_criteria.limit, page=search_criteria.page)
+        if search_criteria.cursor is not None:
+            pagination = query.keyset_paginate(
+                cls.get_sort_keys(search_criteria) + [(OrgModel.id, False)],
+                search_criteria.limit,
+                search_criteria.cursor,
+            )
+        else:
+            query = cls.get_order_by(search_criteria, query)
+            pagination = query.paginate(per_page=search_criteria.limit, page=search_criteria.page)
 
         org_list = [SimpleOrgInfoSchema.from_row(short_name) for short_name in pagination.items]
         converter = Converter()
         org_list = converter.unstructure(org_list)
 
         current_app.logger.debug(">search")
+        if search_criteria.cursor is not None:
+            return {"items": org_list, **pagination.as_dict()}
         return {
             "page": search_criteria.page,
             "limit": search_criteria.limit,
@@ -90,8 +102,23 @@ class SimpleOrg:  # pylint: disable=too-few-public-methods
     @classmethod
     def get_order_by(cls, search, query):
         """Handle search query order by."""
+        return query.order_by(*(desc(key) if descending else key for key, descending in cls.get_sort_keys(search)))
+
+    @classmethod
+    def get_sort_keys(cls, search) -> list[tuple]:
+        """Return the (expression, descending) pairs searches are ordered by."""
         # If searching by id, surface the perfect matches to the top
         if search.id:
-            return query.order_by(desc(OrgModel.id == int(search.id)), OrgModel.created.desc())
+            return [(OrgModel.id == int(search.id), True), (OrgModel.created, True)]
+
+        # Closest names first when searching by name or text, pg_trgm similarity as the trigram indexes use. It is a
+        # real, cast to double precision so the value a cursor carries compares equal to the row it came from.
+        if search_text := search.search_text or search.name:
+            similarity = func.similarity(OrgModel.name, search_text)
+            if search.search_text:
+                similarity = func.greatest(
+                    similarity, func.similarity(func.coalesce(OrgModel.branch_name, ""), search_text)
+                )
+            return [(cast(similarity, Double), True), (OrgModel.name, False)]
 
-        return query.order_by(OrgModel.name)
+        return [(OrgModel.name, False)]
@@ -270,14 +270,14 @@ class Task:  # pylint: disable=too-many-instance-attributes
     def fetch_tasks(task_search: TaskSearch):
         """Search all tasks."""
         current_app.logger.debug("<fetch_tasks ")
-        task_models, count = TaskModel.fetch_tasks(task_search)  # pylint: disable=unused-variable
+        if task_search.cursor is not None:
+            pagination = TaskModel.fetch_tasks_by_cursor(task_search)
+            task_models, page_details = pagination.items, pagination.as_dict()
+        else:
+            task_models, count = TaskModel.fetch_tasks(task_search)
+            page_details = {"total": count, "page": task_search.page, "limit": task_search.limit}
 
-        tasks = {
-            "tasks": [Task(task).as_dict(exclude=["user"]) for task in task_models],
-            "total": count,
-            "page": task_search.page,
-            "limit": task_search.limit,
-        }
+        tasks = {"tasks": [Task(task).as_dict(exclude=["user"]) for task in task_models], **page_details}
 
         current_app.logger.debug(">fetch_tasks ")
         return tasks
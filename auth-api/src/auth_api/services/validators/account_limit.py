@@ -17,7 +17,6 @@ from flask import current_app
 
 from auth_api.exceptions import BusinessException, Error
 from auth_api.models import Org as OrgModel
-from auth_api.models import User as UserModel
 from auth_api.services.validators.validator_response import ValidatorResponse
 from auth_api.utils.user_context import UserContext, user_context
 
@@ -28,8 +27,7 @@ def validate(is_fatal=False, **kwargs) -> ValidatorResponse:
     user_from_context: UserContext = kwargs["user_context"]
     validator_response = ValidatorResponse()
     if not user_from_context.is_staff_admin():
-        user: UserModel = UserModel.find_by_jwt_token()
-        count = OrgModel.get_count_of_org_created_by_user_id(user.id)
+        count = OrgModel.get_count_of_org_created_by_user_id(user_from_context.user_id)
         if count >= current_app.config.get("MAX_NUMBER_OF_ORGS"):
             validator_response.add_error(Error.MAX_NUMBER_OF_ORGS_LIMIT)
             if is_fatal:
@@ -0,0 +1,166 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per identifier cache of LEAR and Names affiliation details.
+
+Entries are fresh for AFFILIATION_DETAILS_CACHE_TTL seconds and are then served stale for up to
+AFFILIATION_DETAILS_CACHE_STALE_TTL more seconds while one background call refreshes them. The auth-queue and the
+entity endpoints invalidate an identifier when they see it change, so a refresh that started before the change
+never overwrites the invalidation.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+from flask import current_app, has_app_context
+
+from auth_api.utils.background_loop import background_loop
+from auth_api.utils.cache import cache
+
+CACHE_KEY_PREFIX = "affiliation_details:"
+DETAIL_KEYS = {"businessEntities": "identifier", "draftEntities": "identifier", "requests": "nrNum"}
+
+
+class AffiliationDetailsCache:
+    """Stale while revalidate cache of affiliation details, keyed by business identifier or NR number."""
+
+    def __init__(self):
+        """Return an empty cache, it is only used when AFFILIATION_DETAILS_CACHE_ENABLED is set."""
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Return True if affiliation details should be cached or invalidated."""
+        return has_app_context() and current_app.config.get("AFFILIATION_DETAILS_CACHE_ENABLED", False) is True
+
+    def lookup(self, identifiers: list[str]) -> tuple[dict, list[str], list[str]]:
+        """Return the cached details response, the stale identifiers in it and the identifiers to fetch."""
+        if not identifiers:
+            return self._empty_details(), [], []
+        try:
+            entries = cache.get_many(*[self._key(identifier) for identifier in identifiers])
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Affiliation details cache read failed: {e}")
+            return self._empty_details(), [], list(identifiers)
+
+        config = current_app.config
+        ttl = config.get("AFFILIATION_DETAILS_CACHE_TTL", 300)
+        stale_ttl = config.get("AFFILIATION_DETAILS_CACHE_STALE_TTL", 3600)
+        now = time.time()
+        details, stale, missing = self._empty_details(), [], []
+        for identifier, entry in zip(identifiers, entries, strict=True):
+            age = now - entry["fetched_at"] if entry and "fetched_at" in entry else None
+            if age is None or age >= ttl + stale_ttl:
+                missing.append(identifier)
+                continue
+            if age >= ttl:
+                stale.append(identifier)
+            for detail_key, items in entry["details"].items():
+                details[detail_key].extend(items)
+        return details, stale, missing
+
+    def store(self, identifiers: list[str], responses: list, requested_at: float):
+        """Cache the details responses for the identifiers that were requested at requested_at."""
+        if not identifiers:
+            return
+        by_identifier = {identifier: self._empty_details() for identifier in identifiers}
+        for response in responses:
+            if isinstance(response, list):
+                # Names can answer with a bare list of requests.
+                response = {"requests": response}
+            if not isinstance(response, dict):
+                continue
+            for detail_key, identifier_key in DETAIL_KEYS.items():
+                for item in response.get(detail_key) or []:
+                    if isinstance(item, dict) and (details := by_identifier.get(item.get(identifier_key))):
+                        details[detail_key].append(item)
+
+        config = current_app.config
+        timeout = config.get("AFFILIATION_DETAILS_CACHE_TTL", 300) + config.get(
+            "AFFILIATION_DETAILS_CACHE_STALE_TTL", 3600
+        )
+        try:
+            keys = [self._key(identifier) for identifier in identifiers]
+            current = cache.get_many(*keys)
+            entries = {
+                key: {"fetched_at": requested_at, "details": by_identifier[identifier]}
+                for key, identifier, entry in zip(keys, identifiers, current, strict=True)
+                # Invalidated after this fetch started, the response may predate the change.
+                if not (entry and entry.get("invalidated_at", 0) >= requested_at)
+            }
+            if entries:
+                cache.set_many(entries, timeout=timeout)
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Affiliation details cache write failed: {e}")
+
+    def invalidate(self, identifiers: list[str]):
+        """Drop the cached details for the identifiers, called when they change upstream."""
+        if not identifiers or not self.is_enabled():
+            return
+        config = current_app.config
+        timeout = config.get("AFFILIATION_DETAILS_CACHE_TTL", 300) + config.get(
+            "AFFILIATION_DETAILS_CACHE_STALE_TTL", 3600
+        )
+        # A marker rather than a delete, so an in flight refresh can tell its response is older than the change.
+        marker = {"invalidated_at": time.time()}
+        try:
+            cache.set_many({self._key(identifier): marker for identifier in identifiers}, timeout=timeout)
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Affiliation details cache invalidation failed: {e}")
+
+    def refresh_in_background(self, identifiers: list[str], fetch: Callable[[list[str]], Awaitable[list]]):
+        """Refresh the stale identifiers without waiting for the result.
+
+        Only runs on the background event loop, elsewhere stale entries are served until they expire.
+        """
+        if not identifiers or not background_loop.is_current():
+            return
+        with self._lock:
+            identifiers = [identifier for identifier in identifiers if identifier not in self._refreshing]
+            self._refreshing.update(identifiers)
+        if not identifiers:
+            return
+
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+
+        async def refresh():
+            try:
+                with app.app_context():
+                    requested_at = time.time()
+                    self.store(identifiers, await fetch(identifiers), requested_at)
+            except Exception as e:  # NOQA # pylint: disable=broad-except
+                app.logger.warning(f"Affiliation details refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.difference_update(identifiers)
+
+        # Not tied to the request that noticed the stale entries.
+        task = asyncio.get_running_loop().create_task(refresh(), context=contextvars.Context())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    @staticmethod
+    def _key(identifier: str) -> str:
+        return f"{CACHE_KEY_PREFIX}{identifier}"
+
+    @staticmethod
+    def _empty_details() -> dict:
+        return {detail_key: [] for detail_key in DETAIL_KEYS}
+
+
+affiliation_details_cache = AffiliationDetailsCache()
@@ -130,6 +130,35 @@ def _get_affiliation_event_users(org_id: int, business_identifier: str) -> list[
     ]
 
 
+def _get_affiliations_event_users(org_id: int, business_identifiers: list[str]) -> list[UserAffiliationEvent]:
+    """Get users with active membership in org, each with the identifiers they can't reach through other orgs."""
+    org_user_ids = select(MembershipModel.user_id).where(
+        MembershipModel.org_id == org_id, MembershipModel.status == Status.ACTIVE.value
+    )
+    reachable = set(
+        db.session.query(MembershipModel.user_id, EntityModel.business_identifier)
+        .join(AffiliationModel, MembershipModel.org_id == AffiliationModel.org_id)
+        .join(EntityModel, AffiliationModel.entity_id == EntityModel.id)
+        .filter(MembershipModel.user_id.in_(org_user_ids))
+        .filter(MembershipModel.status == Status.ACTIVE.value)
+        .filter(MembershipModel.org_id != org_id)
+        .filter(EntityModel.business_identifier.in_(business_identifiers))
+        .all()
+    )
+    user_models = db.session.query(UserModel).filter(UserModel.id.in_(org_user_ids)).all()
+
+    user_affiliation_events = []
+    for user in user_models:
+        unaffiliated_identifiers = [
+            identifier for identifier in business_identifiers if (user.id, identifier) not in reachable
+        ]
+        if unaffiliated_identifiers:
+            user_affiliation_events.append(
+                UserAffiliationEvent.from_user_model(user, unaffiliated_identifiers=unaffiliated_identifiers)
+            )
+    return user_affiliation_events
+
+
 def _get_team_member_unaffiliated_identifiers(user_id: int, org_id: int) -> list[UserAffiliationEvent]:
     """Get UserAffiliationEvent for a user losing access to an org with unaffiliated business identifiers."""
     has_access_subquery = _has_access_through_other_orgs(user_id, org_id, entity_id_column=EntityModel.id)
@@ -181,6 +210,26 @@ def publish_affiliation_event(queue_message_type: str, org_id: int, business_ide
     )
 
 
+def publish_affiliations_event(queue_message_type: str, org_id: int, business_identifiers: list[str]):
+    """Publish one affiliation event to topic for many businesses of the org, listed per user."""
+    if not flags.is_on("enable-publish-account-events", default=False):
+        return
+
+    # DBC has no interest in NR or TMP events.
+    business_identifiers = [identifier for identifier in business_identifiers if not identifier.startswith(("NR", "T"))]
+    if not business_identifiers:
+        return
+
+    publish_account_event(
+        queue_message_type=queue_message_type,
+        data=AccountEvent(
+            account_id=org_id,
+            actioned_by=_get_actioned_by(),
+            user_affiliation_events=_get_affiliations_event_users(org_id, business_identifiers),
+        ),
+    )
+
+
 def publish_team_member_event(queue_message_type: str, org_id: int, user_id: int):
     """Publish team member removed event to topic."""
     if not flags.is_on("enable-publish-account-events", default=False):
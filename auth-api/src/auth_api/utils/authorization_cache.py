@@ -0,0 +1,278 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Decision cache for authorizations_view lookups.
+
+Lookups are cached in process and in the shared cache backend. Every entry records the generation of the
+user, org, business and product scopes it was resolved from. Changes to memberships, affiliations, entities,
+orgs and product subscriptions bump those generations once the session commits, so entries computed before
+the change are skipped on the next read instead of being deleted key by key.
+"""
+
+import threading
+import uuid
+from collections import Counter
+from dataclasses import dataclass, fields
+from itertools import chain
+
+from cachetools import TTLCache
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from auth_api.utils.cache import cache
+
+ENTRY_KEY_PREFIX = "authz:entry"
+GENERATION_KEY_PREFIX = "authz:gen"
+PENDING_SCOPES = "authorization_cache_scopes"
+
+# Finder keyword arguments that identify the scope a lookup depends on.
+SCOPE_ARGUMENTS = {
+    "keycloak_guid": "user",
+    "business_identifier": "business",
+    "org_id": "org",
+    "product": "product",
+    "product_code": "product",
+}
+
+# Columns that feed authorizations_view; other org or entity updates do not change a decision.
+ORG_COLUMNS = ("status_code", "name", "type_code", "bcol_user_id", "bcol_account_id")
+ENTITY_COLUMNS = ("business_identifier", "name", "folio_number", "corp_type_code")
+
+
+@dataclass(frozen=True)
+class AuthorizationRecord:  # pylint: disable=too-many-instance-attributes
+    """Detached snapshot of an authorizations_view row."""
+
+    business_identifier: str | None = None
+    entity_name: str | None = None
+    org_membership: str | None = None
+    keycloak_guid: str | None = None
+    org_id: int | None = None
+    user_id: int | None = None
+    org_type: str | None = None
+    corp_type_code: str | None = None
+    product_code: str | None = None
+    org_name: str | None = None
+    bcol_user_id: str | None = None
+    bcol_account_id: str | None = None
+    folio_number: str | None = None
+    status_code: str | None = None
+
+    @classmethod
+    def from_model(cls, model):
+        """Return a snapshot of the view model, or None when there is no row."""
+        if model is None:
+            return None
+        return cls(**{field.name: getattr(model, field.name, None) for field in fields(cls)})
+
+
+class AuthorizationCache:
+    """Two level, generation validated cache for authorizations_view lookups."""
+
+    def __init__(self):
+        """Return an uninitialised cache, lookups pass straight through until init_app is called."""
+        self._local: TTLCache | None = None
+        self._lock = threading.Lock()
+        self._stats = Counter()
+        self._timeout = 300
+
+    def init_app(self, app):
+        """Size the in process cache from the application config."""
+        self._timeout = app.config.get("AUTHORIZATION_CACHE_TIMEOUT", 300)
+        self._local = TTLCache(maxsize=app.config.get("AUTHORIZATION_CACHE_LOCAL_SIZE", 10000), ttl=self._timeout)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Return True if authorization decisions should be cached or invalidated."""
+        return has_app_context() and current_app.config.get("AUTHORIZATION_CACHE_ENABLED", False) is True
+
+    def find(self, finder, **kwargs) -> AuthorizationRecord | None:
+        """Return the finder result as a record, served from cache while its scopes are unchanged."""
+        if self._local is None or not self.is_enabled():
+            return AuthorizationRecord.from_model(finder(**kwargs))
+
+        key = self._entry_key(finder.__name__, kwargs)
+        try:
+            if (entry := self._get_valid_entry(key)) is not None:
+                return entry[0]
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Authorization cache read failed, falling back to the view: {e}")
+            return AuthorizationRecord.from_model(finder(**kwargs))
+
+        self._count("misses")
+        scopes = {(SCOPE_ARGUMENTS[name], str(value)) for name, value in kwargs.items() if name in SCOPE_ARGUMENTS}
+        try:
+            before = self._generations(scopes)
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Authorization cache read failed, falling back to the view: {e}")
+            return AuthorizationRecord.from_model(finder(**kwargs))
+
+        record = AuthorizationRecord.from_model(finder(**kwargs))
+        if record and record.org_id is not None:
+            scopes.add(("org", str(record.org_id)))
+        try:
+            generations = self._generations(scopes)
+            # Something changed while the view was being read, don't pin the result to the new generation.
+            if all(generations[scope] == generation for scope, generation in before.items()):
+                entry = (record, generations)
+                with self._lock:
+                    self._local[key] = entry
+                cache.set(key, entry, timeout=self._timeout)
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Authorization cache write failed: {e}")
+        return record
+
+    def invalidate(self, scopes: set[tuple[str, str]]):
+        """Bump the generation of the given scopes so dependent entries are no longer served."""
+        if not scopes:
+            return
+        try:
+            cache.set_many({self._generation_key(scope): uuid.uuid4().hex for scope in scopes}, timeout=0)
+            self._count("invalidations", len(scopes))
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Authorization cache invalidation failed for {scopes}: {e}")
+
+    def clear_local(self):
+        """Drop every in process entry."""
+        if self._local is not None:
+            with self._lock:
+                self._local.clear()
+
+    def stats(self) -> dict:
+        """Return hit ratio and invalidation counters for this process."""
+        with self._lock:
+            stats = dict(self._stats)
+        hits = stats.get("local_hits", 0) + stats.get("shared_hits", 0)
+        lookups = hits + stats.get("misses", 0)
+        return {
+            "enabled": self._local is not None and self.is_enabled(),
+            "local_hits": stats.get("local_hits", 0),
+            "shared_hits": stats.get("shared_hits", 0),
+            "misses": stats.get("misses", 0),
+            "stale": stats.get("stale", 0),
+            "invalidations": stats.get("invalidations", 0),
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "local_size": len(self._local) if self._local is not None else 0,
+        }
+
+    def _get_valid_entry(self, key: str):
+        """Return the first local or shared entry whose scope generations are still current."""
+        with self._lock:
+            local_entry = self._local.get(key)
+        if local_entry is not None:
+            if self._is_current(local_entry):
+                self._count("local_hits")
+                return local_entry
+            self._count("stale")
+
+        shared_entry = cache.get(key)
+        if shared_entry is not None and shared_entry != local_entry:
+            if self._is_current(shared_entry):
+                with self._lock:
+                    self._local[key] = shared_entry
+                self._count("shared_hits")
+                return shared_entry
+            self._count("stale")
+        return None
+
+    def _is_current(self, entry) -> bool:
+        _, generations = entry
+        current = cache.get_many(*[self._generation_key(scope) for scope in generations])
+        return all(
+            value is not None and value == generations[scope] for scope, value in zip(generations, current, strict=True)
+        )
+
+    def _generations(self, scopes: set[tuple[str, str]]) -> dict:
+        """Return the current generation of each scope, seeding scopes that have none yet."""
+        scopes = list(scopes)
+        values = cache.get_many(*[self._generation_key(scope) for scope in scopes]) if scopes else []
+        generations = {}
+        for scope, value in zip(scopes, values, strict=True):
+            if value is None:
+                # add() keeps whichever process seeded the scope first.
+                cache.add(self._generation_key(scope), uuid.uuid4().hex, timeout=0)
+                value = cache.get(self._generation_key(scope))
+            generations[scope] = value
+        return generations
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._stats[name] += amount
+
+    @staticmethod
+    def _entry_key(finder_name: str, kwargs: dict) -> str:
+        args = ":".join(f"{name}={kwargs[name]}" for name in sorted(kwargs))
+        return f"{ENTRY_KEY_PREFIX}:{finder_name}:{args}"
+
+    @staticmethod
+    def _generation_key(scope: tuple[str, str]) -> str:
+        return f"{GENERATION_KEY_PREFIX}:{scope[0]}:{scope[1]}"
+
+
+def _changed(target, columns) -> bool:
+    state = inspect(target)
+    if state.pending or state.deleted or state.was_deleted:
+        return True
+    return any(state.attrs[column].history.has_changes() for column in columns)
+
+
+def scopes_for(target) -> set[tuple[str, str]]:
+    """Return the cache scopes a changed model instance affects."""
+    table = getattr(target, "__tablename__", None)
+    scopes = set()
+    if table == "memberships":
+        scopes.add(("org", str(target.org_id)))
+        if target.user is not None:
+            scopes.add(("user", str(target.user.keycloak_guid)))
+    elif table == "affiliations":
+        scopes.add(("org", str(target.org_id)))
+        if target.entity is not None:
+            scopes.add(("business", str(target.entity.business_identifier)))
+    elif table == "product_subscriptions":
+        scopes.add(("org", str(target.org_id)))
+        scopes.add(("product", str(target.product_code)))
+    elif table == "orgs" and _changed(target, ORG_COLUMNS):
+        scopes.add(("org", str(target.id)))
+    elif table == "entities" and _changed(target, ENTITY_COLUMNS):
+        scopes.add(("business", str(target.business_identifier)))
+        history = inspect(target).attrs.business_identifier.history
+        scopes.update(("business", str(identifier)) for identifier in history.deleted or ())
+    return scopes
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_invalidations(session, flush_context):  # noqa: ARG001
+    """Remember which scopes this transaction touched; they are published after commit."""
+    if not AuthorizationCache.is_enabled():
+        return
+    pending = session.info.setdefault(PENDING_SCOPES, set())
+    for target in chain(session.new, session.dirty, session.deleted):
+        pending.update(scopes_for(target))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_invalidations(session):
+    """Bump scope generations only once the change is visible to other transactions."""
+    if scopes := session.info.pop(PENDING_SCOPES, None):
+        authorization_cache.invalidate(scopes)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_invalidations(session, previous_transaction):
+    """Forget collected scopes when the outermost transaction is rolled back."""
+    if previous_transaction.parent is None:
+        session.info.pop(PENDING_SCOPES, None)
+
+
+authorization_cache = AuthorizationCache()
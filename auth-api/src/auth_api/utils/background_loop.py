@@ -0,0 +1,135 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Long lived event loop for async fan-out from sync request handlers.
+
+Each worker process runs one event loop in a daemon thread with one pooled aiohttp session, so calls to LEAR and
+Names reuse their connections between requests instead of opening a new loop, connector and TLS session each time.
+Coroutines run in a copy of the caller's context, so current_app, g and the request scoped db session are the
+caller's own while it waits for the result.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+from collections.abc import Coroutine
+
+import aiohttp
+from flask import current_app
+
+from auth_api.exceptions import ServiceUnavailableException
+
+
+class BackgroundLoop:
+    """One event loop thread, aiohttp session and concurrency limit per process."""
+
+    def __init__(self):
+        """Return a loop holder, the loop starts on first use in each process."""
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def run(self, coroutine: Coroutine, timeout: float | None = None):
+        """Run the coroutine on the background loop and wait up to timeout seconds, BACKGROUND_LOOP_TIMEOUT if None."""
+        if timeout is None:
+            timeout = current_app.config.get("BACKGROUND_LOOP_TIMEOUT", 65)
+        future = self.submit(coroutine)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError as e:
+            future.cancel()
+            raise ServiceUnavailableException(f"No result from the background loop after {timeout}s") from e
+
+    def submit(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """Start the coroutine on the background loop, cancelling the returned future cancels the coroutine."""
+        loop = self._ensure_loop()
+        context = contextvars.copy_context()
+        future = concurrent.futures.Future()
+
+        def start():
+            if future.cancelled():
+                coroutine.close()
+                return
+            task = loop.create_task(coroutine, context=context)
+            task.add_done_callback(lambda done: _copy_result(done, future))
+            future.add_done_callback(lambda done: done.cancelled() and loop.call_soon_threadsafe(task.cancel))
+
+        loop.call_soon_threadsafe(start)
+        return future
+
+    def is_current(self) -> bool:
+        """Return True when called from a coroutine running on the background loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Return the pooled aiohttp session, must be awaited on the background loop."""
+        if self._session is None or self._session.closed:
+            config = current_app.config
+            connector = aiohttp.TCPConnector(
+                limit=config.get("ASYNC_HTTP_POOL_LIMIT", 100),
+                limit_per_host=config.get("ASYNC_HTTP_POOL_LIMIT_PER_HOST", 20),
+                keepalive_timeout=config.get("ASYNC_HTTP_KEEPALIVE_TIMEOUT", 30),
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    connect=config.get("HTTP_CONNECT_TIMEOUT", 10),
+                    sock_read=config.get("HTTP_READ_TIMEOUT", 60),
+                ),
+            )
+        return self._session
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """Return the limit on in-flight upstream calls for this process, must be used on the background loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(current_app.config.get("ASYNC_HTTP_MAX_CONCURRENCY", 20))
+        return self._semaphore
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread for this process, once, after any fork."""
+        if self._loop is not None and self._pid == os.getpid():
+            return self._loop
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                # Anything inherited from the parent process belongs to a loop thread that no longer exists.
+                self._session = None
+                self._semaphore = None
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="background-loop", daemon=True).start()
+                self._loop = loop
+                self._pid = os.getpid()
+        return self._loop
+
+
+def _copy_result(task: asyncio.Task, future: concurrent.futures.Future):
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+background_loop = BackgroundLoop()
@@ -29,6 +29,7 @@ class ContentType(Enum):
     JSON = "application/json"
     FORM_URL_ENCODED = "application/x-www-form-urlencoded"
     PDF = "application/pdf"
+    NDJSON = "application/x-ndjson"
 
 
 class NotificationType(Enum):
@@ -414,3 +415,19 @@ class QueueSources(Enum):
     AUTH_API = "auth-api"
     AUTH_QUEUE = "auth-queue"
     AUTH_JOBS = "auth-jobs"
+
+
+class EntityLoad(Enum):
+    """What an Entity query loads with the entity, relationships outside the profile load when first used."""
+
+    MINIMAL = "minimal"  # Columns only, for status / name updates.
+    AUTHORIZATION = "authorization"  # With the corp type, for passcode and eligibility checks.
+    AFFILIATIONS = "affiliations"  # With the corp type and affiliations, for EntitySchema and deletes.
+
+
+class CountStrategy(Enum):
+    """How a paged search works out its total."""
+
+    EXACT = "exact"  # COUNT(*) over the filtered rows.
+    ESTIMATE = "estimate"  # The planner's row estimate, from EXPLAIN.
+    CACHED = "cached"  # An exact count, reused for the same filters until SEARCH_COUNT_CACHE_TTL passes.
@@ -0,0 +1,140 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process wide HTTP client.
+
+Outbound calls share one requests session per process, so connections to pay-api, legal-api, namex, notify-api
+and Keycloak are pooled per host and kept alive between requests instead of being set up on every call.
+"""
+
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from flask import current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Idempotent calls are retried when the upstream is briefly unavailable, responses are returned to the caller
+# once retries are exhausted so raise_for_status keeps working as before.
+UPSTREAM_RETRY = Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+KEYCLOAK_RETRY = Retry(total=2, read=0, status=0, backoff_factor=0.2)
+NO_RETRY = Retry(total=0, read=0, raise_on_status=False)
+# Used when the caller asks for retry_on_failure (ex. waiting for a record to show up in another service).
+RETRY_ON_FAILURE = Retry(total=5, backoff_factor=1, status_forcelist=[404])
+
+# Base url config for each endpoint family and the retry policy it gets.
+ENDPOINT_FAMILIES = {
+    "PAY_API_URL": UPSTREAM_RETRY,
+    "LEGAL_API_URL": UPSTREAM_RETRY,
+    "NAMEX_API_URL": UPSTREAM_RETRY,
+    "BCOL_API_URL": UPSTREAM_RETRY,
+    "COLIN_API_URL": UPSTREAM_RETRY,
+    "NOTIFY_API_URL": UPSTREAM_RETRY,
+    "API_GW_CONSUMERS_API_URL": UPSTREAM_RETRY,
+    "KEYCLOAK_BASE_URL": KEYCLOAK_RETRY,
+    "JWT_OIDC_ISSUER": KEYCLOAK_RETRY,
+}
+
+
+class HttpClient:
+    """Pooled, keep alive requests sessions shared by every outbound call in the process."""
+
+    def __init__(self):
+        """Return a client, sessions are created on first use in each process."""
+        self._lock = threading.Lock()
+        self._pid = None
+        self._sessions: dict[bool, requests.Session] = {}
+
+    def request(self, method: str, url: str, retry_on_failure: bool = False, **kwargs) -> requests.Response:
+        """Send the request through the pooled session.
+
+        A number timeout is the read timeout, the connect timeout always comes from HTTP_CONNECT_TIMEOUT.
+        """
+        kwargs["timeout"] = self.timeout(kwargs.get("timeout"))
+        return self.session(retry_on_failure).request(method.upper(), url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request("get", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request."""
+        return self.request("post", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        """Send a PUT request."""
+        return self.request("put", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        """Send a PATCH request."""
+        return self.request("patch", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """Send a DELETE request."""
+        return self.request("delete", url, **kwargs)
+
+    @staticmethod
+    def timeout(read_timeout=None) -> tuple:
+        """Return the (connect, read) timeout for a request."""
+        if isinstance(read_timeout, tuple):
+            return read_timeout
+        connect_timeout = current_app.config.get("HTTP_CONNECT_TIMEOUT", 10)
+        read_timeout = read_timeout or current_app.config.get(
+            "HTTP_READ_TIMEOUT", current_app.config.get("CONNECT_TIMEOUT", 60)
+        )
+        return min(connect_timeout, read_timeout), read_timeout
+
+    def session(self, retry_on_failure: bool = False) -> requests.Session:
+        """Return the shared session for this process, recreated after a fork."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._sessions = {}
+                    self._pid = os.getpid()
+        if (session := self._sessions.get(retry_on_failure)) is None:
+            with self._lock:
+                if (session := self._sessions.get(retry_on_failure)) is None:
+                    session = self._sessions[retry_on_failure] = self._build_session(retry_on_failure)
+        return session
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+    @staticmethod
+    def _build_session(retry_on_failure: bool) -> requests.Session:
+        config = current_app.config
+        pool_options = {
+            "pool_connections": config.get("HTTP_POOL_CONNECTIONS", 10),
+            "pool_maxsize": config.get("HTTP_POOL_MAXSIZE", 20),
+        }
+        session = requests.Session()
+        # The session is shared by every caller, cookies from one upstream response must not leak into the next call.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        default_retry = RETRY_ON_FAILURE if retry_on_failure else NO_RETRY
+        session.mount("http://", HTTPAdapter(max_retries=default_retry, **pool_options))
+        session.mount("https://", HTTPAdapter(max_retries=default_retry, **pool_options))
+        if not retry_on_failure:
+            # requests picks the adapter with the longest matching prefix, so each family gets its own policy.
+            for config_key, retry in ENDPOINT_FAMILIES.items():
+                if base_url := config.get(config_key):
+                    session.mount(base_url, HTTPAdapter(max_retries=retry, **pool_options))
+        return session
+
+
+http_client = HttpClient()
@@ -0,0 +1,104 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Client credential token manager.
+
+Tokens are kept per client until shortly before the expiry Keycloak reports. Inside the refresh window the current
+token is still handed out while one background fetch replaces it, and when a token is missing or expired only one
+caller per process fetches it while the others wait for that result.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from flask import current_app
+
+
+@dataclass(frozen=True)
+class _Token:
+    access_token: str
+    refresh_at: float
+    expires_at: float
+
+
+class ServiceTokenManager:
+    """Single flight, refresh ahead cache of client credential tokens."""
+
+    def __init__(self):
+        """Return an empty token manager."""
+        self._tokens: dict[tuple, _Token] = {}
+        self._locks: dict[tuple, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(self, key: tuple, fetch: Callable[[], dict]) -> str:
+        """Return the access token for key, fetch returns the token endpoint response."""
+        token = self._tokens.get(key)
+        now = time.monotonic()
+        if token and now < token.refresh_at:
+            return token.access_token
+        if token and now < token.expires_at:
+            self._refresh_in_background(key, fetch)
+            return token.access_token
+
+        with self._lock_for(key):
+            # Another caller may have fetched it while this one was waiting.
+            token = self._tokens.get(key)
+            if token and time.monotonic() < token.expires_at:
+                return token.access_token
+            return self._fetch(key, fetch).access_token
+
+    def clear(self):
+        """Forget every token."""
+        self._tokens.clear()
+
+    def _refresh_in_background(self, key: tuple, fetch: Callable[[], dict]):
+        lock = self._lock_for(key)
+        if not lock.acquire(blocking=False):
+            return  # A refresh is already running.
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+
+        def refresh():
+            try:
+                with app.app_context():
+                    self._fetch(key, fetch)
+            except Exception as e:  # NOQA # pylint: disable=broad-except
+                app.logger.warning(f"Service account token refresh failed for {key[0]}: {e}")
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _fetch(self, key: tuple, fetch: Callable[[], dict]) -> _Token:
+        fetched_at = time.monotonic()
+        response = fetch()
+        expires_in = int(response.get("expires_in") or current_app.config.get("CACHE_DEFAULT_TIMEOUT", 300))
+        # Refresh ahead by the configured margin, but never for more than half of the token lifetime.
+        refresh_ahead = min(current_app.config.get("SERVICE_ACCOUNT_TOKEN_REFRESH_AHEAD", 60), expires_in / 2)
+        token = _Token(
+            access_token=response.get("access_token"),
+            refresh_at=fetched_at + expires_in - refresh_ahead,
+            expires_at=fetched_at + expires_in,
+        )
+        self._tokens[key] = token
+        return token
+
+    def _lock_for(self, key: tuple) -> threading.Lock:
+        if (lock := self._locks.get(key)) is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(key, threading.Lock())
+        return lock
+
+
+service_token_manager = ServiceTokenManager()
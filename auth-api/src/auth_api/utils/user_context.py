@@ -16,7 +16,7 @@
 import functools
 from http import HTTPStatus
 
-from flask import abort, g, request
+from flask import abort, g, has_app_context, has_request_context, request
 
 # from auth_api.models import User as UserModel
 from auth_api.utils.enums import LoginSource
@@ -24,21 +24,30 @@ from auth_api.utils.roles import Role
 
 
 def _get_context():
-    """Return User context."""
-    return UserContext()
+    """Return the User context for this request, built once per token."""
+    token_info = _get_token_info()
+    if not has_app_context():
+        return UserContext(token_info)
+    # pylint: disable=protected-access
+    current_request = request._get_current_object() if has_request_context() else None
+    context = g.get("user_context")
+    if context is None or not context.is_for(token_info, current_request):
+        context = g.user_context = UserContext(token_info, current_request)
+    return context
 
 
 class UserContext:  # pylint: disable=too-many-instance-attributes
     """Object to hold request scoped user context."""
 
-    def __init__(self):
+    def __init__(self, token_info: dict = None, source_request=None):
         """Return a User Context object."""
-        token_info: dict = _get_token_info() or {}
+        self._source_token_info = token_info
+        self._source_request = source_request
+        token_info: dict = token_info or {}
         self._token_info = token_info
         self._user_name: str = token_info.get("username", token_info.get("preferred_username", None))
         self._first_name: str = token_info.get("firstname", None)
         self._last_name: str = token_info.get("lastname", None)
-        self._bearer_token: str = _get_token()
         self._roles: list = (
             token_info.get("realm_access", None).get("roles", []) if "realm_access" in token_info else []
         )
@@ -46,6 +55,12 @@ class UserContext:  # pylint: disable=too-many-instance-attributes
         self._login_source: str = token_info.get("loginSource", None)
         self._name: str = f"{token_info.get('firstname', None)} {token_info.get('lastname', None)}"
 
+    def is_for(self, token_info: dict, source_request) -> bool:
+        """Return True if this context was built for the given token info and request."""
+        return self._source_request is source_request and (
+            self._source_token_info is token_info or (not self._source_token_info and not token_info)
+        )
+
     @property
     def user_name(self) -> str:
         """Return the user_name."""
@@ -61,10 +76,10 @@ class UserContext:  # pylint: disable=too-many-instance-attributes
         """Return the user_last_name."""
         return self._last_name
 
-    @property
+    @functools.cached_property
     def bearer_token(self) -> str:
         """Return the bearer_token."""
-        return self._bearer_token
+        return _get_token()
 
     @property
     def roles(self) -> list:
@@ -76,25 +91,30 @@ class UserContext:  # pylint: disable=too-many-instance-attributes
         """Return the subject."""
         return self._sub
 
+    @functools.cached_property
+    def role_set(self) -> frozenset:
+        """Return the roles as a set for membership checks."""
+        return frozenset(self._roles)
+
     def has_role(self, role_name: str) -> bool:
         """Return True if the user has the role."""
-        return role_name in self._roles
+        return role_name in self.role_set
 
     def is_staff(self) -> bool:
         """Return True if the user is staff user."""
-        return self._roles and any(role in [Role.STAFF.value] for role in self._roles)
+        return Role.STAFF.value in self.role_set
 
     def is_external_staff(self) -> bool:
         """Return True if the user is external staff."""
-        return self._roles and any(role in [Role.EXTERNAL_STAFF_READONLY.value] for role in self._roles)
+        return Role.EXTERNAL_STAFF_READONLY.value in self.role_set
 
     def is_staff_admin(self) -> bool:
         """Return True if the user is staff user."""
-        return Role.STAFF_CREATE_ACCOUNTS.value in self._roles if self._roles else False
+        return Role.STAFF_CREATE_ACCOUNTS.value in self.role_set
 
     def is_system(self) -> bool:
         """Return True if the user is system user."""
-        return Role.SYSTEM.value in self._roles if self._roles else False
+        return Role.SYSTEM.value in self.role_set
 
     def is_bceid_user(self) -> bool:
         """Return True if the user is BCEID user."""
@@ -110,22 +130,22 @@ class UserContext:  # pylint: disable=too-many-instance-attributes
         """Return the name."""
         return self._token_info
 
-    @property
+    @functools.cached_property
     def account_id_claim(self) -> dict:
         """Return the account id."""
-        return _get_token_info().get("Account-Id", None)
+        return self._token_info.get("Account-Id", None)
 
-    @property
+    @functools.cached_property
     def account_id(self) -> dict:
         """Return the account id."""
-        account_id = _get_token_info().get("Account-Id", None)
+        account_id = self.account_id_claim
         if not account_id:
             account_id = request.headers["Account-Id"] if request and "Account-Id" in request.headers else None
             if account_id == "undefined":
                 abort(HTTPStatus.BAD_REQUEST, description="Account-Id header contains invalid value 'undefined'")
         return account_id
 
-    @property
+    @functools.cached_property
     def linking_key(self) -> str | None:
         """Return the linking key from the request header."""
         return request.headers.get("Account-Linking-Key") if request else None
@@ -135,6 +155,13 @@ class UserContext:  # pylint: disable=too-many-instance-attributes
         """Return the login source."""
         return self._login_source
 
+    @property
+    def user_id(self) -> int | None:
+        """Return the id of the user in the token, resolved once per request."""
+        from auth_api.models.user import User as UserModel  # pylint:disable=cyclic-import, import-outside-toplevel
+
+        return UserModel.find_current_user_id()
+
 
 def user_context(function):
     """Add user context object as an argument to function."""
@@ -0,0 +1,114 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Write behind buffer for "last used" timestamps.
+
+Hot read paths record when a row was used without opening a write transaction. Timestamps are coalesced per row
+in memory and written by a background thread in one batched UPDATE every flush interval, so the column is at most
+one interval behind.
+"""
+
+import atexit
+import os
+import threading
+from datetime import datetime
+
+from flask import current_app
+from sqlalchemy import bindparam, func, update
+
+from auth_api.models.db import db
+
+
+class LastUsedBuffer:
+    """Coalesce last used timestamps per row id and flush them in batches."""
+
+    def __init__(self, model, column: str = "last_used", config_prefix: str = "LAST_USED"):
+        """Return a buffer for the given model column, configured by <config_prefix>_FLUSH_INTERVAL and _BUFFER_SIZE."""
+        self._table = model.__table__
+        self._column = column
+        self._config_prefix = config_prefix
+        self._pending: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._flusher_pid: int | None = None
+        self.dropped = 0
+
+    def record(self, identifier: int, used_at: datetime):
+        """Remember that the row was used, written straight through when the flush interval is 0."""
+        interval = current_app.config.get(f"{self._config_prefix}_FLUSH_INTERVAL", 30)
+        if interval <= 0:
+            self._write({identifier: used_at})
+            return
+
+        max_size = current_app.config.get(f"{self._config_prefix}_BUFFER_SIZE", 10000)
+        with self._lock:
+            if identifier in self._pending or len(self._pending) < max_size:
+                self._pending[identifier] = max(used_at, self._pending.get(identifier, used_at))
+            else:
+                # Full, the row is recorded again the next time it is used.
+                self.dropped += 1
+                self._wake.set()
+        self._ensure_flusher(interval)
+
+    def flush(self) -> int:
+        """Write every pending timestamp in one batched UPDATE, return the number of rows written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            self._write(pending)
+        except Exception as e:  # NOQA # pylint: disable=broad-except
+            current_app.logger.warning(f"Error on flushing {self._table.name}.{self._column}: {e}")
+            db.session.rollback()
+            with self._lock:
+                for identifier, used_at in pending.items():
+                    self._pending[identifier] = max(used_at, self._pending.get(identifier, used_at))
+            return 0
+        return len(pending)
+
+    def _write(self, pending: dict[int, datetime]):
+        column = self._table.c[self._column]
+        used_at = bindparam("b_used_at")
+        # Never move the timestamp backwards if another worker flushed a later use first.
+        statement = (
+            update(self._table)
+            .where(self._table.c.id == bindparam("b_id"))
+            .values({self._column: func.greatest(func.coalesce(column, used_at), used_at)})
+        )
+        db.session.execute(statement, [{"b_id": key, "b_used_at": value} for key, value in pending.items()])
+        db.session.commit()
+
+    def _ensure_flusher(self, interval: int):
+        """Start the flush thread for this process, once, after any fork."""
+        if self._flusher is not None and self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher is not None and self._flusher_pid == os.getpid():
+                return
+            app = current_app._get_current_object()  # pylint: disable=protected-access
+            self._flusher_pid = os.getpid()
+            self._flusher = threading.Thread(target=self._run, args=(app, interval), daemon=True)
+            self._flusher.start()
+            atexit.register(self._flush_with_app, app)
+
+    def _run(self, app, interval: int):
+        while True:
+            self._wake.wait(interval)
+            self._wake.clear()
+            self._flush_with_app(app)
+
+    def _flush_with_app(self, app):
+        with app.app_context():
+            self.flush()
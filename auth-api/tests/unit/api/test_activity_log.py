@@ -17,10 +17,12 @@ Test-Suite to ensure that the /Activity Log endpoint is working as expected.
 """
 
 import copy
+from datetime import datetime
 from http import HTTPStatus
 
 import pytest
 
+from auth_api.models import ActivityLog as ActivityLogModel
 from auth_api.schemas import utils as schema_utils
 from auth_api.utils.enums import ActivityAction
 from tests.utilities.factory_scenarios import TestJwtClaims, TestUserInfo
@@ -222,3 +224,36 @@ def test_activity_log_actions(client, jwt, session, action, item_name, item_valu
 
     activity_log = activity_logs.get("activityLogs")[0]
     assert activity_log.get("action") == expected_message
+
+
+def test_fetch_activity_log_by_cursor(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert that cursor pages join to the same activity logs, in the same order, as the offset pages."""
+    user = factory_user_model()
+    org = factory_org_model()
+    for index in range(5):
+        factory_activity_log_model(
+            actor=user.id, action=ActivityAction.CREATE_AFFILIATION.value, org_id=org.id, item_name=f"Business {index}"
+        )
+    # Distinct timestamps, out of id order, so the offset pages have a single order to match.
+    logs = ActivityLogModel.query.filter(ActivityLogModel.org_id == org.id).order_by(ActivityLogModel.id).all()
+    for log, day in zip(logs, [3, 1, 5, 2, 4], strict=True):
+        log.created = datetime(2026, 1, day)
+    session.commit()
+
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.staff_role)
+    url = f"/api/v1/orgs/{org.id}/activity-logs"
+    rv = client.get(f"{url}?limit=100", headers=headers, content_type="application/json")
+    expected = [log["itemName"] for log in rv.json["activityLogs"]]
+
+    pages, cursor = [], ""
+    while True:
+        rv = client.get(f"{url}?limit=2&cursor={cursor}", headers=headers, content_type="application/json")
+        assert rv.status_code == HTTPStatus.OK
+        pages.append([log["itemName"] for log in rv.json["activityLogs"]])
+        if not rv.json["hasMore"]:
+            assert "nextCursor" not in rv.json
+            break
+        cursor = rv.json["nextCursor"]
+
+    assert len(expected) == 5
+    assert [item_name for page in pages for item_name in page] == expected
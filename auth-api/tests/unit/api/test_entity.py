@@ -192,7 +192,7 @@ def test_get_entity_as_competent_authority(mock_auth_view, check_auth, client, j
     # was called and it fetched account id from context, then called
     # `get_all_product_subscription` with correct values
     mock_auth_view.find_account_authorization_by_org_id_and_product.assert_called_once_with(
-        headers["Account-Id"], "CA_SEARCH"
+        org_id=headers["Account-Id"], product="CA_SEARCH"
     )
     # make sure check_auth is not called, as it is a competent authority (skip auth)
     check_auth.assert_not_called()
@@ -532,6 +532,38 @@ def test_authorizations_for_affiliated_users_returns_200(client, jwt, session):
     assert rv.json.get("orgMembership") == "ADMIN"
 
 
+def test_batch_authorizations_for_affiliated_users_returns_200(client, jwt, session):  # pylint:disable=unused-argument
+    """Assert batch authorizations return one result per business identifier."""
+    user = factory_user_model()
+    org = factory_org_model()
+    factory_membership_model(user.id, org.id)
+    entity = factory_entity_model()
+    factory_affiliation_model(entity.id, org.id)
+
+    claims = copy.deepcopy(TestJwtClaims.edit_user_role.value)
+    claims["sub"] = str(user.keycloak_guid)
+
+    headers = factory_auth_header(jwt=jwt, claims=claims)
+    rv = client.post(
+        "/api/v1/entities/authorizations",
+        headers=headers,
+        data=json.dumps({"businessIdentifiers": [entity.business_identifier, "CP0000000"]}),
+        content_type="application/json",
+    )
+
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json["authorizations"][entity.business_identifier]["orgMembership"] == "ADMIN"
+    assert rv.json["authorizations"]["CP0000000"] == {}
+
+    rv = client.post(
+        "/api/v1/entities/authorizations",
+        headers=headers,
+        data=json.dumps({"businessIdentifiers": []}),
+        content_type="application/json",
+    )
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_authorizations_for_expanded_result(client, jwt, session):  # pylint:disable=unused-argument
     """Assert authorizations for affiliated users returns 200."""
     user = factory_user_model()
@@ -2743,6 +2743,59 @@ def test_delete_affiliation_no_payload(client, jwt, session, keycloak_mock):  #
     assert da.status_code == HTTPStatus.OK
 
 
+def test_bulk_affiliations(client, jwt, session, keycloak_mock):  # pylint:disable=unused-argument
+    """Assert that affiliations can be added and removed in bulk with a result per business."""
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.passcode)
+    client.post(
+        "/api/v1/entities",
+        data=json.dumps(TestEntityInfo.entity_lear_mock),
+        headers=headers,
+        content_type="application/json",
+    )
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.public_user_role)
+    client.post("/api/v1/users", headers=headers, content_type="application/json")
+    rv = client.post(
+        "/api/v1/orgs", data=json.dumps(TestOrgInfo.org1), headers=headers, content_type="application/json"
+    )
+    org_id = rv.json["id"]
+
+    rv = client.post(
+        f"/api/v1/orgs/{org_id}/affiliations/bulk",
+        data=json.dumps({"affiliations": [TestAffliationInfo.affiliation3, TestAffliationInfo.affiliation3]}),
+        headers=headers,
+        content_type="application/json",
+    )
+    assert rv.status_code == HTTPStatus.OK
+    assert [result["status"] for result in rv.json["results"]] == [HTTPStatus.CREATED, HTTPStatus.BAD_REQUEST]
+
+    rv = client.post(
+        f"/api/v1/orgs/{org_id}/affiliations/bulk",
+        data=json.dumps({"affiliations": []}),
+        headers=headers,
+        content_type="application/json",
+    )
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+    business_identifier = TestEntityInfo.entity_lear_mock["businessIdentifier"]
+    rv = client.delete(
+        f"/api/v1/orgs/{org_id}/affiliations/bulk",
+        data=json.dumps({"businessIdentifiers": [business_identifier]}),
+        headers=headers,
+        content_type="application/json",
+    )
+    assert rv.status_code == HTTPStatus.UNAUTHORIZED
+
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.staff_manage_business)
+    rv = client.delete(
+        f"/api/v1/orgs/{org_id}/affiliations/bulk",
+        data=json.dumps({"businessIdentifiers": [business_identifier]}),
+        headers=headers,
+        content_type="application/json",
+    )
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json["results"] == [{"businessIdentifier": business_identifier, "status": HTTPStatus.OK}]
+
+
 def test_delete_affiliation_payload_no_mail(client, jwt, session, keycloak_mock):  # pylint:disable=unused-argument
     """Assert that an affiliation for an org can be removed."""
     headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.passcode)
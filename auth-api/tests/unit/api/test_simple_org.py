@@ -226,3 +226,34 @@ def test_simple_org_search(client, jwt, session, keycloak_mock):  # pylint:disab
     assert result["total"] == 4
     assert result["limit"] == 1
     assert_simple_org(result["items"][0], org_branch_2)
+
+
+def test_simple_org_search_by_cursor(client, jwt, session, keycloak_mock):  # pylint:disable=unused-argument
+    """Assert that cursor pages join to the same orgs, in the same order, as the offset search."""
+    for letter in "ABCDE":
+        # The names tie on similarity, each page boundary falls inside the tie.
+        OrgModel(
+            name=f"TST CURSOR {letter}", type_code=OrgType.PREMIUM.value, status_code=OrgStatus.ACTIVE.value
+        ).save()
+    headers = factory_auth_header(jwt=jwt, claims=TestJwtClaims.manage_eft_role)
+
+    for search in ["name=tst cursor", "searchText=tst cursor"]:
+        rv = client.get(f"/api/v1/orgs/simple?{search}&limit=100", headers=headers, content_type="application/json")
+        expected = [item["id"] for item in rv.json["items"]]
+
+        pages, cursor = [], ""
+        while True:
+            rv = client.get(
+                f"/api/v1/orgs/simple?{search}&limit=2&cursor={cursor}",
+                headers=headers,
+                content_type="application/json",
+            )
+            assert rv.status_code == HTTPStatus.OK
+            pages.append([item["id"] for item in rv.json["items"]])
+            if not rv.json["hasMore"]:
+                assert "nextCursor" not in rv.json
+                break
+            cursor = rv.json["nextCursor"]
+
+        assert len(expected) == 5
+        assert [org_id for page in pages for org_id in page] == expected
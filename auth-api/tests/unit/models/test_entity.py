@@ -16,7 +16,12 @@
 Test suite to ensure that the Entity model routines are working as expected.
 """
 
+from sqlalchemy import inspect
+
+from auth_api.models import Affiliation as AffiliationModel
 from auth_api.models import Entity as EntityModel
+from auth_api.utils.enums import EntityLoad
+from tests.utilities.factory_utils import factory_org_model
 
 
 def test_entity(session):
@@ -46,6 +51,27 @@ def test_entity_find_by_business_id(session):
     assert result_entity.corp_type_code == "CP"
 
 
+def test_entity_find_by_business_id_load_profiles(session):
+    """Assert that the load profiles only load the relationships they ask for."""
+    entity = EntityModel(
+        business_identifier="CP1234567", business_number="791861073BC0001", name="Foobar, Inc.", corp_type_code="CP"
+    )
+    session.add(entity)
+    session.commit()
+    AffiliationModel(org_id=factory_org_model().id, entity_id=entity.id).save()
+
+    expected_unloaded = {
+        EntityLoad.MINIMAL: {"corp_type", "affiliations"},
+        EntityLoad.AUTHORIZATION: {"affiliations"},
+        EntityLoad.AFFILIATIONS: set(),
+    }
+    for load, unloaded in expected_unloaded.items():
+        session.expunge_all()
+        result_entity = EntityModel.find_by_business_identifier("CP1234567", load=load)
+        assert inspect(result_entity).unloaded & {"corp_type", "affiliations"} == unloaded
+        assert len(result_entity.affiliations) == 1
+
+
 def test_create_from_dict(session):  # pylint:disable=unused-argument
     """Assert that an Entity can be created from schema."""
     updated_entity_info = {
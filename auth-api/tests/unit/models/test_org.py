@@ -16,6 +16,9 @@
 Test suite to ensure that the Org model routines are working as expected.
 """
 
+import dataclasses
+from datetime import datetime
+
 import pytest
 
 from auth_api.exceptions.errors import Error
@@ -24,6 +27,7 @@ from auth_api.models import Org as OrgModel
 from auth_api.models import OrgStatus as OrgStatusModel
 from auth_api.models import OrgType as OrgTypeModel
 from auth_api.models import PaymentType as PaymentTypeModel
+from auth_api.models.dataclass import OrgSearch
 from auth_api.utils.enums import OrgStatus as OrgStatusEnum
 from auth_api.utils.enums import OrgType as OrgTypeEnum
 from tests.utilities.factory_utils import factory_user_model
@@ -132,6 +136,39 @@ def test_find_similar_org_by_name(session):  # pylint:disable=unused-argument
     assert not found_org
 
 
+def test_search_org_ranks_closest_names_first(session):  # pylint:disable=unused-argument
+    """Assert that a name search returns the closest names first, not the newest."""
+    for name in ("Law Corp", "Law Corporation Holdings Of Greater Vancouver", "Smith Law Corp"):
+        OrgModel(name=name, type_code=OrgTypeEnum.PREMIUM.value, status_code=OrgStatusEnum.ACTIVE.value).save()
+
+    search = OrgSearch(
+        name="law corp",
+        branch_name=None,
+        business_identifier=None,
+        statuses=[],
+        access_type=[],
+        bcol_account_id=None,
+        id=None,
+        decision_made_by=None,
+        org_type=None,
+        include_members=False,
+        member_search_text=None,
+        suspended_date_from=None,
+        suspended_date_to=None,
+        suspension_reason_code=None,
+        page=1,
+        limit=10,
+    )
+    orgs, total = OrgModel.search_org(search)
+
+    assert total == 3
+    assert [org.name for org in orgs] == [
+        "Law Corp",
+        "Smith Law Corp",
+        "Law Corporation Holdings Of Greater Vancouver",
+    ]
+
+
 def test_find_similar_org_by_name_inactive(session):  # pylint:disable=unused-argument
     """Assert that an inactive Org can not be retrieved by its name."""
     org = factory_org_model(name="My Test Org", session=session)
@@ -206,3 +243,70 @@ def test_invalid_org_create_type_code(session):
         session.commit()
 
     assert excinfo.value.code == Error.INSUFFICIENT_PERMISSION.name
+
+
+def _org_search(**kwargs) -> OrgSearch:
+    search = {
+        "name": None,
+        "branch_name": None,
+        "business_identifier": None,
+        "statuses": [],
+        "access_type": [],
+        "bcol_account_id": None,
+        "id": None,
+        "decision_made_by": None,
+        "org_type": None,
+        "include_members": False,
+        "member_search_text": None,
+        "suspended_date_from": None,
+        "suspended_date_to": None,
+        "suspension_reason_code": None,
+        "page": 1,
+        "limit": 2,
+    }
+    return OrgSearch(**{**search, **kwargs})
+
+
+def _search_org_pages(search: OrgSearch) -> list[list[int]]:
+    """Return the org ids of each page, following nextCursor from the first page."""
+    search = dataclasses.replace(search, cursor="")
+    pages = []
+    while True:
+        pagination = OrgModel.search_org_by_cursor(search)
+        pages.append([org.id for org in pagination.items])
+        if not pagination.has_more:
+            assert pagination.next_cursor is None
+            return pages
+        search.cursor = pagination.next_cursor
+
+
+@pytest.mark.parametrize(
+    "search_kwargs",
+    [
+        # Every name ties on similarity, so each page boundary falls inside a tie.
+        {"name": "cursor org"},
+        # suspended_on is null for some of the orgs.
+        {"statuses": [OrgStatusEnum.SUSPENDED.value]},
+        # The perfect id match sorts first, on a boolean key.
+        {"id": "900001"},
+    ],
+)
+def test_search_org_by_cursor(session, search_kwargs):  # pylint:disable=unused-argument
+    """Assert that cursor pages join to the same orgs, in the same order, as the offset search."""
+    for index, org_id in enumerate([900001, 9000010, 9000011, 9000012, 1900001]):
+        OrgModel(
+            id=org_id,
+            name=f"Cursor Org {chr(ord('A') + index)}",
+            type_code=OrgTypeEnum.PREMIUM.value,
+            status_code=OrgStatusEnum.SUSPENDED.value,
+            suspended_on=datetime(2026, 1, 1 + index) if index % 2 else None,
+            created=datetime(2025, 1, 1 + index),
+        ).save()
+    search = _org_search(**search_kwargs)
+
+    expected, total = OrgModel.search_org(dataclasses.replace(search, limit=100))
+    pages = _search_org_pages(search)
+
+    assert total == 5
+    assert all(len(page) <= 2 for page in pages)
+    assert [org_id for page in pages for org_id in page] == [org.id for org in expected]
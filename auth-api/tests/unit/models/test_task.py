@@ -18,9 +18,20 @@ Test suite to ensure that the Staff Task model routines are working as expected.
 
 from _datetime import datetime
 
+import pytest
+
+from auth_api.exceptions import BusinessException
+from auth_api.exceptions.errors import Error
 from auth_api.models import Task as TaskModel
 from auth_api.models.dataclass import TaskSearch
-from auth_api.utils.enums import TaskAction, TaskRelationshipStatus, TaskRelationshipType, TaskStatus, TaskTypePrefix
+from auth_api.utils.enums import (
+    CountStrategy,
+    TaskAction,
+    TaskRelationshipStatus,
+    TaskRelationshipType,
+    TaskStatus,
+    TaskTypePrefix,
+)
 from tests.utilities.factory_utils import factory_task_models, factory_user_model
 
 
@@ -294,3 +305,75 @@ def test_fetch_tasks_by_action(session):  # pylint:disable=unused-argument
     found_tasks, count = TaskModel.fetch_tasks(task_search)
     assert count == 1
     assert found_tasks[0].action == TaskAction.NEW_PRODUCT_FEE_REVIEW.value
+
+
+def test_fetch_tasks_by_cursor(session):  # pylint:disable=unused-argument
+    """Assert that cursor pages walk every task once, in fetch_tasks order, and reject a bad cursor."""
+    user = factory_user_model()
+    submitted = datetime(2026, 1, 1)
+    for index in range(5):
+        TaskModel(
+            name=f"TEST {index}",
+            date_submitted=submitted.replace(day=1 + index // 2),
+            relationship_type=TaskRelationshipType.ORG.value,
+            relationship_id=10,
+            type=TaskTypePrefix.NEW_ACCOUNT_STAFF_REVIEW.value,
+            status=TaskStatus.OPEN.value,
+            related_to=user.id,
+        ).save()
+
+    task_search = TaskSearch(status=[TaskStatus.OPEN.value], submitted_sort_order="desc", limit=2, cursor="")
+    found_tasks = []
+    while True:
+        pagination = TaskModel.fetch_tasks_by_cursor(task_search)
+        found_tasks.extend(pagination.items)
+        assert len(pagination.items) <= 2
+        if not pagination.has_more:
+            assert pagination.next_cursor is None
+            break
+        task_search.cursor = pagination.next_cursor
+
+    assert len({task.id for task in found_tasks}) == 5
+    dates = [task.date_submitted for task in found_tasks]
+    assert dates == sorted(dates, reverse=True)
+
+    task_search.cursor = "not-a-cursor"
+    with pytest.raises(BusinessException) as exception:
+        TaskModel.fetch_tasks_by_cursor(task_search)
+    assert exception.value.code == Error.INVALID_INPUT.name
+
+
+def test_fetch_tasks_count_strategies(session):  # pylint:disable=unused-argument
+    """Assert that fetch_tasks counts exactly, estimates, or reuses a cached count for the same filters."""
+    user = factory_user_model()
+
+    def add_task():
+        TaskModel(
+            name="TEST",
+            date_submitted=datetime.now(),
+            relationship_type=TaskRelationshipType.ORG.value,
+            relationship_id=10,
+            type=TaskTypePrefix.NEW_ACCOUNT_STAFF_REVIEW.value,
+            status=TaskStatus.OPEN.value,
+            related_to=user.id,
+        ).save()
+
+    add_task()
+    task_search = TaskSearch(status=[TaskStatus.OPEN.value], name="TEST", count=CountStrategy.CACHED.value)
+    _, count = TaskModel.fetch_tasks(task_search)
+    assert count == 1
+
+    add_task()
+    _, count = TaskModel.fetch_tasks(task_search)
+    assert count == 1
+    task_search.count = CountStrategy.EXACT.value
+    _, count = TaskModel.fetch_tasks(task_search)
+    assert count == 2
+    task_search.count = CountStrategy.ESTIMATE.value
+    _, count = TaskModel.fetch_tasks(task_search)
+    assert isinstance(count, int)
+
+    task_search.count = "approximately"
+    with pytest.raises(BusinessException) as exception:
+        TaskModel.fetch_tasks(task_search)
+    assert exception.value.code == Error.INVALID_INPUT.name
@@ -17,7 +17,10 @@
 Test-Suite to ensure that the User Class is working as expected.
 """
 
+from unittest.mock import patch
+
 from auth_api.models import User
+from auth_api.utils.enums import UserStatus
 from tests.utilities.factory_utils import patch_token_info
 
 
@@ -54,6 +57,29 @@ def test_user_find_by_jwt_token(session, monkeypatch):
     assert u.id is not None
 
 
+def test_find_by_jwt_token_resolved_once_per_request(session, monkeypatch):  # pylint: disable=unused-argument
+    """Assert the token user is loaded once, and a missing user is looked up again once one is created."""
+    token = {
+        "preferred_username": "CP1234567",
+        "sub": "1b20db59-19a0-4727-affe-c6f64309fd04",
+        "realm_access": {"roles": ["edit", "uma_authorization", "basic"]},
+    }
+    patch_token_info(token, monkeypatch)
+    with patch.object(User, "_query_by_jwt_token", wraps=User._query_by_jwt_token) as query:
+        assert User.find_by_jwt_token() is None
+        assert User.find_current_user_id() is None
+        assert query.call_count == 1
+
+        user = User(username="CP1234567", keycloak_guid="1b20db59-19a0-4727-affe-c6f64309fd04")
+        session.add(user)
+        session.commit()
+        calls = query.call_count
+
+        assert User.find_current_user_id() == user.id
+        assert User.find_by_jwt_token() == user
+        assert query.call_count == calls + 1
+
+
 def test_create_from_jwt_token(session, monkeypatch):  # pylint: disable=unused-argument
     """Assert User is created from the JWT fields."""
     token = {
@@ -194,3 +220,18 @@ def test_user_delete(session):  # pylint: disable=unused-argument
     user.delete()
 
     assert user.id is not None
+
+
+def test_search_name_matches(session):  # pylint: disable=unused-argument
+    """Assert users are found by "first last" or "last first username", ignoring case."""
+    user = User(username="jsmith", firstname="John", lastname="Smith", status=UserStatus.ACTIVE.value)
+    user.save()
+
+    for search_text in ("john smith", "SMITH JOHN", "smith john jsmith", "JSmi"):
+        assert session.scalars(User.search_name_matches(search_text)).all() == [user.id]
+    assert not session.scalars(User.search_name_matches("jane smith")).all()
+
+    user.status = UserStatus.INACTIVE.value
+    user.save()
+    assert session.scalars(User.search_name_matches("john smith")).all() == [user.id]
+    assert not session.scalars(User.search_name_matches("john smith", active_only=True)).all()
@@ -19,7 +19,8 @@ Test suite to ensure that the Authorizations view routines are working as expect
 import uuid
 
 from auth_api.models.views.authorization import Authorization
-from auth_api.utils.enums import ProductCode
+from auth_api.utils.enums import ProductCode, Status
+from tests.utilities.factory_scenarios import TestEntityInfo
 from tests.utilities.factory_utils import (
     factory_affiliation_model,
     factory_entity_model,
@@ -113,3 +114,53 @@ def test_find_user_authorization_by_business_number_product(session):  # pylint:
 
     assert authorization is not None
     assert authorization.product_code == ProductCode.DIR_SEARCH.value
+
+
+def test_authorizations_follow_membership_and_affiliation_changes(session):  # pylint:disable=unused-argument
+    """Assert that the materialized authorizations track membership and affiliation changes."""
+    user = factory_user_model()
+    org = factory_org_model()
+    membership = factory_membership_model(user.id, org.id)
+    entity = factory_entity_model()
+    affiliation = factory_affiliation_model(entity.id, org.id)
+    assert Authorization.find_user_authorization_by_business_number(entity.business_identifier, str(user.keycloak_guid))
+
+    affiliation.delete()
+    assert (
+        Authorization.find_user_authorization_by_business_number(entity.business_identifier, str(user.keycloak_guid))
+        is None
+    )
+    assert Authorization.find_user_authorization_by_org_id(str(user.keycloak_guid), org.id) is not None
+
+    membership.status = Status.INACTIVE.value
+    membership.save()
+    assert Authorization.find_user_authorization_by_org_id(str(user.keycloak_guid), org.id) is None
+    assert Authorization.check_consistency(org.id) == {"missing": 0, "unexpected": 0}
+
+
+def test_authorizations_with_many_affiliations_and_products(session):  # pylint:disable=unused-argument
+    """Assert that a member of an org with several affiliations and active products gets one authorization."""
+    user = factory_user_model()
+    org = factory_org_model()
+    membership = factory_membership_model(user.id, org.id)
+    entities = [factory_entity_model(entity_info) for entity_info in (TestEntityInfo.entity1, TestEntityInfo.entity2)]
+    for entity in entities:
+        factory_affiliation_model(entity.id, org.id)
+    factory_product_model(org.id, product_code=ProductCode.BUSINESS.value)
+    factory_product_model(org.id, product_code=ProductCode.PPR.value)
+    keycloak_guid = str(user.keycloak_guid)
+
+    authorization = Authorization.find_user_authorization_by_org_id(keycloak_guid, org.id)
+    assert authorization.org_membership == membership.membership_type_code
+    authorization = Authorization.find_user_authorization_by_business_number(
+        entities[0].business_identifier, keycloak_guid, org.id
+    )
+    assert authorization.business_identifier == entities[0].business_identifier
+    authorization = Authorization.find_account_authorization_by_org_id_and_product_for_user(
+        keycloak_guid, org.id, ProductCode.PPR.value
+    )
+    assert authorization.product_code == ProductCode.PPR.value
+
+    authorizations = Authorization.find_all_authorizations_for_user(keycloak_guid)
+    assert len(authorizations) == 1
+    assert authorizations[0].org_id == org.id
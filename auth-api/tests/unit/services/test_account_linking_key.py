@@ -21,6 +21,7 @@ from sbc_common_components.utils.enums import QueueMessageTypes
 
 from auth_api.models.account_linking_key import AccountLinkingKey as AccountLinkingKeyModel
 from auth_api.services.account_linking_key import AccountLinkingKey as AccountLinkingKeyService
+from auth_api.services.account_linking_key import last_used_buffer
 from auth_api.utils.enums import LinkingKeyStatus
 from tests.utilities.factory_utils import (
     factory_linking_key_model,
@@ -197,6 +198,27 @@ def test_validate_updates_last_used(session):  # pylint:disable=unused-argument
     assert updated.last_used is not None
 
 
+def test_validate_buffers_last_used(session, app):  # pylint:disable=unused-argument
+    """Assert that buffered last_used values are coalesced and written on flush."""
+    lawfirm = factory_org_model()
+    vendor = factory_org_model()
+    record = factory_linking_key_model(account_id=lawfirm.id, vendor_account_id=vendor.id)
+
+    app.config["LINKING_KEY_LAST_USED_FLUSH_INTERVAL"] = 3600
+    try:
+        with patch.object(last_used_buffer, "_ensure_flusher"):
+            with freeze_time("2026-07-01 12:00:00+00:00"):
+                AccountLinkingKeyService.validate(record.linking_key, vendor.id)
+            with freeze_time("2026-07-01 12:05:00+00:00"):
+                AccountLinkingKeyService.validate(record.linking_key, vendor.id)
+        assert AccountLinkingKeyModel.query.get(record.id).last_used is None
+
+        assert last_used_buffer.flush() == 1
+        assert AccountLinkingKeyModel.query.get(record.id).last_used == datetime(2026, 7, 1, 12, 5, tzinfo=UTC)
+    finally:
+        app.config["LINKING_KEY_LAST_USED_FLUSH_INTERVAL"] = 0
+
+
 @freeze_time("2026-07-01 12:00:00+00:00")
 def test_generate_with_vendor_publishes_link_created(session):  # pylint:disable=unused-argument
     """Assert that generating an immediately-active key publishes an ACCOUNT_LINK_CREATED notification."""
@@ -17,7 +17,8 @@ Test suite to ensure that the Affiliation service routines are working as expect
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
+from http import HTTPStatus
 from unittest import mock
 from unittest.mock import ANY, patch
 
@@ -27,12 +28,14 @@ from freezegun import freeze_time
 from auth_api.exceptions import BusinessException
 from auth_api.exceptions.errors import Error
 from auth_api.models.affiliation import Affiliation as AffiliationModel
-from auth_api.models.dataclass import Activity, DeleteAffiliationRequest
+from auth_api.models.dataclass import Activity, AffiliationBase, AffiliationSearchDetails, DeleteAffiliationRequest
 from auth_api.models.dataclass import Affiliation as AffiliationData
 from auth_api.models.org import Org as OrgModel
 from auth_api.services import ActivityLogPublisher
 from auth_api.services import Affiliation as AffiliationService
-from auth_api.utils.enums import ActivityAction, OrgType
+from auth_api.services.colin import Colin as ColinService
+from auth_api.services.rest_service import RestService
+from auth_api.utils.enums import ActivityAction, CorpType, NRActionCodes, NRStatus, OrgType
 from tests.conftest import mock_token
 from tests.utilities.factory_scenarios import (
     TestContactInfo,
@@ -467,6 +470,47 @@ def test_delete_affiliation(session, auth_mock, monkeypatch):  # pylint:disable=
     assert found_affiliation is None
 
 
+def test_create_and_delete_affiliations(session, auth_mock, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that affiliations can be created and deleted in bulk with a result per business."""
+    business_identifier = factory_entity_service(TestEntityInfo.entity_lear_mock).as_dict()["business_identifier"]
+    business_identifier2 = factory_entity_service(TestEntityInfo.entity_lear_mock2).as_dict()["business_identifier"]
+    org_id = factory_org_service().as_dict()["id"]
+    patch_token_info(TestJwtClaims.user_test, monkeypatch)
+    pass_code = TestEntityInfo.entity_lear_mock["passCode"]
+
+    with (
+        patch.object(ActivityLogPublisher, "publish_activity", return_value=None) as mock_alp,
+        patch.object(ColinService, "fetch_auth_info", return_value=None),
+    ):
+        results = AffiliationService.create_affiliations(
+            org_id,
+            [
+                {"businessIdentifier": business_identifier, "passCode": pass_code},
+                {"businessIdentifier": business_identifier, "passCode": pass_code},
+                {"businessIdentifier": business_identifier2, "passCode": "wrong"},
+                {"businessIdentifier": "CP0000000"},
+            ],
+        )
+        assert mock_alp.call_count == 1
+
+    assert [(result["status"], result.get("code")) for result in results] == [
+        (HTTPStatus.CREATED, None),
+        (HTTPStatus.BAD_REQUEST, Error.DATA_ALREADY_EXISTS.name),
+        (HTTPStatus.UNAUTHORIZED, Error.INVALID_USER_CREDENTIALS.name),
+        (HTTPStatus.NOT_FOUND, Error.DATA_NOT_FOUND.name),
+    ]
+    assert len(AffiliationModel.find_affiliations_by_org_id(org_id)) == 1
+
+    with patch.object(ActivityLogPublisher, "publish_activity", return_value=None) as mock_alp:
+        results = AffiliationService.delete_affiliations(org_id, [business_identifier, business_identifier2])
+        mock_alp.assert_called_once_with(
+            Activity(action=ActivityAction.REMOVE_AFFILIATION.value, org_id=ANY, name=ANY, id=business_identifier)
+        )
+
+    assert [result["status"] for result in results] == [HTTPStatus.OK, HTTPStatus.NOT_FOUND]
+    assert not AffiliationModel.find_affiliations_by_org_id(org_id)
+
+
 def test_delete_affiliation_no_org(session, auth_mock, monkeypatch):  # pylint:disable=unused-argument
     """Assert that an affiliation can not be deleted without org."""
     entity_service = factory_entity_service(TestEntityInfo.entity_lear_mock)
@@ -787,3 +831,166 @@ def test_find_affiliation(session, auth_mock):  # pylint:disable=unused-argument
         nested_org = nested["organization"]
         assert nested_org["uuid"] == str(org_dictionary["uuid"])
         assert nested_org["name"] == org_dictionary["name"]
+
+
+def _affiliation_details_payload(count: int):
+    """Return LEAR and Names responses plus affiliation bases for count synthetic affiliations."""
+    businesses, drafts, name_requests, bases = [], [], [], []
+    states = [NRStatus.APPROVED.value, NRStatus.CONSUMED.value, NRStatus.DRAFT.value]
+    for index in range(count):
+        created = datetime(2020, 1, 1) + timedelta(minutes=index)
+        if index % 5 in (0, 1):
+            nr_num = f"NR {index:07d}"
+            name_requests.append(
+                {"nrNum": nr_num, "stateCd": states[index % 3], "request_action_cd": NRActionCodes.AMALGAMATE.value}
+            )
+            bases.append(AffiliationBase(identifier=nr_num, created=created))
+            if index % 5 == 0:
+                drafts.append({"identifier": f"T{index:07d}", "nrNumber": nr_num, "draftType": CorpType.RTMP.value})
+                bases.append(AffiliationBase(identifier=f"T{index:07d}", created=created))
+        elif index % 5 == 2:
+            # Stale draft, its NR is not in the Names response.
+            drafts.append({"identifier": f"T{index:07d}", "nrNumber": f"NR {index + count:07d}", "draftType": "T"})
+        elif index % 5 == 3:
+            drafts.append({"identifier": f"T{index:07d}", "nrNumber": None, "draftType": CorpType.RTMP.value})
+            bases.append(AffiliationBase(identifier=f"T{index:07d}", created=created))
+        else:
+            businesses.append({"identifier": f"BC{index:07d}", "nrNumber": None})
+            bases.append(AffiliationBase(identifier=f"BC{index:07d}", created=created))
+    details = [{"businessEntities": businesses, "draftEntities": drafts}, {"requests": name_requests}]
+    return details, bases
+
+
+def test_combine_affiliation_details():
+    """Assert that NRs, drafts and businesses are merged in the expected order."""
+    details, _ = _affiliation_details_payload(15)
+    combined = AffiliationService._combine_affiliation_details(details)
+    identifiers = [item.get("identifier") or item["nameRequest"]["nrNum"] for item in combined]
+    # Unmatched NRs, drafts that are neither stale nor consumed, then businesses.
+    assert identifiers == [
+        "NR 0000001",
+        "NR 0000006",
+        "NR 0000011",
+        "T0000000",
+        "T0000003",
+        "T0000005",
+        "T0000008",
+        "T0000013",
+        "BC0000004",
+        "BC0000009",
+        "BC0000014",
+    ]
+    assert combined[3]["nameRequest"]["nrNum"] == "NR 0000000"
+    assert combined[3]["draftType"] == CorpType.ATMP.value
+
+    details, _ = _affiliation_details_payload(15)
+    combined = AffiliationService._combine_affiliation_details(details, remove_stale_drafts=False)
+    identifiers = [item.get("identifier") or item["nameRequest"]["nrNum"] for item in combined]
+    assert "T0000002" in identifiers
+    # T0000010 has a consumed NR, it is dropped either way.
+    assert "T0000010" not in identifiers
+
+
+def test_get_affiliation_details_partial(app, session, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that identifiers are sent in chunks and a failed chunk is returned as missing."""
+    monkeypatch.setitem(app.config, "AFFILIATION_DETAILS_CHUNK_SIZE", 2)
+    nr_url = AffiliationService._affiliation_details_url("NR 0000001")
+    calls = []
+
+    async def call_posts_in_parallel(call_info, token, org_id, failed_calls=None, **kwargs):
+        calls.extend(call_info)
+        failed_calls.extend(call for call in call_info if call["url"] == nr_url)
+        return [
+            {
+                "businessEntities": [{"identifier": identifier} for identifier in call["payload"]["identifiers"]],
+                "draftEntities": [],
+            }
+            for call in call_info
+            if call["url"] != nr_url
+        ]
+
+    monkeypatch.setattr(RestService, "call_posts_in_parallel", call_posts_in_parallel)
+    monkeypatch.setattr(RestService, "get_service_account_token", mock_token)
+    bases = [
+        AffiliationBase(identifier=identifier, created=datetime(2020, 1, 1))
+        for identifier in ["BC0000001", "BC0000002", "BC0000003", "NR 0000001"]
+    ]
+    search_details = AffiliationSearchDetails(page=1, limit=100000)
+    combined, _, missing = AffiliationService.get_affiliation_details(bases, search_details, 1, True)
+
+    assert [call["payload"]["identifiers"] for call in calls] == [
+        ["BC0000001", "BC0000002"],
+        ["BC0000003"],
+        ["NR 0000001"],
+    ]
+    assert sorted(item["identifier"] for item in combined) == ["BC0000001", "BC0000002", "BC0000003"]
+    assert missing == ["NR 0000001"]
+
+
+def test_stream_affiliation_details(app, session, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that entities are streamed per chunk, drafts wait for their NR and a summary line comes last."""
+    monkeypatch.setitem(app.config, "AFFILIATION_DETAILS_CHUNK_SIZE", 1)
+    nr_url = AffiliationService._affiliation_details_url("NR 0000001")
+
+    async def call_posts_in_parallel(call_info, token, org_id, failed_calls=None, **kwargs):
+        (call,) = call_info
+        (identifier,) = call["payload"]["identifiers"]
+        if call["url"] == nr_url:
+            return [{"requests": [{"nrNum": identifier, "stateCd": "APPROVED"}]}]
+        if identifier == "BC0000002":
+            failed_calls.append(call)
+            return []
+        if identifier.startswith("T"):
+            return [{"businessEntities": [], "draftEntities": [{"identifier": identifier, "nrNumber": "NR 0000001"}]}]
+        return [{"businessEntities": [{"identifier": identifier}], "draftEntities": [], "hasMore": True}]
+
+    monkeypatch.setattr(RestService, "call_posts_in_parallel", call_posts_in_parallel)
+    monkeypatch.setattr(RestService, "get_service_account_token", mock_token)
+    bases = [
+        AffiliationBase(identifier=identifier, created=datetime(2020, 1, 1))
+        for identifier in ["BC0000001", "BC0000002", "T0000001", "NR 0000001"]
+    ]
+    search_details = AffiliationSearchDetails(page=1, limit=100000)
+    records = list(AffiliationService.stream_affiliation_details(bases, search_details, 1, True))
+
+    *entities, summary = records
+    assert entities[0] == {"entity": {"identifier": "BC0000001"}}
+    assert entities[1]["entity"]["identifier"] == "T0000001"
+    assert entities[1]["entity"]["nameRequest"]["nrNum"] == "NR 0000001"
+    assert len(entities) == 2
+    assert summary == {"summary": {"hasMore": True, "missingIdentifiers": ["BC0000002"]}}
+
+
+class _CountingDict(dict):
+    """Dict that counts key lookups, a deterministic stand-in for the time spent merging."""
+
+    lookups = 0
+
+    def get(self, key, default=None):
+        _CountingDict.lookups += 1
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        _CountingDict.lookups += 1
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        _CountingDict.lookups += 1
+        return super().__contains__(key)
+
+
+def test_combine_affiliation_details_linear():
+    """Assert that merging affiliation details reads each payload entry a constant number of times."""
+    per_item = {}
+    for count in (1000, 10000):
+        details, bases = _affiliation_details_payload(count)
+        details = [
+            {key: [_CountingDict(entry) for entry in entries] for key, entries in response.items()}
+            for response in details
+        ]
+        _CountingDict.lookups = 0
+        combined = AffiliationService._combine_affiliation_details(details)
+        AffiliationService._sort_affiliations_by_created(combined, bases)
+        per_item[count] = _CountingDict.lookups / count
+    # A merge that scans the drafts or businesses per NR does ~10x the lookups per item at 10k than at 1k.
+    assert per_item[10000] <= per_item[1000] * 1.1
@@ -383,6 +383,60 @@ def test_enrich_affiliation_invitations_colin_entity_fallback(session, monkeypat
     assert result[1].entity is None
 
 
+def test_enrich_affiliation_invitations_bulk_lookup(session, monkeypatch, mock_service_account_token):
+    """Assert businesses are looked up once per identifier and COLIN fallbacks are loaded in one query."""
+    requested = []
+
+    def mock_get_multiple_business_details(business_identifiers, token):
+        requested.append(business_identifiers)
+        return [{"identifier": "BC0000001", "legalName": "LEAR CORP", "legalType": "BC", "state": "ACTIVE"}]
+
+    monkeypatch.setattr(
+        "auth_api.services.affiliation_invitation.AffiliationInvitation._get_multiple_business_details",
+        mock_get_multiple_business_details,
+    )
+    colin_identifiers = [f"BC000077{i}" for i in range(3)]
+    for identifier in colin_identifiers:
+        factory_entity_model(
+            {
+                "businessIdentifier": identifier,
+                "name": f"COLIN CORP {identifier}",
+                "corpTypeCode": "BC",
+                "isLoadedLear": False,
+                "passCode": "111222333",
+            }
+        )
+    identifiers = ["BC0000001", *colin_identifiers] * 2
+    affiliation_invitation_dicts = [
+        {
+            "id": invite_id,
+            "business_identifier": identifier,
+            "from_org": {"id": 100, "name": "Test Org", "org_type": "PREMIUM"},
+            "to_org": None,
+            "status": "PENDING",
+            "type": "EMAIL",
+        }
+        for invite_id, identifier in enumerate(identifiers, start=1)
+    ]
+
+    with (
+        patch.object(EntityModel, "find_by_business_identifier") as mock_find_one,
+        patch.object(
+            EntityModel, "find_by_business_identifiers", wraps=EntityModel.find_by_business_identifiers
+        ) as mock_find_many,
+    ):
+        result = AffiliationInvitationService.enrich_affiliation_invitations_dict_list_with_business_data(
+            affiliation_invitation_dicts
+        )
+
+    assert requested == [["BC0000001", *colin_identifiers]]
+    mock_find_one.assert_not_called()
+    mock_find_many.assert_called_once_with(colin_identifiers)
+    assert [invitation.entity.business_identifier for invitation in result] == identifiers
+    assert result[0].entity.name == "LEAR CORP"
+    assert result[1].entity.name == f"COLIN CORP {colin_identifiers[0]}"
+
+
 def test_as_dict(session, auth_mock, keycloak_mock, business_mock, monkeypatch, mock_service_account_token):  # pylint:disable=unused-argument
     """Assert that the Affiliation Invitation is exported correctly as a dictionary."""
     with patch.object(AffiliationInvitationService, "send_affiliation_invitation", return_value=None):
@@ -89,6 +89,32 @@ def test_get_user_authorizations_for_entity(session, monkeypatch):  # pylint:dis
     assert authorization.get("orgMembership", None) == membership.membership_type_code
 
 
+def test_get_user_authorizations_for_entities(session, monkeypatch):  # pylint:disable=unused-argument
+    """Assert that batch authorizations match the single entity lookups."""
+    user = factory_user_model()
+    org = factory_org_model()
+    membership = factory_membership_model(user.id, org.id)
+    entity = factory_entity_model()
+    factory_affiliation_model(entity.id, org.id)
+    other_entity = factory_entity_model(entity_info=TestEntityInfo.entity2)
+    patch_token_info({"sub": str(user.keycloak_guid), "realm_access": {"roles": ["basic"]}}, monkeypatch)
+
+    authorizations = Authorization.get_user_authorizations_for_entities(
+        [entity.business_identifier, other_entity.business_identifier, entity.business_identifier]
+    )
+    assert list(authorizations) == [entity.business_identifier, other_entity.business_identifier]
+    assert authorizations[entity.business_identifier] == Authorization.get_user_authorizations_for_entity(
+        entity.business_identifier
+    )
+    assert authorizations[entity.business_identifier]["orgMembership"] == membership.membership_type_code
+    assert authorizations[other_entity.business_identifier] == {}
+
+    patch_token_info({"loginSource": "", "realm_access": {"roles": ["staff"]}}, monkeypatch)
+    authorizations = Authorization.get_user_authorizations_for_entities([entity.business_identifier], expanded=True)
+    assert authorizations[entity.business_identifier]["roles"] == ["staff"]
+    assert authorizations[entity.business_identifier]["account"]["id"] == org.id
+
+
 def test_get_user_authorizations_for_org(session, monkeypatch):  # pylint:disable=unused-argument
     """Assert that user authorizations for entity is working."""
     user = factory_user_model()
@@ -317,3 +317,110 @@ def test_get_filtered_affiliations_pagination_limit_one(session):
     assert len(results) == 1
     assert has_more is True
     assert results[0][0] == ["BC1234569"]
+
+
+def test_get_filtered_affiliations_cursor(session):
+    """Test that pages continue from the cursor of the previous page."""
+    entity_mapping_data = [
+        {"identifier": "BC1234567", "bootstrapIdentifier": None, "nrNumber": None},
+        {"identifier": "BC1234568", "bootstrapIdentifier": None, "nrNumber": None},
+        {"identifier": "BC1234569", "bootstrapIdentifier": None, "nrNumber": None},
+    ]
+    org_id, _ = _setup_orgs()
+    for data in entity_mapping_data:
+        _create_affiliations_for_mapping(session, org_id, data, None)
+
+    pages = []
+    search_details = AffiliationSearchDetails(page=1, limit=2)
+    while True:
+        affiliation_bases, has_more, next_cursor = EntityMappingService.populate_affiliation_base(
+            org_id, search_details
+        )
+        pages.append([base.identifier for base in affiliation_bases])
+        if not has_more:
+            break
+        search_details = AffiliationSearchDetails(page=1, limit=2, cursor=next_cursor)
+
+    assert pages == [["BC1234569", "BC1234568"], ["BC1234567"]]
+    assert next_cursor is None
+
+
+def test_get_filtered_affiliations_cursor_undated(session):
+    """Test that pages continue from a cursor on a row without a created date."""
+    entity_mapping_data = [
+        {"identifier": "BC1234567", "bootstrapIdentifier": None, "nrNumber": None},
+        {"identifier": "BC1234568", "bootstrapIdentifier": None, "nrNumber": None},
+        {"identifier": "BC1234569", "bootstrapIdentifier": None, "nrNumber": None},
+    ]
+    org_id, _ = _setup_orgs()
+    for data in entity_mapping_data:
+        _create_affiliations_for_mapping(session, org_id, data, None)
+    # Older affiliations have no created date, the rows of both undated businesses are undated too.
+    session.query(AffiliationModel).filter(AffiliationModel.org_id == org_id).filter(
+        AffiliationModel.entity_id.in_(
+            session.query(Entity.id).filter(Entity.business_identifier.in_(["BC1234567", "BC1234569"]))
+        )
+    ).update({AffiliationModel.created: None}, synchronize_session=False)
+
+    pages = []
+    search_details = AffiliationSearchDetails(page=1, limit=1)
+    while True:
+        affiliation_bases, has_more, next_cursor = EntityMappingService.populate_affiliation_base(
+            org_id, search_details
+        )
+        pages.append([base.identifier for base in affiliation_bases])
+        if not has_more:
+            break
+        search_details = AffiliationSearchDetails(page=1, limit=1, cursor=next_cursor)
+
+    assert pages == [["BC1234569"], ["BC1234567"], ["BC1234568"]]
+
+
+def test_get_filtered_affiliations_follows_changes(session):
+    """Test that the precomputed rows follow affiliation and mapping changes."""
+    org_id, _ = _setup_orgs()
+    _create_affiliations_for_mapping(
+        session, org_id, {"identifier": None, "bootstrapIdentifier": "Taaaaaaa", "nrNumber": None}, None
+    )
+    search_details = AffiliationSearchDetails(page=1, limit=100)
+    results, _ = EntityMappingService.paginate_from_affiliations(org_id, search_details)
+    assert [result[0] for result in results] == [["Taaaaaaa"]]
+
+    # The draft is filed, the business is shown instead of the TEMP.
+    mapping = session.query(EntityMapping).filter(EntityMapping.bootstrap_identifier == "Taaaaaaa").one()
+    mapping.business_identifier = "BC1234567"
+    mapping.save()
+    entity = _get_or_create_entity(session, "BC1234567", "BC")
+    affiliation = _get_or_create_affiliation(session, org_id, entity.id)
+    results, _ = EntityMappingService.paginate_from_affiliations(org_id, search_details)
+    assert [result[0] for result in results] == [["BC1234567"]]
+
+    # A mapping whose business is not affiliated to the org is not shown at all.
+    affiliation.delete()
+    results, _ = EntityMappingService.paginate_from_affiliations(org_id, search_details)
+    assert not results
+
+
+def test_upsert_entity_mappings(session):
+    """Test that a batch of entity details fills in existing mappings and skips duplicates."""
+    session.add(EntityMapping(nr_identifier="NR1234567", bootstrap_identifier="TMP1234567"))
+    session.commit()
+
+    written = EntityMappingService.upsert_entity_mappings(
+        [
+            {"nrNumber": "NR1234567", "bootstrapIdentifier": "TMP1234567", "identifier": "BC1234567"},
+            {"nrNumber": "NR1234567", "bootstrapIdentifier": "TMP1234567", "identifier": "BC1234567"},
+            {"identifier": "BC7654321"},
+            {"identifier": "BC7654321"},
+            {"nrNumber": "NR7654321"},
+        ]
+    )
+
+    assert written == 3
+    mappings = session.query(EntityMapping).order_by(EntityMapping.id).all()
+    assert [(m.nr_identifier, m.bootstrap_identifier, m.business_identifier) for m in mappings] == [
+        ("NR1234567", "TMP1234567", "BC1234567"),
+        (None, None, "BC7654321"),
+        ("NR7654321", None, None),
+    ]
+    assert EntityMappingService.upsert_entity_mappings([{"identifier": "BC7654321"}]) == 0
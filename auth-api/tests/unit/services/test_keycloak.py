@@ -17,6 +17,7 @@
 Test-Suite to ensure that the Business Service is working as expected.
 """
 
+import time
 from unittest.mock import patch
 
 import pytest
@@ -27,6 +28,7 @@ from auth_api.models.dataclass import KeycloakGroupSubscription
 from auth_api.services.keycloak import KeycloakService
 from auth_api.utils.constants import GROUP_ACCOUNT_HOLDERS, GROUP_PUBLIC_USERS
 from auth_api.utils.enums import KeycloakGroupActions, LoginSource
+from auth_api.utils.http_client import http_client
 from auth_api.utils.roles import Role
 from tests.utilities.factory_scenarios import KeycloakScenario, TestJwtClaims
 from tests.utilities.factory_utils import (
@@ -268,6 +270,25 @@ def test_add_remove_group_bulk(session):
     assert "bca" not in ["bca" for user_group in user2_groups if user_group.get("name") == "bca"]
 
 
+def test_group_id_cached(session):
+    """Assert that the group id is looked up once and refreshed when the cached id is stale."""
+    request = KeycloakScenario.create_user_by_user_info(user_info=TestJwtClaims.tester_bceid_role)
+    user = keycloak_add_user(request, return_if_exists=True)
+    KeycloakService.clear_group_ids()
+    with patch.object(http_client, "get", wraps=http_client.get) as mock_get:
+        KEYCLOAK_SERVICE.add_user_to_group(user.id, GROUP_ACCOUNT_HOLDERS)
+        KEYCLOAK_SERVICE.remove_user_from_group(user.id, GROUP_ACCOUNT_HOLDERS)
+        assert mock_get.call_count == 1
+
+        KeycloakService._group_ids[GROUP_ACCOUNT_HOLDERS] = ("00000000-0000-0000-0000-000000000000", time.monotonic())
+        KEYCLOAK_SERVICE.add_user_to_group(user.id, GROUP_ACCOUNT_HOLDERS)
+        assert mock_get.call_count == 2
+
+    groups = [group.get("name") for group in KEYCLOAK_SERVICE.get_user_groups(user_id=user.id)]
+    assert GROUP_ACCOUNT_HOLDERS in groups
+    KeycloakService.clear_group_ids()
+
+
 def test_service_account_by_client_name(session):
     """Test keycloak service account by client name."""
     result = KeycloakService.get_service_account_by_client_name("sbc-auth-admin")
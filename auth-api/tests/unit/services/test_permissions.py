@@ -20,21 +20,37 @@ Test-Suite to ensure that the Permissions Service is working as expected.
 from unittest.mock import patch
 
 from auth_api.services import Permissions as PermissionService
+from auth_api.services.permissions import PERMISSIONS_MATRIX_KEY, PERMISSIONS_VERSION_KEY
 from auth_api.utils.cache import cache
 
 
 def test_build_all_permission_cache(session):  # pylint: disable=unused-argument
-    """Assert that building cache works."""
+    """Assert that building the matrix publishes it with a version."""
     PermissionService.build_all_permission_cache()
-    assert cache is not None
-    assert cache.get((None, "ADMIN")) is not None
+    version, matrix = cache.get(PERMISSIONS_MATRIX_KEY)
+    assert cache.get(PERMISSIONS_VERSION_KEY) == version
+    assert isinstance(matrix[(None, "ADMIN")], frozenset)
+    assert PermissionService.get_permission_matrix()[(None, "ADMIN")] == matrix[(None, "ADMIN")]
 
 
-def test_get_permissions_for_membership_cache_miss(session):  # pylint: disable=unused-argument
-    """Assert the cache miss and hit."""
+def test_get_permissions_for_membership_from_matrix(session):  # pylint: disable=unused-argument
+    """Assert that permissions are resolved from the matrix without touching the database."""
     PermissionService.build_all_permission_cache()
-    with patch("auth_api.models.Permissions.get_permissions_by_membership") as method:
-        PermissionService.get_permissions_for_membership("ACTIVE", "ADMIN")
-        assert not method.called, "Should Not miss the Cache"
-        PermissionService.get_permissions_for_membership("invalid", "invalid")
-        assert method.called, "Should miss the Cache"
+    with patch("auth_api.models.Permissions.get_all_permissions") as method:
+        assert PermissionService.get_permissions_for_membership("ACTIVE", "ADMIN")
+        assert PermissionService.get_permissions_for_membership("invalid", "invalid") == []
+        assert not method.called, "Should not query the permissions"
+
+
+def test_permission_matrix_reloads_on_version_change(session, app):  # pylint: disable=unused-argument
+    """Assert that a worker swaps in the published matrix once the version key changes."""
+    PermissionService.build_all_permission_cache()
+    cache.set(PERMISSIONS_MATRIX_KEY, ("new-version", {(None, "ADMIN"): frozenset({"NEW_ACTION"})}), timeout=0)
+    cache.set(PERMISSIONS_VERSION_KEY, "new-version", timeout=0)
+
+    app.config["PERMISSIONS_VERSION_CHECK_INTERVAL"] = 0
+    try:
+        assert PermissionService.get_permissions_for_membership("ACTIVE", "ADMIN") == ["NEW_ACTION"]
+    finally:
+        app.config["PERMISSIONS_VERSION_CHECK_INTERVAL"] = 30
+        PermissionService.build_all_permission_cache()
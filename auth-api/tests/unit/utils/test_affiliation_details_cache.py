@@ -0,0 +1,118 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the affiliation details cache.
+
+Test suite to ensure that affiliation details are served fresh, then stale, and dropped when invalidated.
+"""
+
+import asyncio
+
+from auth_api.utils import affiliation_details_cache as details_cache_module
+from auth_api.utils.affiliation_details_cache import AffiliationDetailsCache
+from auth_api.utils.background_loop import background_loop
+from auth_api.utils.cache import cache
+
+RESPONSES = [
+    {
+        "businessEntities": [{"identifier": "BC1234567", "legalName": "Business"}],
+        "draftEntities": [{"identifier": "T1234567", "nrNumber": "NR 1234567"}],
+    },
+    {"requests": [{"nrNum": "NR 1234567", "stateCd": "APPROVED"}]},
+]
+IDENTIFIERS = ["BC1234567", "T1234567", "NR 1234567"]
+
+
+def _enable(app, monkeypatch, now):
+    monkeypatch.setitem(app.config, "AFFILIATION_DETAILS_CACHE_ENABLED", True)
+    monkeypatch.setitem(app.config, "AFFILIATION_DETAILS_CACHE_TTL", 300)
+    monkeypatch.setitem(app.config, "AFFILIATION_DETAILS_CACHE_STALE_TTL", 3600)
+    monkeypatch.setattr(details_cache_module.time, "time", lambda: now[0])
+
+
+def test_details_fresh_then_stale(app, monkeypatch):
+    """Assert that cached details are served fresh, then stale, then fetched again."""
+    now = [1000.0]
+    _enable(app, monkeypatch, now)
+    details_cache = AffiliationDetailsCache()
+    with app.app_context():
+        cache.clear()
+        details, stale, missing = details_cache.lookup(IDENTIFIERS)
+        assert missing == IDENTIFIERS
+
+        details_cache.store(IDENTIFIERS, RESPONSES, requested_at=now[0])
+        details, stale, missing = details_cache.lookup(IDENTIFIERS + ["BC7654321"])
+        assert not stale
+        assert missing == ["BC7654321"]
+        assert details["businessEntities"] == RESPONSES[0]["businessEntities"]
+        assert details["draftEntities"] == RESPONSES[0]["draftEntities"]
+        assert details["requests"] == RESPONSES[1]["requests"]
+
+        now[0] += 301
+        details, stale, missing = details_cache.lookup(IDENTIFIERS)
+        assert stale == IDENTIFIERS
+        assert not missing
+        assert details["requests"] == RESPONSES[1]["requests"]
+
+        now[0] += 3600
+        _, stale, missing = details_cache.lookup(IDENTIFIERS)
+        assert not stale
+        assert missing == IDENTIFIERS
+
+
+def test_details_invalidated(app, monkeypatch):
+    """Assert that an invalidated identifier is fetched again and an older response does not overwrite it."""
+    now = [1000.0]
+    _enable(app, monkeypatch, now)
+    details_cache = AffiliationDetailsCache()
+    with app.app_context():
+        cache.clear()
+        details_cache.store(IDENTIFIERS, RESPONSES, requested_at=now[0])
+        now[0] += 10
+        details_cache.invalidate(["NR 1234567"])
+        _, _, missing = details_cache.lookup(IDENTIFIERS)
+        assert missing == ["NR 1234567"]
+
+        # A fetch that started before the invalidation is not cached.
+        details_cache.store(IDENTIFIERS, RESPONSES, requested_at=now[0] - 5)
+        _, _, missing = details_cache.lookup(IDENTIFIERS)
+        assert missing == ["NR 1234567"]
+
+        details_cache.store(IDENTIFIERS, RESPONSES, requested_at=now[0] + 1)
+        _, _, missing = details_cache.lookup(IDENTIFIERS)
+        assert not missing
+
+
+def test_details_refreshed_in_background(app, monkeypatch):
+    """Assert that stale identifiers are refreshed once on the background loop."""
+    now = [1000.0]
+    _enable(app, monkeypatch, now)
+    details_cache = AffiliationDetailsCache()
+    fetched = []
+
+    async def fetch(identifiers):
+        fetched.append(identifiers)
+        return RESPONSES
+
+    async def refresh_twice():
+        details_cache.refresh_in_background(IDENTIFIERS, fetch)
+        details_cache.refresh_in_background(IDENTIFIERS, fetch)
+        await asyncio.gather(*details_cache._refresh_tasks)
+
+    with app.app_context():
+        cache.clear()
+        background_loop.run(refresh_twice())
+        assert fetched == [IDENTIFIERS]
+        details, stale, missing = details_cache.lookup(IDENTIFIERS)
+        assert not stale
+        assert not missing
@@ -0,0 +1,95 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the authorization decision cache.
+
+Test suite to ensure that cached authorization lookups are served and invalidated as expected.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from auth_api.models.views.authorization import Authorization as AuthorizationView
+from auth_api.utils.authorization_cache import AuthorizationCache, AuthorizationRecord, scopes_for
+from auth_api.utils.cache import cache
+from tests.utilities.factory_utils import (
+    factory_affiliation_model,
+    factory_entity_model,
+    factory_membership_model,
+    factory_org_model,
+    factory_user_model,
+)
+
+
+@pytest.fixture()
+def authorization_cache(app):
+    """Return an enabled authorization cache backed by a clean cache."""
+    app.config["AUTHORIZATION_CACHE_ENABLED"] = True
+    cache.clear()
+    authz_cache = AuthorizationCache()
+    authz_cache.init_app(app)
+    yield authz_cache
+    app.config["AUTHORIZATION_CACHE_ENABLED"] = False
+    cache.clear()
+
+
+def test_find_disabled_passes_through(session):  # pylint:disable=unused-argument
+    """Assert that lookups go to the view every time when the cache is disabled."""
+    finder = MagicMock(return_value=None, __name__="find_user_authorization_by_org_id")
+    disabled_cache = AuthorizationCache()
+    disabled_cache.find(finder, keycloak_guid="abc", org_id=1)
+    disabled_cache.find(finder, keycloak_guid="abc", org_id=1)
+    assert finder.call_count == 2
+
+
+def test_find_caches_and_invalidates(session, authorization_cache):  # pylint:disable=unused-argument, redefined-outer-name
+    """Assert that repeated lookups are cached until one of their scopes is invalidated."""
+    user = factory_user_model()
+    org = factory_org_model()
+    factory_membership_model(user.id, org.id)
+    finder = MagicMock(wraps=AuthorizationView.find_user_authorization_by_org_id)
+    finder.__name__ = "find_user_authorization_by_org_id"
+
+    first = authorization_cache.find(finder, keycloak_guid=user.keycloak_guid, org_id=org.id)
+    second = authorization_cache.find(finder, keycloak_guid=user.keycloak_guid, org_id=org.id)
+    assert isinstance(first, AuthorizationRecord)
+    assert first == second
+    assert first.org_membership == "ADMIN"
+    assert finder.call_count == 1
+
+    authorization_cache.invalidate({("org", str(org.id))})
+    authorization_cache.find(finder, keycloak_guid=user.keycloak_guid, org_id=org.id)
+    assert finder.call_count == 2
+
+    stats = authorization_cache.stats()
+    assert stats["local_hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stale"] >= 1
+    assert stats["invalidations"] == 1
+
+
+def test_scopes_for_changes(session):  # pylint:disable=unused-argument
+    """Assert that membership and affiliation changes map to the scopes they affect."""
+    user = factory_user_model()
+    org = factory_org_model()
+    membership = factory_membership_model(user.id, org.id)
+    entity = factory_entity_model()
+    affiliation = factory_affiliation_model(entity.id, org.id)
+
+    assert scopes_for(membership) == {("org", str(org.id)), ("user", str(user.keycloak_guid))}
+    assert scopes_for(affiliation) == {("org", str(org.id)), ("business", entity.business_identifier)}
+    # Unchanged rows don't invalidate anything.
+    assert scopes_for(org) == set()
+    org.status_code = "SUSPENDED"
+    assert scopes_for(org) == {("org", str(org.id))}
@@ -0,0 +1,128 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the background event loop.
+
+Test suite to ensure that sync handlers can run coroutines on the shared loop and session.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from flask import current_app, g
+
+from auth_api.exceptions import ServiceUnavailableException
+from auth_api.services.rest_service import RestService
+from auth_api.utils.background_loop import background_loop
+
+
+def test_run_uses_caller_context(app):
+    """Assert that the coroutine runs on the loop thread with the caller's app and request context."""
+
+    async def read_context():
+        await asyncio.sleep(0)
+        return current_app._get_current_object(), g.marker, threading.get_ident(), background_loop.is_current()
+
+    with app.test_request_context():
+        g.marker = "caller"
+        flask_app, marker, thread_id, is_current = background_loop.run(read_context())
+
+    assert flask_app is app
+    assert marker == "caller"
+    assert thread_id != threading.get_ident()
+    assert is_current
+    assert not background_loop.is_current()
+
+
+def test_run_raises_coroutine_errors(app):
+    """Assert that an exception from the coroutine is raised to the caller."""
+
+    async def fail():
+        raise ValueError("failed")
+
+    with app.app_context(), pytest.raises(ValueError):
+        background_loop.run(fail())
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    # Keep alive like the real upstreams, buffered so each response goes out in one write.
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+    connections = 0
+
+    def setup(self):
+        _JsonHandler.connections += 1
+        super().setup()
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"hasMore": False}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_run_times_out(app, monkeypatch):
+    """Assert that a call outliving the timeout raises ServiceUnavailableException and cancels the coroutine."""
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with app.app_context(), pytest.raises(ServiceUnavailableException):
+        background_loop.run(hang(), 0.1)
+    assert cancelled.wait(5)
+
+    monkeypatch.setitem(app.config, "BACKGROUND_LOOP_TIMEOUT", 0.1)
+    with app.app_context(), pytest.raises(ServiceUnavailableException):
+        background_loop.run(hang())
+
+
+def test_affiliation_fan_out_reuses_connections(app):
+    """Assert that the shared session keeps its connections between requests, a loop per request does not."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    call_info = [{"url": f"{url}/businesses/search", "payload": {}}, {"url": f"{url}/requests/search", "payload": {}}]
+    number = 5
+    try:
+        with app.test_request_context():
+            _JsonHandler.connections = 0
+            for _ in range(number):
+                response = asyncio.run(RestService.call_posts_in_parallel(call_info, "token", 1))
+                assert response == [{"hasMore": False}, {"hasMore": False}]
+            per_request_connections = _JsonHandler.connections
+
+            _JsonHandler.connections = 0
+            for _ in range(number):
+                response = background_loop.run(RestService.call_posts_in_parallel(call_info, "token", 1))
+                assert response == [{"hasMore": False}, {"hasMore": False}]
+            shared_connections = _JsonHandler.connections
+    finally:
+        server.shutdown()
+
+    assert per_request_connections == number * len(call_info)
+    assert shared_connections <= len(call_info)
@@ -0,0 +1,55 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the pooled HTTP client.
+
+Test suite to ensure that outbound calls share pooled sessions with the right retry policies.
+"""
+
+from auth_api.utils.http_client import KEYCLOAK_RETRY, NO_RETRY, RETRY_ON_FAILURE, UPSTREAM_RETRY, HttpClient
+
+
+def test_session_is_shared(app):
+    """Assert that one session is reused per retry mode."""
+    with app.app_context():
+        client = HttpClient()
+        session = client.session()
+        assert client.session() is session
+        assert client.session(retry_on_failure=True) is not session
+        assert client.session(retry_on_failure=True) is client.session(retry_on_failure=True)
+        client.close()
+        assert client.session() is not session
+
+
+def test_endpoint_family_retries(app):
+    """Assert that each endpoint family gets its own adapter and retry policy."""
+    with app.app_context():
+        client = HttpClient()
+        session = client.session()
+        pay_url = app.config["PAY_API_URL"]
+        assert session.get_adapter(f"{pay_url}/payment-requests").max_retries is UPSTREAM_RETRY
+        assert session.get_adapter("https://unknown.example.com/path").max_retries is NO_RETRY
+        if keycloak_url := app.config.get("KEYCLOAK_BASE_URL"):
+            assert session.get_adapter(f"{keycloak_url}/auth/admin").max_retries is KEYCLOAK_RETRY
+        retry_session = client.session(retry_on_failure=True)
+        assert retry_session.get_adapter(f"{pay_url}/payment-requests").max_retries is RETRY_ON_FAILURE
+
+
+def test_timeout_split(app):
+    """Assert that requests get a separate connect and read timeout."""
+    with app.app_context():
+        connect_timeout = app.config["HTTP_CONNECT_TIMEOUT"]
+        assert HttpClient.timeout() == (connect_timeout, app.config["HTTP_READ_TIMEOUT"])
+        assert HttpClient.timeout(120) == (connect_timeout, 120)
+        assert HttpClient.timeout(1) == (1, 1)
+        assert HttpClient.timeout((2, 3)) == (2, 3)
@@ -0,0 +1,107 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the service account token manager.
+
+Test suite to ensure that tokens are reused until they expire and fetched once per process.
+"""
+
+import threading
+import time
+
+from auth_api.utils import service_token
+from auth_api.utils.service_token import ServiceTokenManager
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_reused_until_expiry(app, monkeypatch):
+    """Assert that a token is fetched again only after it expires."""
+    clock = _Clock()
+    monkeypatch.setattr(service_token.time, "monotonic", clock)
+    fetches = []
+
+    def fetch():
+        fetches.append(clock.now)
+        return {"access_token": f"token-{len(fetches)}", "expires_in": 300}
+
+    with app.app_context():
+        app.config["SERVICE_ACCOUNT_TOKEN_REFRESH_AHEAD"] = 60
+        manager = ServiceTokenManager()
+        assert manager.get(("ID", "SECRET"), fetch) == "token-1"
+        clock.now += 200
+        assert manager.get(("ID", "SECRET"), fetch) == "token-1"
+        assert manager.get(("OTHER_ID", "OTHER_SECRET"), fetch) == "token-2"
+        clock.now += 101
+        assert manager.get(("ID", "SECRET"), fetch) == "token-3"
+        assert len(fetches) == 3
+
+
+def test_token_refreshed_ahead_of_expiry(app, monkeypatch):
+    """Assert that the current token is returned while a background fetch replaces it."""
+    clock = _Clock()
+    monkeypatch.setattr(service_token.time, "monotonic", clock)
+    release = threading.Event()
+    fetches = []
+
+    def fetch():
+        fetches.append(clock.now)
+        if len(fetches) > 1:
+            release.wait(5)
+        return {"access_token": f"token-{len(fetches)}", "expires_in": 300}
+
+    with app.app_context():
+        app.config["SERVICE_ACCOUNT_TOKEN_REFRESH_AHEAD"] = 60
+        manager = ServiceTokenManager()
+        manager.get(("ID", "SECRET"), fetch)
+        clock.now += 250
+        assert manager.get(("ID", "SECRET"), fetch) == "token-1"
+        assert manager.get(("ID", "SECRET"), fetch) == "token-1"
+        release.set()
+        for _ in range(50):
+            if manager.get(("ID", "SECRET"), fetch) == "token-2":
+                break
+            time.sleep(0.1)
+        assert manager.get(("ID", "SECRET"), fetch) == "token-2"
+        assert len(fetches) == 2
+
+
+def test_token_fetched_once_when_missing(app):
+    """Assert that concurrent callers share one fetch."""
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.2)
+        return {"access_token": "token", "expires_in": 300}
+
+    manager = ServiceTokenManager()
+    tokens = []
+
+    def worker():
+        with app.app_context():
+            tokens.append(manager.get(("ID", "SECRET"), fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tokens == ["token"] * 5
+    assert len(fetches) == 1
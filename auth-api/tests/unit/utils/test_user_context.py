@@ -0,0 +1,72 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the request scoped user context.
+
+Test suite to ensure that one user context is built per request and token.
+"""
+
+from flask import g
+
+from auth_api.utils.roles import Role
+from auth_api.utils.user_context import UserContext, _get_context, user_context
+from tests.utilities.factory_scenarios import TestJwtClaims
+from tests.utilities.factory_utils import patch_token_info
+
+
+@user_context
+def _current_context(**kwargs):
+    return kwargs["user_context"]
+
+
+def test_user_context_memoized_per_token(app, monkeypatch):
+    """Assert that nested calls share a context until the token changes."""
+    with app.test_request_context(headers={"Account-Id": "1"}):
+        patch_token_info(TestJwtClaims.staff_role, monkeypatch)
+        context = _current_context()
+        assert _current_context() is context
+        assert context.is_staff()
+        assert context.has_role(Role.STAFF.value)
+        assert context.role_set == frozenset(TestJwtClaims.staff_role["realm_access"]["roles"])
+        assert context.account_id == "1"
+
+        patch_token_info(TestJwtClaims.public_user_role, monkeypatch)
+        assert _current_context() is not context
+        assert not _current_context().is_staff()
+
+    with app.test_request_context():
+        assert _current_context() is not context
+
+
+def test_user_context_built_once_per_request(app, monkeypatch):
+    """Assert that one context is built per request and later calls return it from g."""
+    built = []
+    init = UserContext.__init__
+
+    def counting_init(self, *args, **kwargs):
+        built.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(UserContext, "__init__", counting_init)
+    with app.test_request_context(headers={"Account-Id": "1", "Authorization": "Bearer token"}):
+        patch_token_info(TestJwtClaims.staff_role, monkeypatch)
+        contexts = [_current_context() for _ in range(100)]
+
+        assert len(built) == 1
+        assert all(context is built[0] for context in contexts)
+        assert g.user_context is built[0]
+        assert _get_context() is built[0]
+
+    with app.test_request_context(headers={"Account-Id": "1", "Authorization": "Bearer token"}):
+        _current_context()
+        assert len(built) == 2
@@ -92,6 +92,29 @@ class _Config:  # pylint: disable=too-few-public-methods
     # Account linking key notifications
     ACCOUNT_LINK_EXPIRY_REMINDER_DAYS = int(os.getenv("ACCOUNT_LINK_EXPIRY_REMINDER_DAYS", "30"))
 
+    # Materialized authorizations, rebuild even when no drift is found
+    AUTHORIZATIONS_FORCE_REBUILD = os.getenv("AUTHORIZATIONS_FORCE_REBUILD", "False").lower() == "true"
+
+    # Monthly activity_logs partitions, months created ahead, months kept attached and the schema old ones move to
+    ACTIVITY_LOG_PARTITIONS_AHEAD_MONTHS = int(os.getenv("ACTIVITY_LOG_PARTITIONS_AHEAD_MONTHS", "3"))
+    ACTIVITY_LOG_RETENTION_MONTHS = int(os.getenv("ACTIVITY_LOG_RETENTION_MONTHS", "24"))
+    ACTIVITY_LOG_ARCHIVE_SCHEMA = os.getenv("ACTIVITY_LOG_ARCHIVE_SCHEMA", "activity_logs_archive")
+
+    # LEAR, for the entity mapping backfill
+    JWT_OIDC_ISSUER = os.getenv("JWT_OIDC_ISSUER")
+    ENTITY_SVC_CLIENT_ID = os.getenv("ENTITY_SVC_CLIENT_ID")
+    ENTITY_SVC_CLIENT_SECRET = os.getenv("ENTITY_SVC_CLIENT_SECRET")
+    LEGAL_API_URL = os.getenv("LEGAL_API_URL", "")
+    LEGAL_API_VERSION_2 = os.getenv("LEGAL_API_VERSION_2", "")
+
+    # Entity mapping backfill, entities per page, identifiers per LEAR call and LEAR calls in flight
+    ENTITY_MAPPING_BACKFILL_PAGE_SIZE = int(os.getenv("ENTITY_MAPPING_BACKFILL_PAGE_SIZE", "1000"))
+    ENTITY_MAPPING_BACKFILL_BATCH_SIZE = int(os.getenv("ENTITY_MAPPING_BACKFILL_BATCH_SIZE", "100"))
+    ENTITY_MAPPING_BACKFILL_MAX_PARALLEL = int(os.getenv("ENTITY_MAPPING_BACKFILL_MAX_PARALLEL", "4"))
+    ENTITY_MAPPING_BACKFILL_TIMEOUT = int(os.getenv("ENTITY_MAPPING_BACKFILL_TIMEOUT", "60"))
+    # Reconcile every entity rather than only the ones without a mapping
+    ENTITY_MAPPING_BACKFILL_ALL = os.getenv("ENTITY_MAPPING_BACKFILL_ALL", "False").lower() == "true"
+
     TESTING = False
     DEBUG = True
 
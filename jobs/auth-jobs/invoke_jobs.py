@@ -67,7 +67,10 @@ def register_shellcontext(app):
 def run(job_name):
     """Run the specified job."""
     from tasks.account_link_notifications import AccountLinkNotificationsTask
+    from tasks.activity_log_partitions import ActivityLogPartitionsTask
     from tasks.adhoc.permission_check import AuthJobPermissionCheckTask
+    from tasks.authorizations_consistency import AuthorizationsConsistencyTask
+    from tasks.entity_mapping_backfill import EntityMappingBackfillTask
 
     application = create_app()
     application.app_context().push()
@@ -80,6 +83,12 @@ def run(job_name):
                 AuthJobPermissionCheckTask.check()
             case "ACCOUNT_LINK_NOTIFICATIONS":
                 AccountLinkNotificationsTask.notify()
+            case "AUTHORIZATIONS_CONSISTENCY":
+                AuthorizationsConsistencyTask.check()
+            case "ENTITY_MAPPING_BACKFILL":
+                EntityMappingBackfillTask.backfill()
+            case "ACTIVITY_LOG_PARTITIONS":
+                ActivityLogPartitionsTask.maintain()
             case _:
                 application.logger.warning(f"job_name={job_name} status=unknown_job")
                 return
@@ -0,0 +1,3 @@
+#! /bin/sh
+echo 'run invoke_jobs.py ACTIVITY_LOG_PARTITIONS'
+python3 invoke_jobs.py ACTIVITY_LOG_PARTITIONS
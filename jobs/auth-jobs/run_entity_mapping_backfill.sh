@@ -0,0 +1,3 @@
+#! /bin/sh
+echo 'run invoke_jobs.py ENTITY_MAPPING_BACKFILL'
+python3 invoke_jobs.py ENTITY_MAPPING_BACKFILL
@@ -0,0 +1,46 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Task to add the upcoming monthly activity_logs partitions and archive the ones past retention."""
+
+from datetime import datetime
+
+from flask import current_app
+
+from auth_api.models import ActivityLog as ActivityLogModel
+
+
+class ActivityLogPartitionsTask:  # pylint: disable=too-few-public-methods
+    """Task to maintain the monthly activity_logs partitions."""
+
+    @classmethod
+    def maintain(cls, now: datetime | None = None) -> dict:
+        """Create the partitions for the months ahead, then detach and archive the partitions past retention."""
+        now = now or datetime.now()
+        ahead = current_app.config.get("ACTIVITY_LOG_PARTITIONS_AHEAD_MONTHS", 3)
+        retention = current_app.config.get("ACTIVITY_LOG_RETENTION_MONTHS", 24)
+        schema = current_app.config.get("ACTIVITY_LOG_ARCHIVE_SCHEMA", "activity_logs_archive")
+
+        created = ActivityLogModel.create_partitions(cls._month_start(now, ahead))
+        # Partitions ending on or before this month retention months ago hold only rows older than retention.
+        archived = ActivityLogModel.archive_partitions(cls._month_start(now, -retention), schema)
+        current_app.logger.info(
+            f"activity_log_partitions: created={created} archived={len(archived)} schema={schema} {archived}"
+        )
+        return {"created": created, "archived": archived}
+
+    @staticmethod
+    def _month_start(moment: datetime, months: int) -> datetime:
+        """Return the start of the month the given number of months away from moment."""
+        month_index = moment.year * 12 + moment.month - 1 + months
+        return datetime(month_index // 12, month_index % 12 + 1, 1)
@@ -0,0 +1,40 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Task to verify the materialized authorizations against authorizations_view and rebuild them on drift."""
+
+from flask import current_app
+
+from auth_api.models.views.authorization import Authorization as AuthorizationModel
+
+
+class AuthorizationsConsistencyTask:  # pylint: disable=too-few-public-methods
+    """Task to verify the materialized authorizations against authorizations_view."""
+
+    @classmethod
+    def check(cls) -> dict:
+        """Compare the table with the view, rebuilding it when they differ or a rebuild is forced."""
+        result = AuthorizationModel.check_consistency()
+        current_app.logger.info(
+            f"authorizations_consistency: missing={result['missing']} unexpected={result['unexpected']}"
+        )
+        drifted = result["missing"] or result["unexpected"]
+        if drifted or current_app.config.get("AUTHORIZATIONS_FORCE_REBUILD", False):
+            if drifted:
+                current_app.logger.warning("authorizations_consistency: drift detected, rebuilding")
+            AuthorizationModel.rebuild()
+            result = AuthorizationModel.check_consistency()
+            current_app.logger.info(
+                f"authorizations_consistency: rebuilt missing={result['missing']} unexpected={result['unexpected']}"
+            )
+        return result
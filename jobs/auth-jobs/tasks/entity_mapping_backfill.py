@@ -0,0 +1,105 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Task to backfill entity mappings for entities that have none, or reconcile every entity."""
+
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy import exists, or_
+
+from auth_api.models import db
+from auth_api.models.entity import Entity as EntityModel
+from auth_api.models.entity_mapping import EntityMapping as EntityMappingModel
+from auth_api.models.job_checkpoint import JobCheckpoint as JobCheckpointModel
+from auth_api.services.entity_mapping import EntityMappingService
+
+CHECKPOINT_NAME = "ENTITY_MAPPING_BACKFILL"
+
+
+class EntityMappingBackfillTask:  # pylint: disable=too-few-public-methods
+    """Task to backfill entity mappings from LEAR in pages of entities."""
+
+    @classmethod
+    def backfill(cls) -> dict:
+        """Backfill a page of entities at a time by entity id, saving the last id after each page.
+
+        A run continues after the saved id and clears it once it reaches the last entity, so identifiers that failed
+        or that LEAR doesn't know are tried again on the next pass. ENTITY_MAPPING_BACKFILL_ALL reconciles every
+        entity instead of only the ones without a mapping.
+        """
+        config = current_app.config
+        page_size = config.get("ENTITY_MAPPING_BACKFILL_PAGE_SIZE", 1000)
+        reconcile_all = config.get("ENTITY_MAPPING_BACKFILL_ALL", False)
+        after_id = int(JobCheckpointModel.find_position(CHECKPOINT_NAME) or 0)
+        current_app.logger.info(f"entity_mapping_backfill: starting after entity id {after_id}")
+
+        totals = Counter()
+        while entities := cls._find_entities(after_id, page_size, reconcile_all):
+            totals.update(cls._backfill_page(entities))
+            after_id = entities[-1].id
+            JobCheckpointModel.save_position(CHECKPOINT_NAME, str(after_id))
+            current_app.logger.info(f"entity_mapping_backfill: through entity id {after_id} {dict(totals)}")
+
+        JobCheckpointModel.save_position(CHECKPOINT_NAME, None)
+        current_app.logger.info(f"entity_mapping_backfill: completed {dict(totals)}")
+        return dict(totals)
+
+    @staticmethod
+    def _find_entities(after_id: int, page_size: int, reconcile_all: bool) -> list:
+        """Return the next page of (id, business_identifier, is_loaded_lear) ordered by id."""
+        query = db.session.query(EntityModel.id, EntityModel.business_identifier, EntityModel.is_loaded_lear).filter(
+            EntityModel.id > after_id
+        )
+        if not reconcile_all:
+            identifier = EntityModel.business_identifier
+            query = query.filter(
+                ~exists().where(
+                    or_(
+                        EntityMappingModel.business_identifier == identifier,
+                        EntityMappingModel.bootstrap_identifier == identifier,
+                        EntityMappingModel.nr_identifier == identifier,
+                    )
+                )
+            )
+        return query.order_by(EntityModel.id).limit(page_size).all()
+
+    @staticmethod
+    def _backfill_page(entities: list) -> Counter:
+        """Fetch the mapping details of a page of entities from LEAR and upsert them in one transaction."""
+        config = current_app.config
+        # COLIN businesses aren't in LEAR, so there are no extra mappings details to fetch.
+        entity_details = [
+            {"identifier": entity.business_identifier} for entity in entities if not entity.is_loaded_lear
+        ]
+        lear_identifiers = [entity.business_identifier for entity in entities if entity.is_loaded_lear]
+        lear_details, failed_identifiers = EntityMappingService.fetch_entity_mapping_details_for_identifiers(
+            lear_identifiers,
+            batch_size=config.get("ENTITY_MAPPING_BACKFILL_BATCH_SIZE", 100),
+            max_parallel=config.get("ENTITY_MAPPING_BACKFILL_MAX_PARALLEL", 4),
+            timeout=config.get("ENTITY_MAPPING_BACKFILL_TIMEOUT", 60),
+        )
+        if failed_identifiers:
+            current_app.logger.warning(f"entity_mapping_backfill: LEAR lookup failed for {failed_identifiers}")
+        found = {
+            identifier
+            for details in lear_details
+            for identifier in (details.get("identifier"), details.get("bootstrapIdentifier"), details.get("nrNumber"))
+        }
+        written = EntityMappingService.upsert_entity_mappings(entity_details + lear_details)
+        return Counter(
+            entities=len(entities),
+            written=written,
+            failed=len(failed_identifiers),
+            not_found=len(set(lear_identifiers) - found - set(failed_identifiers)),
+        )
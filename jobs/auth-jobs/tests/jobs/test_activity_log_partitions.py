@@ -0,0 +1,68 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the ActivityLogPartitionsTask.
+
+Test-Suite to ensure that activity_logs partitions are added ahead and archived past retention.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+
+from auth_api.models import ActivityLog as ActivityLogModel
+from auth_api.models import db
+from tasks.activity_log_partitions import ActivityLogPartitionsTask
+
+
+def _partitions(schema: str = "public") -> set[str]:
+    return set(
+        db.session.execute(
+            text(
+                "SELECT c.relname FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = :schema AND c.relname LIKE 'activity_logs_y%'"
+            ),
+            {"schema": schema},
+        )
+        .scalars()
+        .all()
+    )
+
+
+def test_month_start():
+    """Assert that months are counted across year boundaries."""
+    assert ActivityLogPartitionsTask._month_start(datetime(2026, 11, 15), 3) == datetime(2027, 2, 1)
+    assert ActivityLogPartitionsTask._month_start(datetime(2026, 1, 31), -24) == datetime(2024, 1, 1)
+
+
+def test_partitions_are_created_ahead(session):
+    """Assert that running again doesn't add partitions already there."""
+    ActivityLogPartitionsTask.maintain()
+    assert ActivityLogPartitionsTask.maintain()["created"] == 0
+    assert f"activity_logs_{datetime.now():y%Ym%m}" in _partitions()
+
+
+def test_old_partitions_are_archived(session):
+    """Assert that partitions past retention are detached and moved to the archive schema."""
+    now = datetime.now()
+    # Retention ends after this month, so this month and the older legacy partition are archived, next month is kept.
+    result = ActivityLogPartitionsTask.maintain(ActivityLogPartitionsTask._month_start(now, 25))
+
+    name = f"activity_logs_{now:y%Ym%m}"
+    assert result["archived"] == ["activity_logs_legacy", name]
+    assert name in _partitions("activity_logs_archive")
+    assert name not in _partitions()
+    assert f"activity_logs_{ActivityLogPartitionsTask._month_start(now, 1):y%Ym%m}" in _partitions()
+    ActivityLogModel(org_id=1, action="test", created=now).save()
+    assert ActivityLogModel.query.filter_by(org_id=1, action="test").count() == 1
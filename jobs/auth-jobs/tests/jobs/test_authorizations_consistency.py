@@ -0,0 +1,37 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the AuthorizationsConsistencyTask.
+
+Test-Suite to ensure that drift between the materialized authorizations and authorizations_view is repaired.
+"""
+
+from auth_api.models import db
+from auth_api.models.views.authorization import Authorization as AuthorizationModel
+from tasks.authorizations_consistency import AuthorizationsConsistencyTask
+
+
+def test_consistent_table_is_left_alone(session):
+    """Assert that no drift is reported when the triggers kept the table up to date."""
+    assert AuthorizationsConsistencyTask.check() == {"missing": 0, "unexpected": 0}
+
+
+def test_drift_is_rebuilt(session):
+    """Assert that rows not backed by the view are removed by the rebuild."""
+    db.session.add(AuthorizationModel(org_id=-1, user_id=-1, org_membership="ADMIN", org_name="Stale Org"))
+    db.session.flush()
+    assert AuthorizationModel.check_consistency()["unexpected"] == 1
+
+    assert AuthorizationsConsistencyTask.check() == {"missing": 0, "unexpected": 0}
+    assert AuthorizationModel.query.filter_by(org_id=-1).count() == 0
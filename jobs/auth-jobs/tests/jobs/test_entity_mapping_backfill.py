@@ -0,0 +1,94 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the EntityMappingBackfillTask.
+
+Test-Suite to ensure that entities without an entity mapping are backfilled page by page and the checkpoint is kept.
+"""
+
+from unittest.mock import patch
+
+from auth_api.models.entity import Entity as EntityModel
+from auth_api.models.entity_mapping import EntityMapping as EntityMappingModel
+from auth_api.models.job_checkpoint import JobCheckpoint as JobCheckpointModel
+from auth_api.services.entity_mapping import EntityMappingService
+from tasks.entity_mapping_backfill import CHECKPOINT_NAME, EntityMappingBackfillTask
+
+
+def _factory_entity(business_identifier: str, is_loaded_lear: bool) -> EntityModel:
+    entity = EntityModel(
+        business_identifier=business_identifier,
+        name=business_identifier,
+        corp_type_code="BC",
+        is_loaded_lear=is_loaded_lear,
+    )
+    entity.save()
+    return entity
+
+
+def _mappings(business_identifier: str) -> list:
+    return [
+        (mapping.nr_identifier, mapping.bootstrap_identifier, mapping.business_identifier)
+        for mapping in EntityMappingModel.query.filter_by(business_identifier=business_identifier).all()
+    ]
+
+
+def test_backfill_creates_missing_mappings(app, session, monkeypatch):
+    """Assert that COLIN and LEAR entities are mapped across pages and the checkpoint is cleared at the end."""
+    monkeypatch.setitem(app.config, "ENTITY_MAPPING_BACKFILL_PAGE_SIZE", 1)
+    _factory_entity("BC9900001", is_loaded_lear=False)
+    _factory_entity("BC9900002", is_loaded_lear=True)
+    _factory_entity("BC9900003", is_loaded_lear=True)
+    lear_details = {
+        "BC9900002": {"identifier": "BC9900002", "bootstrapIdentifier": "Tfbp8FVOcS", "nrNumber": "NR 9900002"},
+    }
+
+    def fetch(identifiers, **_kwargs):
+        return [lear_details[identifier] for identifier in identifiers if identifier in lear_details], []
+
+    with patch.object(EntityMappingService, "fetch_entity_mapping_details_for_identifiers", side_effect=fetch):
+        totals = EntityMappingBackfillTask.backfill()
+
+    assert totals["written"] >= 2
+    assert totals["not_found"] >= 1
+    assert _mappings("BC9900001") == [(None, None, "BC9900001")]
+    assert _mappings("BC9900002") == [("NR 9900002", "Tfbp8FVOcS", "BC9900002")]
+    assert _mappings("BC9900003") == []
+    assert JobCheckpointModel.find_position(CHECKPOINT_NAME) is None
+
+
+def test_backfill_resumes_after_checkpoint(app, session):
+    """Assert that a run picks up after the saved entity id."""
+    done = _factory_entity("BC9900004", is_loaded_lear=False)
+    _factory_entity("BC9900005", is_loaded_lear=False)
+    JobCheckpointModel.save_position(CHECKPOINT_NAME, str(done.id))
+
+    with patch.object(EntityMappingService, "fetch_entity_mapping_details_for_identifiers", return_value=([], [])):
+        EntityMappingBackfillTask.backfill()
+
+    assert _mappings("BC9900004") == []
+    assert _mappings("BC9900005") == [(None, None, "BC9900005")]
+
+
+def test_backfill_skips_failed_lookups(app, session):
+    """Assert that identifiers LEAR failed to return stay unmapped so the next pass retries them."""
+    _factory_entity("BC9900006", is_loaded_lear=True)
+
+    with patch.object(
+        EntityMappingService, "fetch_entity_mapping_details_for_identifiers", return_value=([], ["BC9900006"])
+    ):
+        totals = EntityMappingBackfillTask.backfill()
+
+    assert totals["failed"] >= 1
+    assert _mappings("BC9900006") == []
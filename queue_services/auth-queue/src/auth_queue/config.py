@@ -91,6 +91,13 @@ class _Config:  # pylint: disable=too-few-public-methods
     KEYCLOAK_SERVICE_ACCOUNT_ID = os.getenv("SBC_AUTH_ADMIN_CLIENT_ID")
     KEYCLOAK_SERVICE_ACCOUNT_SECRET = os.getenv("SBC_AUTH_ADMIN_CLIENT_SECRET")
 
+    # Publish authorization cache invalidations for org status and affiliation changes made here.
+    AUTHORIZATION_CACHE_ENABLED = os.getenv("AUTHORIZATION_CACHE_ENABLED", "False").lower() == "true"
+    # Invalidate cached LEAR / Names affiliation details for NRs changed here.
+    AFFILIATION_DETAILS_CACHE_ENABLED = os.getenv("AFFILIATION_DETAILS_CACHE_ENABLED", "False").lower() == "true"
+    AFFILIATION_DETAILS_CACHE_TTL = int(os.getenv("AFFILIATION_DETAILS_CACHE_TTL", "300"))
+    AFFILIATION_DETAILS_CACHE_STALE_TTL = int(os.getenv("AFFILIATION_DETAILS_CACHE_STALE_TTL", "3600"))
+
 
 class DevConfig(_Config):  # pylint: disable=too-few-public-methods
     """Creates the Development Config object."""
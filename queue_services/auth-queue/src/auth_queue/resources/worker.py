@@ -30,6 +30,7 @@ from auth_api.services.flags import flags
 from auth_api.services.gcp_queue import queue
 from auth_api.services.rest_service import RestService
 from auth_api.utils.account_mailer import publish_to_mailer
+from auth_api.utils.affiliation_details_cache import affiliation_details_cache
 from auth_api.utils.enums import AccessType, ActivityAction, CorpType, OrgStatus, QueueSources
 from dateutil import parser
 from flask import Blueprint, current_app, request
@@ -96,7 +97,7 @@ def process_activity_log(data):
         item_id=data.get("itemId"),
         item_value=data.get("itemValue"),
         remote_addr=data.get("remoteAddr"),
-        created=data.get("createdAt"),
+        created=data.get("createdAt") or datetime.now(),  # created is the partition key, it can't be null
         org_id=data.get("orgId"),
     )
     try:
@@ -232,6 +233,7 @@ def process_name_events(event_message: SimpleCloudEvent):
     nr_entity.last_modified_by = None  # TODO not present in event message.
     nr_entity.last_modified = parser.parse(event_message.time)
     nr_entity.save()
+    affiliation_details_cache.invalidate([nr_number])
 
     # Activity log is a pure audit event — write it last so it never blocks the core
     # entity/affiliation work and is easy to see at the bottom of the function.
@@ -0,0 +1,59 @@
+-- Copyright © 2026 Province of British Columbia
+--
+-- Licensed under the Apache License, Version 2.0 (the "License");
+-- you may not use this file except in compliance with the License.
+-- You may obtain a copy of the License at
+--
+--     http://www.apache.org/licenses/LICENSE-2.0
+--
+-- Unless required by applicable law or agreed to in writing, software
+-- distributed under the License is distributed on an "AS IS" BASIS,
+-- WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+-- See the License for the specific language governing permissions and
+-- limitations under the License.
+
+-- Org search at 1M orgs, without and with the trigram indexes of migration b6d2f8a4c031.
+-- Run against a scratch database migrated to head: psql -v orgs=1000000 -f benchmark.sql <scratch db url>
+\set ON_ERROR_STOP on
+\if :{?orgs}
+\else
+\set orgs 1000000
+\endif
+\timing on
+
+BEGIN;
+
+INSERT INTO orgs (uuid, type_code, status_code, name, branch_name, access_type, decision_made_by, bcol_account_id,
+                  created)
+SELECT uuid_generate_v4(),
+       'PREMIUM',
+       'ACTIVE',
+       'BENCH ' || md5(i::text) || ' ' || (ARRAY['Holdings', 'Law Corp', 'Ventures', 'Consulting'])[1 + i % 4],
+       CASE WHEN i % 3 = 0 THEN 'Branch ' || (i % 997) ELSE '' END,
+       'REGULAR',
+       CASE WHEN i % 10 = 0 THEN 'staff' || (i % 113) END,
+       CASE WHEN i % 5 = 0 THEN lpad((i % 99991)::text, 7, '0') END,
+       now() - (i || ' seconds')::interval
+  FROM generate_series(1, :orgs) AS i;
+ANALYZE orgs;
+
+-- The queries Org.search_org and SimpleOrg.search send, as they reach the database.
+\set name_search '''%law corp%'''
+\set id_search '''%4242%'''
+\set bcol_search '''%00421%'''
+
+\echo '== without trigram indexes'
+SET LOCAL enable_bitmapscan = off;
+EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM orgs WHERE name ILIKE :name_search
+ ORDER BY similarity(name, 'law corp') DESC, created DESC LIMIT 10;
+EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM orgs WHERE CAST(id AS VARCHAR) LIKE :id_search LIMIT 10;
+EXPLAIN (ANALYZE, BUFFERS) SELECT count(*) FROM orgs WHERE bcol_account_id ILIKE :bcol_search;
+
+\echo '== with trigram indexes'
+SET LOCAL enable_bitmapscan = on;
+EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM orgs WHERE name ILIKE :name_search
+ ORDER BY similarity(name, 'law corp') DESC, created DESC LIMIT 10;
+EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM orgs WHERE CAST(id AS VARCHAR) LIKE :id_search LIMIT 10;
+EXPLAIN (ANALYZE, BUFFERS) SELECT count(*) FROM orgs WHERE bcol_account_id ILIKE :bcol_search;
+
+ROLLBACK;